@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+I-HNT CPU Tuner
+Measures YOLO latency for different torch intra-op/inter-op thread counts and
+optional core pinning, picks the configuration with the lowest p95 latency and
+caches it per host in cpu_tuning.json.
+
+Each candidate runs in a fresh process (torch only lets you set inter-op threads
+once per process) against a fixed, deterministic set of frames built from
+monsters_images/, so results are reproducible.
+
+    python cpu_tuner.py --model yolov8n.pt --frames monsters_images
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+CACHE_FILE = "cpu_tuning.json"
+DEFAULT_FRAME_SHAPE = (880, 1820)  # Game capture area at 1920x1080 with default margins
+
+
+# ------------------------------------------------------------------ pinning
+
+def cores_to_mask(cores):
+    """Convert a core list to an affinity bitmask"""
+    mask = 0
+    for core in cores:
+        mask |= 1 << core
+    return mask
+
+
+def pin_current_thread(cores):
+    """Pin the calling thread to the given cores, returns True on success"""
+    if not cores:
+        return False
+    try:
+        if hasattr(os, 'sched_setaffinity'):
+            os.sched_setaffinity(0, cores)  # Linux: pid 0 = calling thread
+            return True
+        if sys.platform == 'win32':
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadAffinityMask.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+            kernel32.SetThreadAffinityMask.restype = ctypes.c_size_t
+            return kernel32.SetThreadAffinityMask(kernel32.GetCurrentThread(), cores_to_mask(cores)) != 0
+    except Exception as e:
+        print(f"⚠️ Thread pinning failed: {e}")
+    return False
+
+
+def pin_process(cores, pid=None):
+    """Pin a whole process (default: this one) to the given cores"""
+    if not cores:
+        return False
+    try:
+        if hasattr(os, 'sched_setaffinity'):
+            os.sched_setaffinity(pid or 0, cores)  # New threads inherit this on Linux
+            return True
+        if sys.platform == 'win32':
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetProcessAffinityMask.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+            if pid is None:
+                handle = kernel32.GetCurrentProcess()
+            else:
+                handle = kernel32.OpenProcess(0x0200 | 0x0400, False, pid)  # SET_INFORMATION | QUERY_INFORMATION
+            return kernel32.SetProcessAffinityMask(handle, cores_to_mask(cores)) != 0
+    except Exception as e:
+        print(f"⚠️ Process pinning failed: {e}")
+    return False
+
+
+def apply_torch_threads(intra_op_threads, inter_op_threads):
+    """Apply torch thread counts (inter-op can only be set before any parallel work)"""
+    import torch
+    torch.set_num_threads(intra_op_threads)
+    try:
+        torch.set_num_interop_threads(inter_op_threads)
+    except RuntimeError:
+        pass  # Already initialized in this process - keep the existing inter-op pool
+
+
+# ------------------------------------------------------------------ planning
+
+def host_key(model_path):
+    """Cache key for this host and model"""
+    return f"{platform.node()}|{os.cpu_count()}cpu|{Path(model_path).name}"
+
+
+def core_layout(intra_op_threads, cpu_count):
+    """Assign cores: actuator on 0, capture on 1, inference on the next N cores"""
+    if cpu_count < intra_op_threads + 2:
+        return None
+    return {
+        'actuator_cores': [0],
+        'capture_cores': [1],
+        'inference_cores': list(range(2, 2 + intra_op_threads))
+    }
+
+
+def candidate_plans(cpu_count=None, quick=False):
+    """Thread/pinning configurations worth measuring on this machine"""
+    cpu_count = cpu_count or os.cpu_count() or 1
+    max_threads = max(1, cpu_count - 2)  # Leave room for capture and actuator threads
+    thread_counts = sorted({t for t in (1, 2, 4, 6, 8, max_threads // 2, max_threads) if 1 <= t <= max_threads})
+    if quick:
+        thread_counts = sorted({1, min(4, max_threads), max_threads})
+
+    plans = []
+    for intra in thread_counts:
+        for inter in ((1,) if quick else (1, 2)):
+            plans.append({'intra_op_threads': intra, 'inter_op_threads': inter, 'pin_threads': False})
+            layout = core_layout(intra, cpu_count)
+            if layout is not None:
+                plans.append({'intra_op_threads': intra, 'inter_op_threads': inter, 'pin_threads': True, **layout})
+    return plans
+
+
+def describe_plan(plan):
+    """Short human-readable plan label"""
+    label = f"intra={plan['intra_op_threads']} inter={plan['inter_op_threads']}"
+    if plan.get('pin_threads'):
+        label += f" pinned→{plan['inference_cores']}"
+    return label
+
+
+# ------------------------------------------------------------------ benchmark
+
+def load_benchmark_frames(frames_dir, frame_shape=DEFAULT_FRAME_SHAPE, count=8, sprites_per_frame=6):
+    """Build a deterministic set of game-sized frames from sprite images"""
+    paths = sorted(p for p in Path(frames_dir).iterdir() if p.suffix.lower() in ('.jpg', '.jpeg', '.png'))
+    images = (cv2.imread(str(p)) for p in paths[:count * sprites_per_frame])
+    sprites = [image for image in images if image is not None]  # BGR like the live capture; skip unreadable files
+    height, width = frame_shape
+    frames = []
+
+    for index in range(count):
+        frame = np.full((height, width, 3), 70 + index * 5, dtype=np.uint8)
+        for slot in range(sprites_per_frame):
+            if not sprites:
+                break
+            sprite = sprites[(index * sprites_per_frame + slot) % len(sprites)]
+            top = (slot // 3) * (height // 2) + 40
+            left = (slot % 3) * (width // 3) + 60
+            h, w = min(sprite.shape[0], height - top), min(sprite.shape[1], width - left)
+            frame[top:top + h, left:left + w] = sprite[:h, :w]
+        frames.append(frame)
+    return frames
+
+
+def benchmark_plan(model_path, frames_dir, frame_shape, plan, warmup=5, iterations=30):
+    """Measure per-frame latency for one plan (runs inside a fresh process)"""
+    if plan.get('pin_threads'):
+        pin_process(plan['inference_cores'])
+    apply_torch_threads(plan['intra_op_threads'], plan['inter_op_threads'])
+
+    from ultralytics import YOLO
+    model = YOLO(model_path)
+    frames = load_benchmark_frames(frames_dir, frame_shape)
+
+    for i in range(warmup):
+        model(frames[i % len(frames)], verbose=False)
+
+    latencies = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        model(frames[i % len(frames)], conf=0.25, verbose=False)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def run_tuning(model_path, frames_dir, frame_shape=DEFAULT_FRAME_SHAPE, quick=False, iterations=30):
+    """Benchmark every candidate plan and return the one with the lowest p95"""
+    plans = candidate_plans(quick=quick)
+    context = mp.get_context('spawn')
+    best_plan = None
+
+    print(f"🧪 CPU tuning: {len(plans)} configurations on {os.cpu_count()} logical cores")
+    for plan in plans:
+        try:
+            with context.Pool(1) as pool:
+                latencies = pool.apply(benchmark_plan, (model_path, frames_dir, frame_shape, plan),
+                                       {'iterations': iterations})
+        except Exception as e:
+            print(f"   ❌ {describe_plan(plan)}: {e}")
+            continue
+
+        plan['p50_ms'] = float(np.percentile(latencies, 50) * 1000)
+        plan['p95_ms'] = float(np.percentile(latencies, 95) * 1000)
+        print(f"   ⏱️ {describe_plan(plan):<32} p50 {plan['p50_ms']:6.1f}ms | p95 {plan['p95_ms']:6.1f}ms")
+
+        if best_plan is None or plan['p95_ms'] < best_plan['p95_ms']:
+            best_plan = plan
+
+    if best_plan is not None:
+        best_plan['tuned_at'] = datetime.now().isoformat(timespec='seconds')
+    return best_plan
+
+
+# ------------------------------------------------------------------ cache
+
+def load_cached_plan(model_path, cache_path=CACHE_FILE):
+    """Return the cached plan for this host/model, or None"""
+    try:
+        with open(cache_path) as f:
+            return json.load(f).get(host_key(model_path))
+    except (OSError, ValueError):
+        return None
+
+
+def save_plan(model_path, plan, cache_path=CACHE_FILE):
+    """Store a plan for this host/model in the cache file"""
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    cache[host_key(model_path)] = plan
+    with open(cache_path, 'w') as f:
+        json.dump(cache, f, indent=2)
+
+
+def get_cpu_plan(model_path, frames_dir="monsters_images", cache_path=CACHE_FILE, force=False, quick=False):
+    """Cached plan for this host, benchmarking first if there is none"""
+    if not force:
+        plan = load_cached_plan(model_path, cache_path)
+        if plan is not None:
+            return plan
+
+    plan = run_tuning(model_path, frames_dir, quick=quick)
+    if plan is not None:
+        save_plan(model_path, plan, cache_path)
+    return plan
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find the fastest CPU thread/pinning setup for I-HNT")
+    parser.add_argument('--model', default='yolov8n.pt', help="YOLO model to benchmark")
+    parser.add_argument('--frames', default='monsters_images', help="Folder of images used as benchmark frames")
+    parser.add_argument('--cache', default=CACHE_FILE, help="Per-host tuning cache file")
+    parser.add_argument('--quick', action='store_true', help="Try fewer configurations")
+    parser.add_argument('--force', action='store_true', help="Re-run even if this host is already cached")
+    args = parser.parse_args()
+
+    print("🧪 I-HNT CPU Tuner")
+    print("=" * 50)
+    start_time = time.time()
+    plan = get_cpu_plan(args.model, args.frames, args.cache, force=args.force, quick=args.quick)
+
+    if plan is None:
+        print("❌ No configuration could be benchmarked")
+        return
+    print("=" * 50)
+    print(f"✅ Best: {describe_plan(plan)} - p95 {plan['p95_ms']:.1f}ms (tuned {plan.get('tuned_at')})")
+    print(f"   💾 Cached for {host_key(args.model)} in {args.cache} ({time.time() - start_time:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+I-HNT Dataset Builder
+Turns folders of game screenshots and mob sprites into a YOLO training set.
+
+    python dataset_builder.py --images monsters_images screenshots --backgrounds gate_backgrounds
+    python dataset_builder.py --images screenshots --model best.pt      # Auto-label with the current model
+    yolo train data=dataset/data.yaml model=yolov8n.pt epochs=100
+
+Every stage runs in a process pool:
+
+    1. Decode each image, compute a 64-bit perceptual hash (DCT pHash) and
+       label it. Sprites (white-background crops like monsters_images/) are
+       labeled from their silhouette. Screenshots are labeled with the
+       current model and triaged by confidence: all boxes confident ->
+       accepted, any borderline box -> review/, no boxes -> background.
+    2. Drop near-duplicates (pHash Hamming distance).
+    3. Write images + YOLO label files with augmented copies (flip,
+       brightness/contrast, scale). Sprites are pasted onto background
+       screenshots when --backgrounds is given. The train/val split is taken
+       from the hash, so an image keeps its split when the folder grows.
+
+Per-image results are cached in <output>/cache.json (keyed by path, size and
+modification time), so rerunning on a grown folder only decodes and labels
+the new files, and existing output images are not rewritten.
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+CACHE_FILE = "cache.json"
+SPRITE_WHITE = 235        # Sprite background pixels are at least this bright in every channel
+SPRITE_MAX_SIZE = 320     # Images up to this size with a white border are treated as sprites
+
+_worker = {}              # Per-process state: YOLO model, background images
+
+
+# ------------------------------------------------------------------ per-image analysis
+
+def perceptual_hash(image):
+    """64-bit DCT perceptual hash of a BGR image"""
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+    small = cv2.resize(gray, (32, 32), interpolation=cv2.INTER_AREA).astype(np.float32)
+    low = cv2.dct(small)[:8, :8].ravel()
+    bits = low > np.median(low[1:])
+    return int(sum(1 << i for i, bit in enumerate(bits) if bit))
+
+
+def hamming(a, b):
+    return bin(a ^ b).count('1')
+
+
+def is_sprite(image):
+    """Small image with a largely white border (a cut-out mob sprite, not a screenshot)"""
+    height, width = image.shape[:2]
+    if max(height, width) > SPRITE_MAX_SIZE:
+        return False
+    border = np.concatenate([image[0], image[-1], image[:, 0], image[:, -1]])
+    return float(np.mean(border.min(axis=1) >= SPRITE_WHITE)) > 0.25  # Large sprites touch the edges
+
+
+def sprite_box(image):
+    """Tight [x1, y1, x2, y2] box around a sprite's non-white pixels"""
+    mask = image.min(axis=2) < SPRITE_WHITE
+    mask = cv2.morphologyEx(mask.astype(np.uint8), cv2.MORPH_OPEN, np.ones((3, 3), np.uint8))
+    ys, xs = np.nonzero(mask)
+    if len(xs) == 0:
+        return None
+    return [int(xs.min()), int(ys.min()), int(xs.max()) + 1, int(ys.max()) + 1]
+
+
+def init_worker(model_path, use_gpu, background_paths):
+    """Process pool initializer - load the labeling model once per worker"""
+    _worker['backgrounds'] = background_paths
+    _worker['background_cache'] = {}
+    _worker['model'] = None
+    if model_path:
+        from ultralytics import YOLO
+        model = YOLO(model_path)
+        if use_gpu:
+            model.to('cuda')
+        _worker['model'] = model
+
+
+def analyse_image(job):
+    """Decode, hash and label one image → cache record (runs in a worker)"""
+    path, key, review_conf, accept_conf, sprite_class = job
+    image = cv2.imread(path)
+    if image is None:
+        return {'key': key, 'path': path, 'error': 'unreadable'}
+
+    record = {
+        'key': key,
+        'path': path,
+        'hash': f"{perceptual_hash(image):016x}",
+        'width': image.shape[1],
+        'height': image.shape[0],
+        'boxes': [],
+    }
+    if is_sprite(image):
+        box = sprite_box(image)
+        record['kind'] = 'sprite'
+        record['boxes'] = [[sprite_class, *box, 1.0]] if box else []
+        record['triage'] = 'accept' if box else 'background'
+        return record
+
+    record['kind'] = 'screenshot'
+    model = _worker.get('model')
+    if model is None:
+        record['triage'] = 'unlabeled'
+        return record
+
+    results = model(image, conf=review_conf, verbose=False)  # BGR, as ultralytics expects numpy input
+    rows = results[0].boxes.data.cpu().numpy() if results and results[0].boxes is not None else np.empty((0, 6))
+    record['boxes'] = [[int(c), *(round(float(v), 1) for v in (x1, y1, x2, y2)), round(float(conf), 3)]
+                       for x1, y1, x2, y2, conf, c in rows[:, :6]]
+    if not record['boxes']:
+        record['triage'] = 'background'
+    elif min(box[5] for box in record['boxes']) >= accept_conf:
+        record['triage'] = 'accept'
+    else:
+        record['triage'] = 'review'  # Borderline boxes - a human should check these labels
+    return record
+
+
+def deduplicate(records, max_distance):
+    """Keep the largest image of every near-duplicate group, returns (kept, duplicate count)"""
+    kept, kept_hashes = [], []
+    for record in sorted(records, key=lambda r: (-r['width'] * r['height'], r['path'])):
+        value = int(record['hash'], 16)
+        if any(hamming(value, other) <= max_distance for other in kept_hashes):
+            continue
+        kept.append(record)
+        kept_hashes.append(value)
+    return kept, len(records) - len(kept)
+
+
+def split_of(record, val_fraction):
+    """Stable train/val assignment from the image hash"""
+    return 'val' if int(record['hash'][-4:], 16) % 1000 < val_fraction * 1000 else 'train'
+
+
+# ------------------------------------------------------------------ augmentation + writing
+
+def augment(image, boxes, rng):
+    """Random flip, brightness/contrast and scale jitter; boxes follow the image"""
+    height, width = image.shape[:2]
+    boxes = [list(box) for box in boxes]
+    if rng.random() < 0.5:
+        image = image[:, ::-1]
+        for box in boxes:
+            box[1], box[3] = width - box[3], width - box[1]
+
+    contrast = rng.uniform(0.75, 1.25)
+    brightness = rng.uniform(-25, 25)
+    image = cv2.convertScaleAbs(image, alpha=contrast, beta=brightness)
+
+    scale = rng.uniform(0.8, 1.2)
+    image = cv2.resize(image, (max(1, int(width * scale)), max(1, int(height * scale))), interpolation=cv2.INTER_LINEAR)
+    for box in boxes:
+        box[1:5] = [value * scale for value in box[1:5]]
+    return image, boxes
+
+
+def background_crop(rng, size):
+    """Random crop of a background screenshot (cached per worker), or a noisy ground texture"""
+    paths = _worker.get('backgrounds') or []
+    if paths:
+        path = paths[int(rng.integers(len(paths)))]
+        cache = _worker['background_cache']
+        if path not in cache:
+            cache[path] = cv2.imread(path)
+        background = cache[path]
+        if background is not None and min(background.shape[:2]) >= size:
+            top = int(rng.integers(background.shape[0] - size + 1))
+            left = int(rng.integers(background.shape[1] - size + 1))
+            return background[top:top + size, left:left + size].copy()
+    base = rng.integers(40, 140, size=3)
+    noise = rng.normal(0, 12, size=(size, size, 3))
+    return np.clip(base + cv2.GaussianBlur(noise, (0, 0), 3), 0, 255).astype(np.uint8)
+
+
+def paste_sprite(sprite, box, rng, scene_size):
+    """Paste a white-background sprite onto a background scene, returns (scene, boxes)"""
+    scene = background_crop(rng, scene_size)
+    target = int(rng.uniform(0.15, 0.35) * scene_size)
+    scale = target / max(sprite.shape[:2])
+    sprite = cv2.resize(sprite, (max(1, int(sprite.shape[1] * scale)), max(1, int(sprite.shape[0] * scale))),
+                        interpolation=cv2.INTER_AREA)
+    alpha = (sprite.min(axis=2) < SPRITE_WHITE).astype(np.float32)
+    alpha = cv2.GaussianBlur(alpha, (3, 3), 0)[..., None]
+    height, width = sprite.shape[:2]
+    top = int(rng.integers(scene_size - height + 1))
+    left = int(rng.integers(scene_size - width + 1))
+    region = scene[top:top + height, left:left + width].astype(np.float32)
+    scene[top:top + height, left:left + width] = (alpha * sprite + (1 - alpha) * region).astype(np.uint8)
+    class_id, x1, y1, x2, y2, conf = box
+    return scene, [[class_id, left + x1 * scale, top + y1 * scale, left + x2 * scale, top + y2 * scale, conf]]
+
+
+def yolo_lines(boxes, width, height):
+    """YOLO label lines (class cx cy w h, normalised) for pixel boxes"""
+    lines = []
+    for class_id, x1, y1, x2, y2, _ in boxes:
+        x1, x2 = max(0.0, x1), min(float(width), x2)
+        y1, y2 = max(0.0, y1), min(float(height), y2)
+        if x2 - x1 < 2 or y2 - y1 < 2:
+            continue
+        lines.append(f"{int(class_id)} {(x1 + x2) / 2 / width:.6f} {(y1 + y2) / 2 / height:.6f} "
+                     f"{(x2 - x1) / width:.6f} {(y2 - y1) / height:.6f}")
+    return lines
+
+
+def write_record(task):
+    """Write one image's dataset samples (original/scene + augmented copies), skipping existing files"""
+    record, output, split, copies, scene_size = task
+    image_dir = Path(output) / 'images' / split
+    label_dir = Path(output) / 'labels' / split
+    if all((image_dir / f"{record['hash']}_{n}.jpg").exists() for n in range(copies + 1)):
+        return 0
+    image = cv2.imread(record['path'])
+    if image is None:
+        return 0
+
+    rng = np.random.default_rng(int(record['hash'], 16) & 0xFFFFFFFF)  # Same copies on every rerun
+    written = 0
+    for n in range(copies + 1):
+        image_path = image_dir / f"{record['hash']}_{n}.jpg"
+        if image_path.exists():
+            continue
+        if record['kind'] == 'sprite' and record['boxes']:
+            sample, boxes = paste_sprite(image, record['boxes'][0], rng, scene_size)
+        else:
+            sample, boxes = image, record['boxes']
+        if n > 0:
+            sample, boxes = augment(sample, boxes, rng)
+        cv2.imwrite(str(image_path), sample)
+        (label_dir / f"{record['hash']}_{n}.txt").write_text(
+            "\n".join(yolo_lines(boxes, sample.shape[1], sample.shape[0])) + "\n")
+        written += 1
+    return written
+
+
+# ------------------------------------------------------------------ driver
+
+def scan_images(folders):
+    """(path, cache key) for every image in the input folders"""
+    jobs = []
+    for folder in folders:
+        for path in sorted(Path(folder).rglob('*')):
+            if path.suffix.lower() in IMAGE_EXTENSIONS:
+                stat = path.stat()
+                jobs.append((str(path), f"{path}|{stat.st_size}|{int(stat.st_mtime)}"))
+    return jobs
+
+
+def build_dataset(image_folders, output="dataset", model_path=None, background_folder=None, workers=None,
+                  review_conf=0.25, accept_conf=0.6, val_fraction=0.2, copies=3, dedupe_distance=6,
+                  scene_size=640, class_names=("mob",), sprite_class=0, use_gpu=False):
+    """Run the whole pipeline, returns a summary dict"""
+    start = time.time()
+    output = Path(output)
+    for split in ('train', 'val'):
+        (output / 'images' / split).mkdir(parents=True, exist_ok=True)
+        (output / 'labels' / split).mkdir(parents=True, exist_ok=True)
+    (output / 'review').mkdir(exist_ok=True)
+
+    cache_path = output / CACHE_FILE
+    cache = json.loads(cache_path.read_text()) if cache_path.exists() else {}
+    labeler = f"model:{model_path}|{Path(model_path).stat().st_mtime if Path(model_path).exists() else 0}" \
+        if model_path else "none"
+
+    jobs = scan_images(image_folders)
+    records, todo = [], []
+    for path, key in jobs:
+        cached = cache.get(key)
+        # Screenshots are re-labeled when the labeling model changed; sprites never need it
+        if cached and (cached.get('kind') == 'sprite' or cached.get('labeler') == labeler):
+            records.append(cached)
+        else:
+            todo.append((path, key, review_conf, accept_conf, sprite_class))
+
+    background_paths = [str(path) for path, _ in scan_images([background_folder])] if background_folder else []
+    workers = workers or max(1, (os.cpu_count() or 2) - 1)
+    print(f"🗂️ {len(jobs)} images ({len(records)} cached, {len(todo)} to analyse) with {workers} workers")
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(model_path if todo else None, use_gpu, background_paths)) as pool:
+        for record in pool.map(analyse_image, todo, chunksize=4):
+            if 'error' in record:
+                print(f"⚠️ Skipping {record['path']}: {record['error']}")
+                continue
+            record['labeler'] = labeler
+            cache[record['key']] = record
+            records.append(record)
+        cache_path.write_text(json.dumps(cache))
+
+        kept, duplicates = deduplicate(records, dedupe_distance)
+        tasks, review, counts = [], [], {}
+        for record in kept:
+            counts[record['triage']] = counts.get(record['triage'], 0) + 1
+            if record['triage'] in ('accept', 'background'):
+                tasks.append((record, str(output), split_of(record, val_fraction), copies, scene_size))
+            elif record['triage'] == 'review':
+                review.append(record)
+        written = sum(pool.map(write_record, tasks, chunksize=4))
+
+    # Borderline auto-labels go to review/ with their proposed boxes for a human to fix or approve
+    for record in review:
+        target = output / 'review' / f"{record['hash']}{Path(record['path']).suffix}"
+        if not target.exists():
+            image = cv2.imread(record['path'])
+            cv2.imwrite(str(target), image)
+            target.with_suffix('.txt').write_text(
+                "\n".join(yolo_lines(record['boxes'], record['width'], record['height'])) + "\n")
+
+    (output / 'data.yaml').write_text(
+        f"path: {output.resolve()}\ntrain: images/train\nval: images/val\n"
+        f"names:\n" + "".join(f"  {index}: {name}\n" for index, name in enumerate(class_names)))
+
+    summary = {
+        'images': len(jobs),
+        'analysed': len(todo),
+        'duplicates': duplicates,
+        'triage': counts,
+        'samples_written': written,
+        'seconds': time.time() - start,
+    }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a YOLO dataset from screenshots and mob sprites")
+    parser.add_argument('--images', nargs='+', default=['monsters_images'], help="Input image folders")
+    parser.add_argument('--output', default='dataset', help="Dataset folder (data.yaml, images/, labels/)")
+    parser.add_argument('--model', help="Model used to auto-label screenshots (e.g. your current best.pt)")
+    parser.add_argument('--backgrounds', help="Empty-area screenshots to paste sprites onto (e.g. gate_backgrounds)")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: CPU count - 1)")
+    parser.add_argument('--review-conf', type=float, default=0.25, help="Lowest confidence kept as a label")
+    parser.add_argument('--accept-conf', type=float, default=0.6, help="Images with every box above this are accepted")
+    parser.add_argument('--val', type=float, default=0.2, help="Validation share")
+    parser.add_argument('--copies', type=int, default=3, help="Augmented copies per image")
+    parser.add_argument('--dedupe', type=int, default=6, help="Max pHash Hamming distance for duplicates")
+    parser.add_argument('--names', nargs='+', default=['mob'], help="Class names for data.yaml")
+    parser.add_argument('--gpu', action='store_true', help="Auto-label on the GPU")
+    args = parser.parse_args()
+
+    print("🗂️ I-HNT Dataset Builder")
+    print("=" * 50)
+    summary = build_dataset(args.images, args.output, args.model, args.backgrounds, args.workers,
+                            args.review_conf, args.accept_conf, args.val, args.copies, args.dedupe,
+                            class_names=args.names, use_gpu=args.gpu)
+    triage = ", ".join(f"{name} {count}" for name, count in sorted(summary['triage'].items()))
+    print(f"✅ {summary['images']} images ({summary['analysed']} analysed, {summary['duplicates']} duplicates "
+          f"dropped) → {summary['samples_written']} new samples in {summary['seconds']:.1f}s")
+    print(f"   Triage: {triage}")
+    if summary['triage'].get('review'):
+        print(f"   👀 Check the borderline labels in {Path(args.output) / 'review'} and move them into images/labels")
+    if summary['triage'].get('unlabeled'):
+        print("   💡 Screenshots without --model are not labeled - pass --model to auto-label them")
+    print(f"   Train with: yolo train data={Path(args.output) / 'data.yaml'} model=yolov8n.pt epochs=100")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+I-HNT Death Dialog Locator
+Finds the death confirmation dialog by its two buttons instead of guessing
+from dark/bright pixel ratios, and returns where the buttons actually are.
+
+The button templates are captured once from the real game:
+
+    python death_dialog_locator.py --capture                  # dialog on screen, 3s countdown
+    python death_dialog_locator.py --capture --image shot.png # from a saved screenshot
+    python death_dialog_locator.py --test                     # locate + timing on the live screen
+
+Capture crops both buttons at the offsets I-HNT used to click blindly
+(center ± 150, center + 200); check the saved images before hunting.
+
+Matching runs on a small grayscale ROI around the button row. Both the
+template and ROI pyramids are downscaled (the templates once, the ROI into
+reused buffers): the whole half-ROI is searched at the coarsest level, and
+each finer level only re-matches a few pixels around the previous hit. The
+resurrect button is searched in the left half and the wait-for-help button
+in the right half, so look-alike buttons can't be swapped.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+BUTTONS = {
+    # name: (label, x offset from the screen center) - the layout handle_death_confirmation clicked before
+    'resurrect': ("Resurrect at the specified point", -150),
+    'wait_help': ("Waiting for other player's help", 150),
+}
+BUTTON_Y_OFFSET = 200          # Button row below the screen center
+TEMPLATE_SIZE = (220, 50)      # Crop around each button when capturing
+
+
+def match_in(image, template, window=None):
+    """Best normalized match (score, x, y) of template in image, optionally inside an x1, y1, x2, y2 window"""
+    x0 = y0 = 0
+    if window is not None:
+        x1, y1, x2, y2 = window
+        x0, y0 = max(0, int(x1)), max(0, int(y1))
+        image = image[y0:max(y0, int(y2)), x0:max(x0, int(x2))]
+    if image.shape[0] < template.shape[0] or image.shape[1] < template.shape[1]:
+        return -1.0, 0, 0
+    result = cv2.matchTemplate(image, template, cv2.TM_CCOEFF_NORMED)
+    _, score, _, (x, y) = cv2.minMaxLoc(result)
+    return float(score), x + x0, y + y0
+
+
+class DeathDialogLocator:
+    """Coarse-to-fine template matching of the death dialog buttons on a small screen ROI"""
+
+    def __init__(self, template_dir="templates", screen_size=(1920, 1080), scales=(4, 2, 1),
+                 min_score=0.8, row_tolerance=12):
+        self.template_dir = Path(template_dir)
+        self.screen_width, self.screen_height = screen_size
+        self.scales = scales                  # Pyramid levels, coarsest first (1 = full resolution)
+        self.min_score = min_score
+        self.row_tolerance = row_tolerance    # Both buttons must sit on the same row (pixels)
+
+        center_x, center_y = self.screen_width // 2, self.screen_height // 2
+        self.search_area = {                  # Screen region around the button row
+            'left': center_x - 480,
+            'top': center_y + BUTTON_Y_OFFSET - 160,
+            'width': 960,
+            'height': 320,
+        }
+        self.templates = {}                   # name → {scale: grayscale template}
+        self.pyramid = {}                     # scale → reused downscaled ROI buffer
+        self.gray = None
+        self.last = None                      # Result of the latest locate()
+
+        # Statistics
+        self.found = 0
+        self.missed = 0
+        self.seconds = 0.0
+        self.load_templates()
+
+    @property
+    def ready(self):
+        return len(self.templates) == len(BUTTONS)
+
+    def template_path(self, name):
+        return self.template_dir / f"death_{name}.png"
+
+    def load_templates(self):
+        """Load the button templates and cache their downscaled pyramids"""
+        self.templates = {}
+        for name in BUTTONS:
+            path = self.template_path(name)
+            image = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE) if path.exists() else None
+            if image is None:
+                continue
+            self.templates[name] = {
+                scale: image if scale == 1 else cv2.resize(
+                    image, (image.shape[1] // scale, image.shape[0] // scale), interpolation=cv2.INTER_AREA)
+                for scale in self.scales
+            }
+        return self.ready
+
+    def build_pyramid(self, bgra):
+        """Grayscale ROI plus its downscaled levels, written into reused buffers"""
+        conversion = cv2.COLOR_BGRA2GRAY if bgra.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+        if self.gray is None or self.gray.shape != bgra.shape[:2]:
+            self.gray = np.empty(bgra.shape[:2], dtype=np.uint8)
+            self.pyramid = {}
+        cv2.cvtColor(bgra, conversion, dst=self.gray)
+        height, width = self.gray.shape
+        for scale in self.scales:
+            if scale == 1:
+                self.pyramid[1] = self.gray
+                continue
+            if scale not in self.pyramid:
+                self.pyramid[scale] = np.empty((height // scale, width // scale), dtype=np.uint8)
+            cv2.resize(self.gray, (width // scale, height // scale), dst=self.pyramid[scale],
+                       interpolation=cv2.INTER_AREA)
+
+    def match_button(self, name, half):
+        """Coarse-to-fine search of one button in its half of the ROI → (score, x, y) at full resolution"""
+        width = self.gray.shape[1]
+        overlap = TEMPLATE_SIZE[0] // 2
+        x1, x2 = (0, width // 2 + overlap) if half == 'left' else (width // 2 - overlap, width)
+        coarsest = self.scales[0]
+        score, x, y = match_in(self.pyramid[coarsest], self.templates[name][coarsest],
+                               (x1 // coarsest, 0, x2 // coarsest, self.gray.shape[0] // coarsest))
+        if score < self.min_score - 0.2:
+            return score, x * coarsest, y * coarsest  # Nothing close - don't bother refining
+        previous = coarsest
+        for scale in self.scales[1:]:
+            template = self.templates[name][scale]
+            ratio = previous // scale
+            margin = 2 * ratio + 1
+            x, y = x * ratio, y * ratio
+            window = (x - margin, y - margin, x + template.shape[1] + margin, y + template.shape[0] + margin)
+            score, x, y = match_in(self.pyramid[scale], template, window)
+            previous = scale
+        return score, x * previous, y * previous
+
+    def locate(self, bgra, origin=None):
+        """Find both buttons in a capture of search_area → {'found', 'buttons': {name: (x, y, score)}, 'ms'}"""
+        start = time.perf_counter()
+        origin = origin or (self.search_area['left'], self.search_area['top'])
+        self.build_pyramid(bgra)
+        buttons = {}
+        for name, (_, offset) in BUTTONS.items():
+            score, x, y = self.match_button(name, 'left' if offset < 0 else 'right')
+            template = self.templates[name][1]
+            buttons[name] = (origin[0] + x + template.shape[1] // 2, origin[1] + y + template.shape[0] // 2, score)
+
+        rows = [y for _, y, _ in buttons.values()]
+        found = (all(score >= self.min_score for _, _, score in buttons.values())
+                 and max(rows) - min(rows) <= self.row_tolerance)
+        elapsed = time.perf_counter() - start
+        self.seconds += elapsed
+        if found:
+            self.found += 1
+        else:
+            self.missed += 1
+        self.last = {'found': found, 'buttons': buttons, 'ms': elapsed * 1000}
+        return self.last
+
+    def button_position(self, name):
+        """Screen position of a button from the latest successful locate(), else None"""
+        if self.last is None or not self.last['found']:
+            return None
+        x, y, _ = self.last['buttons'][name]
+        return x, y
+
+    def default_position(self, name):
+        """The fixed layout offset (what I-HNT clicked before templates existed)"""
+        return self.screen_width // 2 + BUTTONS[name][1], self.screen_height // 2 + BUTTON_Y_OFFSET
+
+    def capture_templates(self, screen_bgra):
+        """Crop both buttons at the fixed layout offsets from a full-screen capture and save them"""
+        self.template_dir.mkdir(parents=True, exist_ok=True)
+        width, height = TEMPLATE_SIZE
+        conversion = cv2.COLOR_BGRA2BGR if screen_bgra.shape[2] == 4 else None
+        for name in BUTTONS:
+            x, y = self.default_position(name)
+            crop = screen_bgra[y - height // 2:y + height // 2, x - width // 2:x + width // 2]
+            if conversion is not None:
+                crop = cv2.cvtColor(crop, conversion)
+            cv2.imwrite(str(self.template_path(name)), crop)
+            print(f"   💾 {BUTTONS[name][0]} → {self.template_path(name)}")
+        return self.load_templates()
+
+    def stats_summary(self):
+        """One-line locator report for the stats output"""
+        calls = self.found + self.missed
+        average = self.seconds / calls * 1000 if calls else 0.0
+        return f"💀 Death dialog locator: {self.found} found, {self.missed} clear | {average:.2f}ms/check"
+
+
+def grab_screen(area=None):
+    import mss
+    with mss.mss() as sct:
+        return np.array(sct.grab(area or sct.monitors[1]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Capture and test the death dialog button templates")
+    parser.add_argument('--capture', action='store_true', help="Save button templates from the dialog on screen")
+    parser.add_argument('--test', action='store_true', help="Locate the buttons and report timing")
+    parser.add_argument('--image', help="Use a saved full-screen screenshot instead of the live screen")
+    parser.add_argument('--templates', default="templates", help="Template folder")
+    parser.add_argument('--screen', nargs=2, type=int, default=[1920, 1080], help="Screen width and height")
+    args = parser.parse_args()
+
+    locator = DeathDialogLocator(args.templates, tuple(args.screen))
+    if args.image:
+        screen = cv2.imread(args.image)
+        if screen is None:
+            print(f"❌ Cannot read {args.image}")
+            return
+    else:
+        print("⏳ Show the death dialog - capturing in 3 seconds...")
+        time.sleep(3)
+        screen = grab_screen()
+
+    if args.capture:
+        print("📸 Capturing death dialog button templates")
+        if locator.capture_templates(screen):
+            print("✅ Templates saved - check the images, then run with --test")
+
+    if args.test or not args.capture:
+        if not locator.ready:
+            print(f"❌ No templates in {args.templates} - run with --capture first")
+            return
+        area = locator.search_area
+        roi = np.ascontiguousarray(screen[area['top']:area['top'] + area['height'],
+                                          area['left']:area['left'] + area['width']])
+        for _ in range(5):
+            result = locator.locate(roi)
+        for name, (x, y, score) in result['buttons'].items():
+            print(f"   {BUTTONS[name][0]}: ({x}, {y}) score {score:.2f}")
+        print(f"{'✅ Dialog found' if result['found'] else '❌ Dialog not found'} in {result['ms']:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+I-HNT Exploration Planner
+Chooses where to walk and which way to turn the camera when the hunting zone
+is empty, based on where mobs were actually seen instead of a fixed sweep.
+
+Two decaying heatmaps are kept:
+
+    screen heat   Coarse grid of recent detections in screen space (including
+                  mobs outside the hunting zone). Shifted when the character
+                  walks so it keeps pointing at the same spots.
+    world heat    Detections by world bearing - the screen bearing corrected
+                  for every camera turn since the session started - so
+                  "mobs are north-east" survives camera adjustments.
+
+Sectors the character walked into without finding anything, or just cleared,
+get a decaying "emptied" penalty; sectors visited recently get a smaller one
+so that with no information the planner still sweeps all directions.
+"""
+
+import math
+
+import cv2
+import numpy as np
+
+
+class ExplorationPlanner:
+    """Decaying mob-density heatmaps that pick movement and camera directions"""
+
+    def __init__(self, screen_size=(1920, 1080), cell_size=120, sectors=16, screen_half_life=20.0,
+                 world_half_life=120.0, empty_half_life=60.0, camera_degrees_per_drag=30.0, edge_margin=150):
+        self.screen_width, self.screen_height = screen_size
+        self.center = (self.screen_width // 2, self.screen_height // 2)
+        self.cell_size = cell_size
+        self.sectors = sectors
+        self.sector_width = 2 * math.pi / sectors
+        self.screen_half_life = screen_half_life  # Seconds until a screen detection counts half
+        self.world_half_life = world_half_life    # Seconds until a world-bearing detection counts half
+        self.empty_half_life = empty_half_life    # Seconds until an emptied-sector penalty halves
+        self.camera_step = math.radians(camera_degrees_per_drag)  # View rotation per camera drag
+        self.edge_margin = edge_margin
+
+        # Score weights
+        self.world_weight = 0.5
+        self.empty_weight = 2.0
+        self.visit_weight = 0.3
+
+        grid_width = math.ceil(self.screen_width / cell_size)
+        grid_height = math.ceil(self.screen_height / cell_size)
+        self.screen_heat = np.zeros((grid_height, grid_width), dtype=np.float32)
+        self.world_heat = np.zeros(sectors, dtype=np.float32)
+        self.emptied = np.zeros(sectors, dtype=np.float32)
+        self.visited = np.zeros(sectors, dtype=np.float32)
+        self.last_decay = None
+
+        # Candidate screen headings and how strongly each grid cell supports them
+        self.headings = np.arange(sectors) * self.sector_width
+        cell_x = (np.arange(grid_width) + 0.5) * cell_size - self.center[0]
+        cell_y = (np.arange(grid_height) + 0.5) * cell_size - self.center[1]
+        cell_angle = np.arctan2(cell_y[:, None], cell_x[None, :]).ravel()
+        alignment = np.cos(cell_angle[None, :] - self.headings[:, None])
+        self.heading_weights = (np.clip(alignment, 0, None) ** 4).astype(np.float32)
+
+        self.view_rotation = 0.0      # Accumulated camera rotation since start (radians)
+        self.last_heading = -math.pi / 4  # First sweep direction becomes 0°
+        self.pending_sector = None    # World sector of the last exploration move
+        self.zone_sector = None       # World sector of the last mobs seen in the hunting zone
+        self.zone_had_mobs = False
+
+        # Statistics
+        self.moves_planned = 0
+        self.guided_moves = 0
+        self.camera_turns = 0
+        self.idle_since = None
+        self.idle_periods = 0
+        self.idle_total = 0.0
+
+    # ------------------------------------------------------------ bookkeeping
+
+    def decay(self, now):
+        """Fade all heatmaps according to the time since the last update"""
+        if self.last_decay is not None and now > self.last_decay:
+            dt = now - self.last_decay
+            self.screen_heat *= 0.5 ** (dt / self.screen_half_life)
+            self.world_heat *= 0.5 ** (dt / self.world_half_life)
+            self.emptied *= 0.5 ** (dt / self.empty_half_life)
+            self.visited *= 0.5 ** (dt / self.empty_half_life)
+        self.last_decay = now
+
+    def world_sector(self, screen_angle):
+        """World sector index for a bearing measured on screen"""
+        world_angle = (screen_angle - self.view_rotation) % (2 * math.pi)
+        return int(world_angle / self.sector_width + 0.5) % self.sectors
+
+    def record_detections(self, positions, zone_positions, now):
+        """Add this frame's detections (screen positions) to the heatmaps"""
+        self.decay(now)
+        char_x, char_y = self.center
+
+        for x, y in positions:
+            row = min(max(int(y // self.cell_size), 0), self.screen_heat.shape[0] - 1)
+            col = min(max(int(x // self.cell_size), 0), self.screen_heat.shape[1] - 1)
+            self.screen_heat[row, col] += 1.0
+            if (x, y) != (char_x, char_y):
+                self.world_heat[self.world_sector(math.atan2(y - char_y, x - char_x))] += 1.0
+
+        if zone_positions:
+            # Remember where the mobs we are about to clear are standing
+            mean_x = sum(x for x, _ in zone_positions) / len(zone_positions)
+            mean_y = sum(y for _, y in zone_positions) / len(zone_positions)
+            self.zone_sector = self.world_sector(math.atan2(mean_y - char_y, mean_x - char_x))
+
+    def record_zone_status(self, mobs_in_zone, now):
+        """Track idle periods and mark sectors we just cleared as emptied"""
+        self.decay(now)
+        if mobs_in_zone:
+            if self.idle_since is not None:
+                self.idle_total += now - self.idle_since
+                self.idle_periods += 1
+                self.idle_since = None
+            self.pending_sector = None  # The last move found mobs
+        elif self.idle_since is None:
+            self.idle_since = now
+            if self.zone_had_mobs and self.zone_sector is not None:
+                self.emptied[self.zone_sector] += 1.0
+        self.zone_had_mobs = mobs_in_zone
+
+    # ------------------------------------------------------------ planning
+
+    def heading_scores(self):
+        """Expected mob density for each candidate screen heading"""
+        screen_scores = self.heading_weights @ self.screen_heat.ravel()
+        world_index = np.array([self.world_sector(angle) for angle in self.headings])
+        return (screen_scores
+                + self.world_weight * self.world_heat[world_index]
+                - self.empty_weight * self.emptied[world_index]
+                - self.visit_weight * self.visited[world_index])
+
+    def choose_move(self, now, min_distance=400):
+        """Pick the screen position to walk to, returns ((x, y), heading_degrees, distance, guided)"""
+        self.decay(now)
+        if self.pending_sector is not None:
+            # The previous move found nothing - that direction is empty for now
+            self.emptied[self.pending_sector] += 1.0
+
+        scores = self.heading_scores()
+        guided = float(self.screen_heat.sum() + self.world_heat.sum()) > 0.5 and scores.max() > 0
+
+        # Ties (no information) continue the sweep 45° on from the last heading
+        sweep_start = int(round(self.last_heading / self.sector_width)) + max(1, self.sectors // 8)
+        order = (np.arange(self.sectors) + sweep_start) % self.sectors
+        best = order[np.argmax(scores[order])]
+        heading = float(self.headings[best])
+
+        move_x, move_y = self.edge_point(heading)
+        distance = math.hypot(move_x - self.center[0], move_y - self.center[1])
+        if distance < min_distance:
+            # Heading hits the close top/bottom edge - slide sideways to keep the step long enough
+            offset_y = move_y - self.center[1]
+            offset_x = math.sqrt(max(min_distance ** 2 - offset_y ** 2, 0.0))
+            side = 1 if math.cos(heading) >= 0 else -1
+            move_x = int(self.center[0] + side * offset_x)
+            move_x = max(self.edge_margin, min(move_x, self.screen_width - self.edge_margin))
+            distance = math.hypot(move_x - self.center[0], offset_y)
+
+        self.last_heading = heading
+        self.pending_sector = self.world_sector(heading)
+        self.visited[self.pending_sector] += 1.0
+        self.moves_planned += 1
+        self.guided_moves += int(guided)
+        return (move_x, move_y), math.degrees(heading), distance, guided
+
+    def edge_point(self, heading):
+        """Farthest point inside the screen margins along a heading from the character"""
+        dx, dy = math.cos(heading), math.sin(heading)
+        limits = []
+        if dx > 1e-6:
+            limits.append((self.screen_width - self.edge_margin - self.center[0]) / dx)
+        elif dx < -1e-6:
+            limits.append((self.edge_margin - self.center[0]) / dx)
+        if dy > 1e-6:
+            limits.append((self.screen_height - self.edge_margin - self.center[1]) / dy)
+        elif dy < -1e-6:
+            limits.append((self.edge_margin - self.center[1]) / dy)
+        reach = min(limits)
+        return int(self.center[0] + dx * reach), int(self.center[1] + dy * reach)
+
+    def record_move(self, move_position):
+        """Shift the screen heatmap after walking so it keeps matching the world"""
+        shift_x = (self.center[0] - move_position[0]) / self.cell_size
+        shift_y = (self.center[1] - move_position[1]) / self.cell_size
+        matrix = np.float32([[1, 0, shift_x], [0, 1, shift_y]])
+        height, width = self.screen_heat.shape
+        self.screen_heat = cv2.warpAffine(self.screen_heat, matrix, (width, height), flags=cv2.INTER_LINEAR,
+                                          borderMode=cv2.BORDER_CONSTANT, borderValue=0)
+
+    def choose_camera_direction(self, default_direction):
+        """Turn toward the side that brings the most expected mobs onto the wide screen axis"""
+        best_direction, best_score = default_direction, None
+        for direction in (default_direction, -default_direction):
+            rotation = self.view_rotation + direction * self.camera_step
+            screen_angles = self.headings + rotation  # Where each world sector ends up on screen
+            visibility = np.abs(np.cos(screen_angles))  # Wide 16:9 view sees farther left/right
+            score = float(np.dot(self.world_heat - self.empty_weight * self.emptied, visibility))
+            if best_score is None or score > best_score + 1e-6:
+                best_direction, best_score = direction, score
+        return best_direction
+
+    def record_camera_turn(self, direction):
+        """Account for a camera drag (+1 right, -1 left)"""
+        self.view_rotation = (self.view_rotation + direction * self.camera_step) % (2 * math.pi)
+        self.screen_heat *= 0.5  # Screen positions no longer line up after rotating
+        self.camera_turns += 1
+
+    def stats_summary(self):
+        """One-line planner report for the stats output"""
+        average_idle = self.idle_total / self.idle_periods if self.idle_periods else 0.0
+        hottest = int(np.argmax(self.world_heat))
+        return (f"🧭 Explorer: {self.guided_moves}/{self.moves_planned} heat-guided moves | "
+                f"{self.camera_turns} camera turns | avg idle {average_idle:.1f}s | "
+                f"hottest bearing {hottest * math.degrees(self.sector_width):.0f}°")
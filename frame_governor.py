@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+I-HNT Frame Governor
+Paces the real-time detection loop per hunting state instead of a fixed 30 FPS:
+fast while acquiring targets, slow while locked in a fight, near idle when
+paused. An optional CPU budget scales the rate down when the loop's CPU time
+per iteration (process CPU, not wall time - the deliberate sleeps for clicks,
+walking and camera drags cost nothing) would exceed that share of a core.
+"""
+
+import threading
+
+DEFAULT_STATE_RATES = {
+    'acquire': 30.0,   # Looking at mobs in the zone - react fast
+    'explore': 10.0,   # Walking around an empty zone
+    'engage': 5.0,     # Locked on a target with red health - only health checks
+    'dead': 1.0,       # Waiting for the death window to go away
+    'paused': 0.5,     # CapsLock paused - nothing to decide
+}
+
+
+class FrameGovernor:
+    """Per-state frame-rate policy with a CPU budget cap"""
+
+    def __init__(self, state_rates=None, cpu_budget=None, min_rate=0.2, smoothing=0.2):
+        self.state_rates = dict(DEFAULT_STATE_RATES if state_rates is None else state_rates)
+        self.cpu_budget = cpu_budget    # Max fraction of one core the loop may keep busy (None = no cap)
+        self.min_rate = min_rate        # Never drop below this rate, even when over budget
+        self.smoothing = smoothing      # EMA weight for the measured loop time
+
+        self.wake_event = threading.Event()
+        self.average_loop_times = {}  # Per-state EMA of wall time per iteration
+        self.average_cpu_times = {}   # Per-state EMA of CPU time per iteration (fights are cheaper than acquiring)
+        self.current_state = None
+        self.current_rate = 0.0
+
+        # Statistics
+        self.frames = 0
+        self.throttled_frames = 0   # Frames where the CPU budget lowered the rate
+        self.total_sleep = 0.0
+        self.total_work = 0.0
+        self.total_cpu = 0.0
+
+    def target_rate(self, state):
+        """Frames per second for a state after applying the CPU budget"""
+        rate = self.state_rates.get(state, self.state_rates.get('acquire', 30.0))
+        average_cpu_time = self.average_cpu_times.get(state, 0.0)
+        if self.cpu_budget and average_cpu_time > 0:
+            budget_rate = self.cpu_budget / average_cpu_time
+            if budget_rate < rate:
+                rate = budget_rate
+                self.throttled_frames += 1
+        return max(self.min_rate, rate)
+
+    def end_frame(self, state, loop_time, cpu_time=None):
+        """Record how long this iteration worked and sleep until the next frame is due"""
+        sleep_time = self.frame_delay(state, loop_time, cpu_time)
+        if sleep_time > 0:
+            self.sleep_for(sleep_time)
+        self.wake_event.clear()
+        return sleep_time
+
+    def frame_delay(self, state, loop_time, cpu_time=None):
+        """Record how long this iteration worked and return the wait until the next frame (without sleeping)
+
+        loop_time is wall time (sets the remaining wait); cpu_time is the CPU the
+        iteration used and is what the budget caps. Without it the budget is not applied.
+        """
+        self.update_average(self.average_loop_times, state, loop_time)
+        if cpu_time is not None:
+            self.update_average(self.average_cpu_times, state, cpu_time)
+            self.total_cpu += cpu_time
+
+        self.frames += 1
+        self.total_work += loop_time
+        self.current_state = state
+        self.current_rate = self.target_rate(state)
+
+        sleep_time = 1.0 / self.current_rate - loop_time
+        if sleep_time > 0:
+            self.total_sleep += sleep_time
+        return sleep_time
+
+    def update_average(self, averages, state, value):
+        average = averages.get(state)
+        averages[state] = value if average is None else average + self.smoothing * (value - average)
+
+    def sleep_for(self, seconds):
+        """Sleep for up to `seconds` - hotkeys can cut it short through wake()"""
+        self.wake_event.wait(seconds)
+
+    def wake(self):
+        """Interrupt the current sleep (e.g. on resume)"""
+        self.wake_event.set()
+
+    def cpu_usage(self):
+        """Fraction of wall time the loop has spent on the CPU"""
+        total = self.total_work + self.total_sleep
+        return self.total_cpu / total if total > 0 else 0.0
+
+    def stats_summary(self):
+        """One-line governor report for the stats output"""
+        budget = f"{self.cpu_budget * 100:.0f}%" if self.cpu_budget else "off"
+        return (f"⏱️ Governor: {self.current_state} @ {self.current_rate:.1f} FPS | "
+                f"loop {self.average_loop_times.get(self.current_state, 0.0) * 1000:.1f}ms | CPU {self.cpu_usage() * 100:.0f}% "
+                f"(budget {budget}) | throttled {self.throttled_frames}/{self.frames}")
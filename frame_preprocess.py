@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+I-HNT Frame Preprocessor
+Turns the captured BGRA screenshot straight into the YOLO input tensor.
+
+The capture is resized once into a reusable buffer and written channel by
+channel (BGR→RGB, HWC→CHW, /255) into a preallocated letterboxed float32
+tensor. This replaces the np.array copy, the cvtColor copy and ultralytics'
+own letterbox/normalize/permute allocations on every frame.
+
+The model sees RGB either way: every numpy path in I-HNT hands ultralytics
+BGR frames (its convention for arrays - it flips them to RGB itself), and
+this tensor is filled with the RGB planes directly.
+"""
+
+import math
+
+import cv2
+import numpy as np
+import torch
+
+LETTERBOX_COLOR = 114 / 255.0  # Same grey padding ultralytics uses
+
+
+class FramePreprocessor:
+    """Letterbox BGRA frames into a preallocated (1, 3, H, W) float tensor"""
+
+    def __init__(self, frame_shape, imgsz=640, stride=32, device='cpu'):
+        frame_height, frame_width = frame_shape
+        self.frame_shape = (frame_height, frame_width)
+
+        # Same scale as ultralytics letterbox, padded only up to the model stride
+        self.scale = min(imgsz / frame_height, imgsz / frame_width)
+        self.resized_width = int(round(frame_width * self.scale))
+        self.resized_height = int(round(frame_height * self.scale))
+        self.input_width = math.ceil(self.resized_width / stride) * stride
+        self.input_height = math.ceil(self.resized_height / stride) * stride
+        self.pad_left = (self.input_width - self.resized_width) // 2
+        self.pad_top = (self.input_height - self.resized_height) // 2
+
+        self.device = torch.device(device)
+        use_pinned = self.device.type == 'cuda'
+
+        # Host buffers are allocated once and reused every frame
+        self.resized = None  # Allocated on the first frame (BGRA or BGR)
+        self.host_tensor = torch.full((1, 3, self.input_height, self.input_width), LETTERBOX_COLOR,
+                                      dtype=torch.float32, pin_memory=use_pinned)
+        self.buffer = self.host_tensor.numpy()
+        self.device_tensor = self.host_tensor if not use_pinned else \
+            torch.empty_like(self.host_tensor, device=self.device)
+
+        # Output plane for each RGB channel inside the letterbox
+        rows = slice(self.pad_top, self.pad_top + self.resized_height)
+        cols = slice(self.pad_left, self.pad_left + self.resized_width)
+        self.planes = [self.buffer[0, channel, rows, cols] for channel in range(3)]
+        self.inv_255 = np.float32(1 / 255.0)
+
+    def __call__(self, bgra_frame):
+        """Fill the input tensor from a BGRA (or BGR) frame and return it"""
+        channels = bgra_frame.shape[2]
+        if self.resized is None or self.resized.shape[2] != channels:
+            self.resized = np.empty((self.resized_height, self.resized_width, channels), dtype=np.uint8)
+        cv2.resize(bgra_frame, (self.resized_width, self.resized_height),
+                   dst=self.resized, interpolation=cv2.INTER_LINEAR)
+
+        # BGR(A) → RGB planes, scaled to 0-1, written straight into the tensor memory
+        for channel, source in enumerate((2, 1, 0)):
+            np.multiply(self.resized[..., source], self.inv_255, out=self.planes[channel])
+
+        if self.device_tensor is not self.host_tensor:
+            self.device_tensor.copy_(self.host_tensor, non_blocking=True)
+        return self.device_tensor
+
+    def scale_boxes(self, boxes):
+        """Map [x1, y1, x2, y2, ...] rows from tensor space back to frame pixels (in place)"""
+        if len(boxes) == 0:
+            return boxes
+        boxes[:, [0, 2]] = (boxes[:, [0, 2]] - self.pad_left) / self.scale
+        boxes[:, [1, 3]] = (boxes[:, [1, 3]] - self.pad_top) / self.scale
+        boxes[:, [0, 2]] = np.clip(boxes[:, [0, 2]], 0, self.frame_shape[1])
+        boxes[:, [1, 3]] = np.clip(boxes[:, [1, 3]], 0, self.frame_shape[0])
+        return boxes
@@ -0,0 +1,586 @@
+#!/usr/bin/env python3
+"""
+I-HNT Game Simulator
+Deterministic, headless stand-in for the game screen so the full
+real_time_detection_loop can be exercised without a live game.
+
+The simulator composites monsters_images sprites onto a scrolling background,
+draws the top-center health bar of the selected mob (draining while skills are
+active), shows a pet card when the pet is clicked and pops the death
+confirmation dialog on schedule. Mock pyautogui/mss/pynput backends feed it the
+clicks and key presses I-HNT issues, and a virtual clock replaces time.sleep so
+an hour of hunting runs in minutes:
+
+    python game_simulator.py --minutes 60 --seed 1
+    python game_simulator.py --minutes 10 --detector model --model yolov8n.pt
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import math
+import sys
+import time
+import types
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+SCREEN_WIDTH, SCREEN_HEIGHT = 1920, 1080
+CENTER_X, CENTER_Y = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
+SPRITE_SIZE = 90
+TEXTURE_SIZE = 1024
+
+
+class SimulatedMob:
+    """One mob (or the player's pet) in world coordinates"""
+
+    def __init__(self, mob_id, x, y, sprite_index, is_pet=False):
+        self.mob_id = mob_id
+        self.x, self.y = x, y
+        self.vx, self.vy = 0.0, 0.0
+        self.sprite_index = sprite_index
+        self.is_pet = is_pet
+        self.hp = 100.0
+
+
+class GameSimulator:
+    """World state, rendering and input handling for the simulated game"""
+
+    def __init__(self, seed=0, sprites_dir="monsters_images", mob_count=8, mob_speed=40.0,
+                 player_speed=300.0, skill_dps=30.0, attack_range=300.0, death_interval=900.0,
+                 pet_offset=(-360, 150), corpse_seconds=1.0):
+        self.rng = np.random.default_rng(seed)
+        self.mob_count = mob_count
+        self.mob_speed = mob_speed            # Wandering speed in px/s
+        self.player_speed = player_speed      # Walking speed in px/s
+        self.skill_dps = skill_dps            # Damage per second while the skill rotation runs
+        self.attack_range = attack_range      # Weapon reach - the player walks to farther targets first
+        self.death_interval = death_interval  # Simulated seconds between scheduled deaths (0 = never)
+        self.pet_offset = pet_offset          # Where the pet trails the player (just outside the spear zone)
+        self.corpse_seconds = corpse_seconds  # How long a killed mob's emptied health bar stays up (as in the game)
+
+        self.sprites = self.load_sprites(sprites_dir)
+        texture = self.make_texture()
+        # Tile the texture once so scrolling is a plain slice instead of a gather
+        self.ground = np.tile(texture, (SCREEN_HEIGHT // TEXTURE_SIZE + 2, SCREEN_WIDTH // TEXTURE_SIZE + 2, 1))
+
+        self.now = 0.0
+        self.player_x, self.player_y = 0.0, 0.0
+        self.walk_target = None
+        self.selected = None
+        self.corpse_until = 0.0               # Killed target's empty health bar shows until then
+        self.mobs = []
+        self.next_mob_id = 0
+        self.pet = self.spawn_mob(is_pet=True)
+        for _ in range(mob_count):
+            self.spawn_mob()
+
+        self.dead = False
+        self.death_dialog = False
+        self.next_death = death_interval if death_interval else math.inf
+        self.drag_start = None
+        self.skills_active = lambda: True  # Replaced by the harness with the bot's keyboard state
+
+        self.frame_cache_key = None
+        self.frame_cache = None
+
+        # Statistics
+        self.kills = 0
+        self.kill_times = []
+        self.deaths = 0
+        self.mob_clicks = 0
+        self.pet_clicks = 0
+        self.ground_clicks = 0
+        self.key_presses = 0
+
+    # ------------------------------------------------------------ setup
+
+    def load_sprites(self, sprites_dir):
+        """Load mob sprites with their white backgrounds turned into alpha masks"""
+        sprites = []
+        paths = sorted(Path(sprites_dir).glob("*.jpg")) if Path(sprites_dir).exists() else []
+        for path in paths:
+            image = cv2.imread(str(path))
+            if image is None:
+                continue
+            image = cv2.resize(image, (SPRITE_SIZE, SPRITE_SIZE), interpolation=cv2.INTER_AREA)
+            alpha = (image.min(axis=2) < 235).astype(np.float32)[..., None]
+            sprites.append((image.astype(np.float32), alpha))
+
+        if not sprites:
+            # No sprite folder - use flat colored blobs so the simulator still runs
+            for hue in range(0, 180, 30):
+                blob = np.zeros((SPRITE_SIZE, SPRITE_SIZE, 3), dtype=np.uint8)
+                cv2.circle(blob, (SPRITE_SIZE // 2, SPRITE_SIZE // 2), SPRITE_SIZE // 2 - 4, (hue, 200, 160), -1)
+                blob = cv2.cvtColor(blob, cv2.COLOR_HSV2BGR)
+                alpha = (blob.max(axis=2) > 0).astype(np.float32)[..., None]
+                sprites.append((blob.astype(np.float32), alpha))
+        return sprites
+
+    def make_texture(self):
+        """Deterministic grassy ground texture (mid brightness, no red, never mistaken for UI)"""
+        noise = self.rng.integers(0, 256, (TEXTURE_SIZE // 16, TEXTURE_SIZE // 16), dtype=np.uint8)
+        noise = cv2.resize(noise, (TEXTURE_SIZE, TEXTURE_SIZE), interpolation=cv2.INTER_CUBIC).astype(np.float32)
+        texture = np.empty((TEXTURE_SIZE, TEXTURE_SIZE, 3), dtype=np.uint8)
+        texture[..., 0] = 95 + noise * 0.15   # Blue
+        texture[..., 1] = 140 + noise * 0.2   # Green
+        texture[..., 2] = 110 + noise * 0.15  # Red
+        return texture
+
+    def spawn_mob(self, is_pet=False):
+        """Spawn a mob somewhere around the player (the pet stays next to the player)"""
+        if is_pet:
+            x, y = self.player_x + self.pet_offset[0], self.player_y + self.pet_offset[1]
+        else:
+            angle = self.rng.uniform(0, 2 * math.pi)
+            distance = self.rng.uniform(150, 900)
+            x = self.player_x + distance * math.cos(angle)
+            y = self.player_y + distance * math.sin(angle) * 0.5
+        mob = SimulatedMob(self.next_mob_id, x, y, int(self.rng.integers(len(self.sprites))), is_pet)
+        self.next_mob_id += 1
+        self.mobs.append(mob)
+        return mob
+
+    # ------------------------------------------------------------ simulation
+
+    def to_screen(self, x, y):
+        """World → screen coordinates (the character is always at screen center)"""
+        return x - self.player_x + CENTER_X, y - self.player_y + CENTER_Y
+
+    def to_world(self, screen_x, screen_y):
+        """Screen → world coordinates"""
+        return screen_x - CENTER_X + self.player_x, screen_y - CENTER_Y + self.player_y
+
+    def advance_to(self, now):
+        """Integrate the world up to simulated time `now`"""
+        while self.now < now:
+            dt = min(0.05, now - self.now)
+            self.step(dt)
+            self.now += dt
+
+    def step(self, dt):
+        """Advance the world by one small time step"""
+        if not self.dead and self.now >= self.next_death:
+            self.dead = True
+            self.death_dialog = True
+            self.deaths += 1
+            self.selected = None
+            self.corpse_until = 0.0
+            self.walk_target = None
+            self.next_death = self.now + self.death_interval
+
+        # Wandering mobs (the selected mob stands still and fights)
+        for mob in self.mobs:
+            if mob.is_pet:
+                mob.x, mob.y = self.player_x + self.pet_offset[0], self.player_y + self.pet_offset[1]
+                continue
+            if mob is self.selected:
+                continue
+            if self.rng.random() < dt * 0.5:
+                angle = self.rng.uniform(0, 2 * math.pi)
+                mob.vx, mob.vy = self.mob_speed * math.cos(angle), self.mob_speed * math.sin(angle)
+            mob.x += mob.vx * dt
+            mob.y += mob.vy * dt
+
+        if self.dead:
+            self.frame_cache_key = None
+            return
+
+        # Walk towards the selected target or the clicked ground position
+        goal = None
+        if self.selected is not None and not self.selected.is_pet:
+            goal = (self.selected.x, self.selected.y)
+            distance = math.hypot(goal[0] - self.player_x, goal[1] - self.player_y)
+            if distance <= self.attack_range:
+                goal = None
+                if self.skills_active():
+                    self.selected.hp -= self.skill_dps * dt
+        elif self.walk_target is not None:
+            goal = self.walk_target
+
+        if goal is not None:
+            dx, dy = goal[0] - self.player_x, goal[1] - self.player_y
+            distance = math.hypot(dx, dy)
+            travel = min(distance, self.player_speed * dt)
+            if distance > 0:
+                self.player_x += dx / distance * travel
+                self.player_y += dy / distance * travel
+            if self.walk_target is not None and distance <= travel:
+                self.walk_target = None
+
+        # Kills and respawns
+        if self.selected is not None and self.selected.hp <= 0:
+            self.kills += 1
+            self.kill_times.append(self.now)
+            self.mobs.remove(self.selected)
+            self.selected = None
+            self.corpse_until = self.now + self.corpse_seconds
+        for mob in list(self.mobs):
+            if not mob.is_pet and math.hypot(mob.x - self.player_x, mob.y - self.player_y) > 1600:
+                self.mobs.remove(mob)
+        while sum(1 for mob in self.mobs if not mob.is_pet) < self.mob_count:
+            self.spawn_mob()
+
+        self.frame_cache_key = None
+
+    # ------------------------------------------------------------ input
+
+    def click(self, x, y, button='left'):
+        """Handle a left click at screen position (x, y)"""
+        if button != 'left':
+            return
+        if self.death_dialog:
+            # Either death button closes the dialog; "resurrect" revives immediately
+            for button_x, revive in ((CENTER_X - 150, True), (CENTER_X + 150, False)):
+                if abs(x - button_x) <= 100 and abs(y - (CENTER_Y + 200)) <= 25:
+                    self.death_dialog = False
+                    if revive:
+                        self.dead = False
+                    break
+            self.frame_cache_key = None
+            return
+        if self.dead:
+            return
+
+        for mob in reversed(self.mobs):
+            screen_x, screen_y = self.to_screen(mob.x, mob.y)
+            if abs(x - screen_x) <= SPRITE_SIZE // 2 and abs(y - screen_y) <= SPRITE_SIZE // 2:
+                self.selected = mob
+                self.corpse_until = 0.0
+                self.walk_target = None
+                if mob.is_pet:
+                    self.pet_clicks += 1
+                else:
+                    self.mob_clicks += 1
+                self.frame_cache_key = None
+                return
+
+        # Empty ground - deselect and walk there
+        self.ground_clicks += 1
+        self.selected = None
+        self.corpse_until = 0.0
+        self.walk_target = self.to_world(x, y)
+        self.frame_cache_key = None
+
+    def press(self, key):
+        """Handle a key press (the auto-res scroll on slot 0 revives a waiting player)"""
+        self.key_presses += 1
+        if key == '0' and self.dead and not self.death_dialog:
+            self.dead = False
+            self.frame_cache_key = None
+
+    def start_drag(self, x, y, button='right'):
+        """Remember where a camera drag started"""
+        if button == 'right':
+            self.drag_start = x
+
+    def drag_to(self, x, y, button='right'):
+        """Rotate the world around the player for a right-button camera drag"""
+        if button != 'right' or self.drag_start is None:
+            return
+        angle = math.radians((x - self.drag_start) / 200 * 30)
+        cos_a, sin_a = math.cos(angle), math.sin(angle)
+        for mob in self.mobs:
+            dx, dy = mob.x - self.player_x, mob.y - self.player_y
+            mob.x = self.player_x + dx * cos_a - dy * sin_a
+            mob.y = self.player_y + dx * sin_a + dy * cos_a
+        self.drag_start = None
+        self.frame_cache_key = None
+
+    # ------------------------------------------------------------ rendering
+
+    def render(self):
+        """Full 1920x1080 BGRA screen for the current simulated moment"""
+        key = (self.now, self.player_x, self.player_y)
+        if self.frame_cache_key == key:
+            return self.frame_cache
+
+        top, left = int(self.player_y) % TEXTURE_SIZE, int(self.player_x) % TEXTURE_SIZE
+        screen = self.ground[top:top + SCREEN_HEIGHT, left:left + SCREEN_WIDTH].copy()
+
+        for mob in self.mobs:
+            screen_x, screen_y = self.to_screen(mob.x, mob.y)
+            left, top = int(screen_x) - SPRITE_SIZE // 2, int(screen_y) - SPRITE_SIZE // 2
+            if left < 0 or top < 0 or left + SPRITE_SIZE > SCREEN_WIDTH or top + SPRITE_SIZE > SCREEN_HEIGHT:
+                continue
+            sprite, alpha = self.sprites[mob.sprite_index]
+            region = screen[top:top + SPRITE_SIZE, left:left + SPRITE_SIZE].astype(np.float32)
+            screen[top:top + SPRITE_SIZE, left:left + SPRITE_SIZE] = (sprite * alpha + region * (1 - alpha)).astype(np.uint8)
+
+        if self.selected is not None and self.selected.is_pet:
+            # Pet card - dark panel with the pet's name
+            cv2.rectangle(screen, (CENTER_X - 130, 15), (CENTER_X + 130, 85), (20, 20, 20), -1)
+            cv2.putText(screen, "My Pet", (CENTER_X - 50, 58), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (200, 200, 200), 2)
+        elif self.selected is not None or self.now < self.corpse_until:
+            # Mob health bar - dark background, bright border, red fill proportional to HP (empty for a corpse)
+            cv2.rectangle(screen, (870, 38), (1050, 62), (30, 30, 30), -1)
+            cv2.rectangle(screen, (870, 38), (1050, 62), (225, 225, 225), 1)
+            fill = int(160 * max(0.0, self.selected.hp) / 100) if self.selected is not None else 0
+            if fill > 0:
+                cv2.rectangle(screen, (880, 45), (880 + fill, 55), (20, 20, 220), -1)
+
+        if self.death_dialog:
+            cv2.rectangle(screen, (CENTER_X - 350, CENTER_Y - 150), (CENTER_X + 350, CENTER_Y + 240), (25, 25, 25), -1)
+            for line in range(4):
+                y = CENTER_Y - 110 + line * 40
+                cv2.rectangle(screen, (CENTER_X - 250, y), (CENTER_X + 250, y + 12), (230, 230, 230), -1)
+            for button_x in (CENTER_X - 150, CENTER_X + 150):
+                cv2.rectangle(screen, (button_x - 100, CENTER_Y + 180), (button_x + 100, CENTER_Y + 220),
+                              (200, 200, 200), 2)
+
+        self.frame_cache = cv2.cvtColor(screen, cv2.COLOR_BGR2BGRA)
+        self.frame_cache_key = key
+        return self.frame_cache
+
+    def grab(self, area):
+        """mss-style grab of a screen region (BGRA)"""
+        top, left = area['top'], area['left']
+        return self.render()[top:top + area['height'], left:left + area['width']]
+
+    def ground_truth_boxes(self, margin_left, margin_top, frame_width, frame_height):
+        """Visible mob/pet boxes in capture-frame coordinates as [x1, y1, x2, y2, conf, class] rows"""
+        rows = []
+        for mob in self.mobs:
+            screen_x, screen_y = self.to_screen(mob.x, mob.y)
+            x, y = screen_x - margin_left, screen_y - margin_top
+            if 0 <= x < frame_width and 0 <= y < frame_height:
+                half = SPRITE_SIZE / 2
+                rows.append([x - half, y - half, x + half, y + half, 0.9, 0])
+        return np.array(rows, dtype=np.float32).reshape(-1, 6)
+
+
+class VirtualClock:
+    """Drop-in for the `time` module inside i_hnt - sleeps advance simulated time instantly"""
+
+    def __init__(self, simulator, include_compute=False, epoch=1_700_000_000.0):
+        self.simulator = simulator
+        self.include_compute = include_compute  # Also let real compute time pass in the simulation
+        self.epoch = epoch
+        self.offset = 0.0
+        self.slept = 0.0  # Simulated seconds spent in sleep() - not CPU time
+        self.real_start = time.perf_counter()
+        self.on_advance = None
+
+    def elapsed(self):
+        """Simulated seconds since the clock started"""
+        compute = time.perf_counter() - self.real_start if self.include_compute else 0.0
+        return self.offset + compute
+
+    def time(self):
+        self.simulator.advance_to(self.elapsed())
+        return self.epoch + self.elapsed()
+
+    perf_counter = time
+    monotonic = time
+
+    def advance(self, seconds):
+        """Move simulated time forward"""
+        if seconds > 0:
+            self.offset += seconds
+            self.simulator.advance_to(self.elapsed())
+            if self.on_advance is not None:
+                self.on_advance()
+
+    def process_time(self):
+        """Simulated CPU time: everything except sleeps (inference costs, real compute if included)"""
+        return self.elapsed() - self.slept
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            self.slept += seconds
+        self.advance(seconds)
+
+
+def install_simulated_backends(simulator):
+    """Replace pyautogui, mss and pynput with simulator-backed modules (call before importing i_hnt)"""
+    pyautogui = types.ModuleType('pyautogui')
+    pyautogui.click = lambda x=None, y=None, button='left', **kwargs: simulator.click(x, y, button)
+    pyautogui.press = lambda key, **kwargs: simulator.press(key)
+    pyautogui.mouseDown = lambda x=None, y=None, button='left', **kwargs: simulator.start_drag(x, y, button)
+    pyautogui.dragTo = lambda x=None, y=None, duration=0.0, button='left', **kwargs: simulator.drag_to(x, y, button)
+    pyautogui.mouseUp = lambda *args, **kwargs: None
+    pyautogui.moveTo = lambda *args, **kwargs: None
+
+    class SimulatedScreen:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def grab(self, area):
+            return simulator.grab(area)
+
+    mss = types.ModuleType('mss')
+    mss.mss = SimulatedScreen
+
+    pynput = types.ModuleType('pynput')
+    keyboard = types.ModuleType('pynput.keyboard')
+
+    class Key:
+        caps_lock, f2, f3, f4, f5, f6 = 'caps_lock', 'f2', 'f3', 'f4', 'f5', 'f6'
+
+    class Listener:
+        def __init__(self, on_press=None, **kwargs):
+            self.daemon = True
+
+        def start(self):
+            pass
+
+        def stop(self):
+            pass
+
+    keyboard.Key = Key
+    keyboard.Listener = Listener
+    pynput.keyboard = keyboard
+
+    sys.modules.update({'pyautogui': pyautogui, 'mss': mss, 'pynput': pynput, 'pynput.keyboard': keyboard})
+
+
+def run_simulation(minutes=60.0, seed=0, detector='oracle', model_path='yolov8n.pt', include_compute=False,
+                   inference_cost=0.03, miss_rate=0.05, verbose=False, configure=None, world_options=None):
+    """Run I-HNT against the simulator and return throughput/latency statistics"""
+    simulator = GameSimulator(seed=seed, **(world_options or {}))
+    install_simulated_backends(simulator)
+
+    import i_hnt
+    if getattr(i_hnt, 'pyautogui', None) is not sys.modules['pyautogui']:
+        i_hnt = importlib.reload(i_hnt)
+
+    clock = VirtualClock(simulator, include_compute=include_compute)
+    i_hnt.time = clock
+    duration = minutes * 60.0
+    rng = np.random.default_rng(seed + 1)
+    loop_latencies, detect_latencies = [], []
+
+    output = sys.stdout if verbose else io.StringIO()
+    with contextlib.redirect_stdout(output):
+        finder = i_hnt.IHNTMobFinder()
+        finder.death_handling_mode = "wait_help"  # Keep hunting after deaths instead of pausing
+        finder.auto_handle_death = True
+        finder.debug_detections = False
+        finder.debug_filtering = False
+        finder.keyboard_active = True  # As if CapsLock had been pressed to start hunting
+        finder.record_analytics = False  # Simulated sessions stay out of the real statistics
+        finder.offline_session = True     # Frames come from the simulator, not the live game
+        finder.use_watchdog = False
+        finder.frame_governor.sleep_for = clock.sleep
+
+        # Skills run continuously in the real game - the simulator applies them as DPS
+        finder.continuous_keyboard_automation = lambda: None
+        simulator.skills_active = lambda: finder.keyboard_active and not finder.paused
+
+        frame_width = finder.screen_width - finder.margin_left - finder.margin_right
+        frame_height = finder.screen_height - finder.margin_top - finder.margin_bottom
+
+        if detector == 'model':
+            if not finder.load_yolo_model(model_path):
+                raise RuntimeError(f"could not load model {model_path}")
+            model_inference = finder.run_inference
+
+            def timed_inference(frame):
+                start = time.perf_counter()
+                boxes = model_inference(frame)
+                detect_latencies.append(time.perf_counter() - start)
+                return boxes
+
+            finder.run_inference = timed_inference
+        else:
+            def oracle_inference(frame):
+                # Ground truth with misses and jitter, plus a fixed simulated inference cost
+                start = time.perf_counter()
+                boxes = simulator.ground_truth_boxes(finder.margin_left, finder.margin_top, frame_width, frame_height)
+                keep = rng.random(len(boxes)) >= miss_rate
+                boxes = boxes[keep]
+                boxes[:, :4] += rng.normal(0, 4, (len(boxes), 1)).astype(np.float32)
+                detect_latencies.append(time.perf_counter() - start)
+                clock.advance(inference_cost if not include_compute else 0.0)
+                return boxes
+
+            finder.model = object()  # detect_mobs_ai only checks that a model is present
+            finder.run_inference = oracle_inference
+
+        if configure is not None:
+            configure(finder)
+
+        governor_end_frame = finder.frame_governor.end_frame
+        last_frame = [time.perf_counter()]
+
+        def timed_end_frame(state, loop_time, cpu_time=None):
+            now = time.perf_counter()
+            loop_latencies.append(now - last_frame[0])
+            result = governor_end_frame(state, loop_time, cpu_time)
+            last_frame[0] = time.perf_counter()
+            return result
+
+        finder.frame_governor.end_frame = timed_end_frame
+
+        def check_duration():
+            if clock.elapsed() >= duration:
+                finder.stop_requested = True
+
+        clock.on_advance = check_duration
+
+        real_start = time.perf_counter()
+        finder.real_time_detection_loop()
+        real_elapsed = time.perf_counter() - real_start
+
+    simulated = clock.elapsed()
+    kill_gaps = np.diff([0.0] + simulator.kill_times) if simulator.kill_times else np.array([])
+    return {
+        'simulated_seconds': simulated,
+        'real_seconds': real_elapsed,
+        'speedup': simulated / real_elapsed if real_elapsed > 0 else 0.0,
+        'kills': simulator.kills,
+        'kills_per_hour': simulator.kills / simulated * 3600 if simulated > 0 else 0.0,
+        'mean_seconds_per_kill': float(kill_gaps.mean()) if len(kill_gaps) else 0.0,
+        'bot_kills': finder.metrics.kills,          # What I-HNT itself counted (analytics, metrics endpoint)
+        'bot_lost_targets': finder.metrics.lost_targets,
+        'deaths': simulator.deaths,
+        'pet_clicks': simulator.pet_clicks,
+        'mob_clicks': simulator.mob_clicks,
+        'ground_clicks': simulator.ground_clicks,
+        'frames': len(loop_latencies),
+        'loop_p50_ms': float(np.percentile(loop_latencies, 50) * 1000) if loop_latencies else 0.0,
+        'loop_p95_ms': float(np.percentile(loop_latencies, 95) * 1000) if loop_latencies else 0.0,
+        'detect_p50_ms': float(np.percentile(detect_latencies, 50) * 1000) if detect_latencies else 0.0,
+        'detect_p95_ms': float(np.percentile(detect_latencies, 95) * 1000) if detect_latencies else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run I-HNT end to end against a simulated game screen")
+    parser.add_argument('--minutes', type=float, default=60.0, help="Simulated minutes to hunt")
+    parser.add_argument('--seed', type=int, default=0, help="World seed (same seed = same run)")
+    parser.add_argument('--detector', choices=['oracle', 'model'], default='oracle',
+                        help="oracle = ground truth with misses, model = real YOLO inference")
+    parser.add_argument('--model', default='yolov8n.pt', help="Model path for --detector model")
+    parser.add_argument('--real-compute', action='store_true',
+                        help="Let real compute time pass in the simulation (not deterministic)")
+    parser.add_argument('--mob-speed', type=float, default=40.0, help="Mob wandering speed in px/s")
+    parser.add_argument('--verbose', action='store_true', help="Show the bot's console output")
+    args = parser.parse_args()
+
+    print("🕹️ I-HNT Game Simulator")
+    print("=" * 50)
+    stats = run_simulation(args.minutes, args.seed, args.detector, args.model,
+                           include_compute=args.real_compute or args.detector == 'model', verbose=args.verbose,
+                           world_options={'mob_speed': args.mob_speed})
+
+    print(f"⏱️ Simulated {stats['simulated_seconds'] / 60:.1f} min in {stats['real_seconds']:.1f}s "
+          f"({stats['speedup']:.0f}x real time)")
+    print(f"⚔️ Kills: {stats['kills']} ({stats['kills_per_hour']:.0f}/hour, "
+          f"{stats['mean_seconds_per_kill']:.1f}s per kill) | I-HNT counted {stats['bot_kills']} kills, "
+          f"{stats['bot_lost_targets']} lost targets")
+    print(f"💀 Deaths: {stats['deaths']} | 🐕 Pet clicks: {stats['pet_clicks']} | "
+          f"🖱️ Mob clicks: {stats['mob_clicks']} | 🚶 Ground clicks: {stats['ground_clicks']}")
+    print(f"📊 Loop latency: p50 {stats['loop_p50_ms']:.1f}ms | p95 {stats['loop_p95_ms']:.1f}ms "
+          f"over {stats['frames']} frames")
+    print(f"🤖 Detection latency: p50 {stats['detect_p50_ms']:.1f}ms | p95 {stats['detect_p95_ms']:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+I-HNT Hard Example Miner
+Keeps the live frames the model struggles with so they can be labeled and
+trained on, instead of throwing every frame away.
+
+Frames are flagged for three reasons:
+
+    low_confidence   A detection only just cleared conf_threshold
+    pet_click        A detection that turned out to be a pet (pet card)
+    missed_mob       Exploration walked on from a frame with no mobs in the
+                     zone, and mobs showed up right after - the frame before
+                     the move probably had one the model missed
+
+The detection loop only hands over a reference to the frame (a cooldown check
+and a non-blocking queue put). A background writer does the rest: perceptual-
+hash dedupe against recent examples, JPEG encoding, a JSON sidecar with the
+boxes and reason, and deleting the oldest examples when the store outgrows its
+size cap. Feed the folder to dataset_builder.py (--images hard_examples
+--model best.pt) to auto-label and triage it.
+"""
+
+import json
+import queue
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+import cv2
+
+from dataset_builder import perceptual_hash, hamming
+
+REASONS = ('low_confidence', 'pet_click', 'missed_mob')
+
+
+class HardExampleMiner:
+    """Non-blocking frame flagging with a deduplicating, size-capped background store"""
+
+    def __init__(self, output_dir="hard_examples", max_megabytes=500, queue_size=16, cooldown=2.0,
+                 dedupe_distance=5, dedupe_memory=512, miss_window=3.0, jpeg_quality=90):
+        self.output_dir = Path(output_dir)
+        self.max_bytes = int(max_megabytes * 1024 * 1024)
+        self.cooldown = cooldown              # Seconds between two examples of the same reason
+        self.dedupe_distance = dedupe_distance
+        self.miss_window = miss_window        # Mobs within this long after a move count as missed before it
+        self.jpeg_quality = jpeg_quality
+        self.copy_frames = False              # Frames come from a reused buffer pool - copy the ones kept
+
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.recent_hashes = deque(maxlen=dedupe_memory)
+        self.last_offer = {reason: 0.0 for reason in REASONS}
+        self.move_frame = None                # (frame, time) of the last exploration move from an empty zone
+        self.stored = deque()                 # (path, bytes) oldest first
+        self.stored_bytes = 0
+        self.thread = None
+
+        # Statistics
+        self.flagged = {reason: 0 for reason in REASONS}
+        self.dropped = 0
+        self.duplicates = 0
+        self.written = 0
+
+    # ------------------------------------------------------------ detection thread side (cheap)
+
+    def offer(self, frame, reason, boxes=None, now=None, **meta):
+        """Queue a frame for the writer - returns immediately"""
+        now = time.time() if now is None else now
+        if frame is None or now - self.last_offer[reason] < self.cooldown:
+            return False
+        self.last_offer[reason] = now
+        if self.copy_frames and reason != 'missed_mob':
+            frame = frame.copy()  # missed_mob frames were already copied by record_move
+        try:
+            self.queue.put_nowait((frame, reason, boxes, now, meta))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        self.flagged[reason] += 1
+        return True
+
+    def record_move(self, frame, now):
+        """Exploration is walking away from this (mob-less) frame"""
+        self.move_frame = (frame.copy() if self.copy_frames and frame is not None else frame, now)
+
+    def record_zone_mobs(self, now):
+        """Mobs are in the zone - if that happened right after a move, mine the frame before it"""
+        if self.move_frame is None:
+            return
+        frame, moved_at = self.move_frame
+        self.move_frame = None
+        if now - moved_at <= self.miss_window:
+            self.offer(frame, 'missed_mob', now=now, seconds_after_move=round(now - moved_at, 2))
+
+    # ------------------------------------------------------------ writer thread
+
+    def start(self):
+        """Create the store, index existing examples and start the writer thread"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        for path in sorted(self.output_dir.glob("*.jpg")):
+            size = path.stat().st_size
+            self.stored.append((path, size))
+            self.stored_bytes += size
+        self.thread = threading.Thread(target=self.writer_loop, name="hard-example-writer", daemon=True)
+        self.thread.start()
+        print(f"⛏️ Hard example mining → {self.output_dir} ({len(self.stored)} stored, "
+              f"{self.stored_bytes / 1e6:.0f}/{self.max_bytes / 1e6:.0f} MB)")
+
+    def stop(self):
+        """Write what is queued and stop the writer"""
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join(timeout=10)
+            self.thread = None
+
+    def writer_loop(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            try:
+                self.store(*item)
+            except Exception as e:
+                print(f"⚠️ Hard example write failed: {e}")
+
+    def store(self, frame, reason, boxes, timestamp, meta):
+        """Dedupe, encode and write one example, then enforce the size cap"""
+        image = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR) if frame.shape[2] == 4 else frame
+
+        value = perceptual_hash(image)
+        if any(hamming(value, other) <= self.dedupe_distance for other in self.recent_hashes):
+            self.duplicates += 1
+            return
+        self.recent_hashes.append(value)
+
+        ok, encoded = cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality])
+        if not ok:
+            return
+        stem = f"{int(timestamp * 1000)}_{reason}"
+        image_path = self.output_dir / f"{stem}.jpg"
+        image_path.write_bytes(encoded.tobytes())
+        sidecar = {
+            'reason': reason,
+            'time': timestamp,
+            'boxes': [[round(float(v), 3) for v in box[:6]] for box in boxes] if boxes is not None else [],
+            **meta,
+        }
+        image_path.with_suffix('.json').write_text(json.dumps(sidecar))
+
+        self.stored.append((image_path, len(encoded)))
+        self.stored_bytes += len(encoded)
+        self.written += 1
+        while self.stored_bytes > self.max_bytes and len(self.stored) > 1:
+            old_path, size = self.stored.popleft()
+            old_path.unlink(missing_ok=True)
+            old_path.with_suffix('.json').unlink(missing_ok=True)
+            self.stored_bytes -= size
+
+    def stats_summary(self):
+        """One-line mining report for the stats output"""
+        flagged = ", ".join(f"{reason} {count}" for reason, count in self.flagged.items())
+        return (f"⛏️ Hard examples: flagged {flagged} | {self.written} written, {self.duplicates} duplicates, "
+                f"{self.dropped} dropped | store {self.stored_bytes / 1e6:.0f}MB")
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+I-HNT Hunt Orchestrator
+Runs a hunting session on one asyncio event loop instead of the detection
+thread, the keyboard thread and main()'s sleep loop poking at shared flags.
+
+    detection   Each loop iteration (capture, inference, decisions, clicks)
+                runs as one detection_step() on a single "detector" executor
+                thread, followed by an awaitable, wakeable frame wait
+    skills      The 123145 rotation is a coroutine; every key press is
+                scheduled for a due time and runs on a single "input"
+                executor thread - a press that can't start within its
+                deadline is dropped instead of firing late in a burst
+    hotkeys     The pynput listener only posts key names into an asyncio
+                queue (thread-safe); handlers that touch hunting state run on
+                the detector thread, i.e. between two detection steps
+
+Everything that mutates IHNTMobFinder state therefore runs on one thread,
+and stopping is plain task cancellation: the current step finishes, then the
+session services shut down in order.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+SKILL_SEQUENCE = "123145"   # Same rotation as continuous_keyboard_automation
+KEY_INTERVAL = 0.1          # Seconds between two skill keys
+SEQUENCE_GAP = 0.4          # Extra pause after a full rotation (~1s cycle)
+
+
+class HuntOrchestrator:
+    """asyncio owner of the detection loop, skill rotation and hotkey handling"""
+
+    def __init__(self, finder, action_deadline=0.25, death_detection_delay=5.0):
+        self.finder = finder
+        self.action_deadline = action_deadline  # A skill press later than this is dropped
+        self.death_detection_delay = death_detection_delay
+
+        self.loop = None
+        self.hotkeys = None                     # asyncio.Queue of key names from the listener thread
+        self.wake_event = None                  # Cuts the frame wait short (resume)
+        self.detector = ThreadPoolExecutor(1, thread_name_prefix="ihnt-detect")
+        self.input = ThreadPoolExecutor(1, thread_name_prefix="ihnt-input",
+                                        initializer=finder.pin_thread, initargs=('actuator',))
+        self.detection_task = None
+        self.skill_task = None
+
+        # Statistics
+        self.steps = 0
+        self.presses = 0
+        self.dropped_presses = 0
+        self.max_lateness = 0.0
+        self.hotkey_count = 0
+
+    # ------------------------------------------------------------ listener thread side
+
+    def post_hotkey(self, name):
+        """Hand a hotkey to the event loop (safe to call from any thread)"""
+        if self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.hotkeys.put_nowait, name)
+
+    # ------------------------------------------------------------ event loop side
+
+    async def run(self):
+        """Serve hotkeys until stop is requested, then shut the session down"""
+        self.loop = asyncio.get_running_loop()
+        self.hotkeys = asyncio.Queue()
+        self.wake_event = asyncio.Event()
+        print("🧵 Async orchestrator running (detection, skills and hotkeys on one event loop)")
+        try:
+            while not self.finder.stop_requested:
+                try:
+                    name = await asyncio.wait_for(self.hotkeys.get(), 1.0)
+                except asyncio.TimeoutError:
+                    continue
+                self.hotkey_count += 1
+                try:
+                    await self.handle_hotkey(name)
+                except Exception as e:
+                    print(f"⚠️ Hotkey error: {e}")
+        finally:
+            await self.stop_hunting()
+            self.detector.shutdown(wait=False, cancel_futures=True)
+            self.input.shutdown(wait=False, cancel_futures=True)
+
+    async def handle_hotkey(self, name):
+        finder = self.finder
+        if name == 'caps_lock':
+            if self.detection_task is None or self.detection_task.done():
+                print("\n🚀 CAPS LOCK PRESSED - Starting detection...")
+                finder.paused = False
+                finder.reset_session_stats()  # Reset pet statistics for new session
+                self.detection_task = asyncio.create_task(self.detection_loop())
+            else:
+                await self.in_detector(finder.handle_capslock_toggle)
+                self.wake_event.set()
+        elif name == 'f2':
+            await self.in_detector(finder.manual_death_test)
+        elif name == 'f3':
+            await self.in_detector(finder.cycle_detection_area)
+        elif name == 'f4':
+            await self.in_detector(finder.emergency_unlock_mouse)
+        elif name == 'f5':
+            finder.request_model_reload()  # Loads in its own background thread
+
+    async def in_detector(self, function, *args):
+        """Run a blocking finder call on the detector thread"""
+        return await self.loop.run_in_executor(self.detector, function, *args)
+
+    async def wait(self, seconds):
+        """Frame wait that a resume can cut short"""
+        if seconds <= 0:
+            return
+        self.wake_event.clear()
+        try:
+            await asyncio.wait_for(self.wake_event.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def detection_loop(self):
+        """One hunting session: services up, paced detection steps, services down"""
+        finder = self.finder
+        await self.in_detector(finder.begin_hunting)
+        finder.keyboard_active = True
+        self.skill_task = asyncio.create_task(self.skill_rotation())
+        try:
+            # Wait before starting death detection to avoid false positives
+            print(f"⏳ Waiting {self.death_detection_delay:.0f} seconds before starting death detection...")
+            await asyncio.sleep(self.death_detection_delay)
+            print("✅ Death detection now active")
+
+            while finder.monitoring_active and not finder.stop_requested:
+                loop_start = time.time()
+                state = await self.in_detector(finder.detection_step, loop_start)
+                if state is None:
+                    await asyncio.sleep(0.1)  # Capture failed - retry shortly
+                    continue
+                await self.in_detector(finder.finish_frame, state, loop_start)
+                self.steps += 1
+                await self.wait(finder.frame_governor.frame_delay(state, time.time() - loop_start,
+                                                                      finder.loop_cpu_time))
+        except Exception as e:
+            print(f"\n❌ Detection error: {e}")
+        finally:
+            self.skill_task.cancel()
+            await asyncio.gather(self.skill_task, return_exceptions=True)
+            await self.in_detector(finder.end_hunting)
+
+    async def stop_hunting(self):
+        """Cancel the session - the running step completes, then end_hunting runs"""
+        if self.detection_task is not None and not self.detection_task.done():
+            self.detection_task.cancel()
+            await asyncio.gather(self.detection_task, return_exceptions=True)
+
+    async def press_at(self, due, key):
+        """Press a skill key at its due time on the input thread (dropped if it can't start within the deadline)"""
+        await asyncio.sleep(max(0.0, due - self.loop.time()))
+        lateness = self.loop.time() - due
+        if lateness > self.action_deadline:
+            self.dropped_presses += 1
+            return False
+        self.max_lateness = max(self.max_lateness, lateness)
+        await self.loop.run_in_executor(self.input, self.finder.press_key, key, 'skill')
+        self.presses += 1
+        return True
+
+    async def skill_rotation(self):
+        """Skill rotation with scheduled key presses while hunting is active"""
+        finder = self.finder
+        print(f"⌨️ Starting keyboard automation: {SKILL_SEQUENCE} sequence (scheduled)")
+        due = self.loop.time()
+        try:
+            while True:
+                if not finder.keyboard_active or finder.paused:
+                    await asyncio.sleep(0.1)
+                    due = self.loop.time()
+                    continue
+                for key in SKILL_SEQUENCE:
+                    if not finder.keyboard_active or finder.paused:
+                        break
+                    try:
+                        await self.press_at(due, key)
+                    except Exception as e:
+                        print(f"❌ Key press failed: {e}")
+                    due += KEY_INTERVAL
+                due += SEQUENCE_GAP
+                if self.loop.time() - due > self.action_deadline:
+                    due = self.loop.time()  # Fell behind (long stall) - restart the rotation instead of catching up
+                await asyncio.sleep(max(0.0, due - self.loop.time()))
+        finally:
+            print("⌨️ Keyboard automation stopped")
+
+    def stats_summary(self):
+        """One-line scheduling report for the stats output"""
+        return (f"🧵 Orchestrator: {self.steps} steps | skills {self.presses} pressed, {self.dropped_presses} dropped "
+                f"(max {self.max_lateness * 1000:.0f}ms late) | {self.hotkey_count} hotkeys")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+I-HNT Hunt State Machine
+The hunting states the detection loop moves through, what each of them has
+to check, and how long the loop spends in each.
+
+    acquire   Mobs in the hunting zone - select and click a target
+    explore   Nothing in the zone - walk / turn the camera
+    engage    Locked on a target with red health
+    finish    Kill confirmation (the target is almost dead)
+    dead      Death window showing
+    paused    CapsLock pause
+
+Every state declares how often each per-frame check may run (seconds
+between runs, 0 = every frame, None = never). A check a state doesn't list
+runs every frame, so only the throttling has to be spelled out - e.g. the
+full-screen death window check once a second while hunting instead of every
+frame. Entering a new state emits a transition event (previous, state,
+dwell, time) to every listener and adds the dwell to the per-state totals.
+"""
+
+import time
+from collections import Counter, defaultdict
+
+STATES = ('acquire', 'explore', 'engage', 'finish', 'dead', 'paused')
+
+DEFAULT_CHECK_INTERVALS = {
+    'acquire': {'death': 1.0},
+    'explore': {'death': 1.0},
+    'engage': {'death': 2.0},
+    'finish': {'death': 2.0},
+    'dead': {'death': 0.0},
+    'paused': {'death': None, 'health': None, 'kill': None},
+}
+
+
+class HuntStateMachine:
+    """Current state + transition events, dwell times and per-state check scheduling"""
+
+    def __init__(self, check_intervals=None, clock=time.time):
+        overrides = check_intervals or {}
+        self.check_intervals = {
+            state: dict(DEFAULT_CHECK_INTERVALS.get(state, {}), **overrides.get(state, {}))
+            for state in set(STATES) | set(overrides)
+        }
+        self.clock = clock
+        self.listeners = []                   # callback(previous, state, dwell, now)
+
+        self.state = None
+        self.since = None
+        self.last_run = {}                    # Check → time it last ran
+
+        # Statistics
+        self.dwell = defaultdict(float)
+        self.transitions = Counter()          # (previous, state) → count
+        self.runs = Counter()
+        self.skips = Counter()
+
+    def reset(self):
+        """Start a new session (dwell totals and counters are kept)"""
+        self.state = None
+        self.since = None
+        self.last_run = {}
+
+    def on_transition(self, callback):
+        self.listeners.append(callback)
+
+    def enter(self, state, now=None):
+        """Move to a state - emits a transition event if it differs from the current one"""
+        if state == self.state:
+            return False
+        now = self.clock() if now is None else now
+        previous = self.state
+        dwell = now - self.since if self.since is not None else 0.0
+        if previous is not None:
+            self.dwell[previous] += dwell
+            self.transitions[(previous, state)] += 1
+        self.state, self.since = state, now
+        for callback in self.listeners:
+            callback(previous, state, dwell, now)
+        return True
+
+    def should_run(self, check, now=None):
+        """Whether the current state wants this check now (records the run if so)"""
+        now = self.clock() if now is None else now
+        interval = self.check_intervals.get(self.state, {}).get(check, 0.0)
+        if interval is None or (interval > 0 and now - self.last_run.get(check, -interval) < interval):
+            self.skips[check] += 1
+            return False
+        self.last_run[check] = now
+        self.runs[check] += 1
+        return True
+
+    def dwell_time(self, now=None):
+        """Seconds spent in the current state so far"""
+        if self.since is None:
+            return 0.0
+        return (self.clock() if now is None else now) - self.since
+
+    def stats_summary(self, now=None):
+        """One-line state report for the stats output"""
+        dwell = dict(self.dwell)
+        if self.state is not None:
+            dwell[self.state] = dwell.get(self.state, 0.0) + self.dwell_time(now)
+        total = sum(dwell.values()) or 1.0
+        shares = ", ".join(f"{state} {seconds / total:.0%}" for state, seconds in
+                           sorted(dwell.items(), key=lambda item: -item[1]))
+        checks = ", ".join(f"{check} {self.runs[check]}/{self.runs[check] + self.skips[check]}"
+                           for check in sorted(set(self.runs) | set(self.skips)))
+        return (f"🗺️ States: {self.state} | {sum(self.transitions.values())} transitions | time {shares or '-'} | "
+                f"checks run {checks or '-'}")
@@ -11,6 +11,8 @@ GitHub: https://github.com/Hardyz2k2
 Version: Production Ready
 """
 
+import asyncio
+import json
 import time
 import cv2
 import numpy as np
@@ -22,6 +24,28 @@ import torch
 from pathlib import Path
 from pynput import keyboard
 from pynput.keyboard import Key, Listener
+from inference_worker import InferenceWorker
+from mob_gate import MobGate
+from frame_governor import FrameGovernor
+from cpu_tuner import get_cpu_plan, apply_torch_threads, pin_current_thread, describe_plan
+from frame_preprocess import FramePreprocessor
+from session_recorder import SessionRecorder
+from exploration_planner import ExplorationPlanner
+from motion_predictor import MotionPredictor
+from target_ranker import TargetRanker, SpatialGrid
+from kill_confirmer import KillConfirmer, DYING, DEAD
+from session_analytics import AnalyticsStore
+from metrics_server import HuntingMetrics, MetricsServer
+from stall_watchdog import StallWatchdog
+from model_manager import ModelManager
+from hard_example_miner import HardExampleMiner
+from roi_stats import RoiStats, stats_summary as ui_stats_summary
+from death_dialog_locator import DeathDialogLocator
+from hunt_orchestrator import HuntOrchestrator
+from hunt_state_machine import HuntStateMachine
+from detection_cache import DetectionCache
+from tiled_inference import TiledDetector
+from memory_monitor import BufferPool, MemorySampler
 
 class IHNTMobFinder:
     def __init__(self):
@@ -70,6 +94,12 @@ class IHNTMobFinder:
         self.min_movement_distance = 400  # Minimum distance from character for effective movement
         self.use_edge_positions = True  # Use screen edge positions for maximum movement
         
+        # Heatmap-guided exploration - walk and turn the camera toward where mobs were seen
+        self.smart_exploration = True  # Set to False to use the fixed 8-direction sweep and alternating camera
+        self.camera_degrees_per_drag = 30.0  # Approximate view rotation of one camera drag
+        self.exploration_planner = ExplorationPlanner((self.screen_width, self.screen_height),
+                                                      camera_degrees_per_drag=self.camera_degrees_per_drag)
+        
         # Pet detection statistics  
         self.pets_detected_count = 0  # Track total pets encountered
         self.pets_in_current_session = 0  # Track pets in current hunting session
@@ -79,6 +109,10 @@ class IHNTMobFinder:
         self.hotkey_listener = None
         self.hotkeys_active = False
         
+        # asyncio orchestrator - detection steps, scheduled skill presses and hotkeys on one event loop
+        self.use_async_orchestrator = False  # Set to True to replace the detection/keyboard threads (hunt_orchestrator.py)
+        self.orchestrator = None
+        
         # Death detection system
         self.player_dead = False
         self.death_detection_active = True
@@ -88,6 +122,11 @@ class IHNTMobFinder:
         self.auto_res_scroll_slot = "0"  # Default slot for auto-res scroll
         self.death_debug_mode = False  # Enable debug output for death detection
         
+        # Death dialog locator - template-matches the dialog buttons (capture them with death_dialog_locator.py --capture)
+        self.locate_death_dialog = True  # Set to False to always use the pixel-ratio check and fixed button offsets
+        self.death_template_dir = "templates"
+        self.death_locator = None
+        
         # I-HNT AI optimized settings for speed
         self.conf_threshold = 0.25      # Confidence threshold
         self.iou_threshold = 0.45       # IoU threshold for NMS
@@ -109,10 +148,143 @@ class IHNTMobFinder:
         # Targeting settings
         self.target_offset_y = 10  # Small offset to click mob body
         
+        # Latency-compensated clicks - lead moving mobs by the capture-to-click delay
+        self.predict_motion = True  # Set to False to click the raw detected position
+        self.motion_predictor = MotionPredictor()
+        self.last_capture_time = None
+        
+        # Target ranking - nearest, most confident, most valuable mob first; avoid spots where pets were clicked
+        self.smart_target_ranking = True  # Set to False to take mobs in YOLO's output order
+        self.target_class_values = {}     # Optional score bonus per class id, e.g. {1: 0.5} for elites
+        self.target_ranker = TargetRanker(self.hunting_zone_radius, class_values=self.target_class_values)
+        
+        # Fast kill confirmation - bbox pixel diff + HP trend, next target picked while the current one is dying
+        self.fast_kill_confirm = False  # Set to True to confirm kills from the sprite/HP trend before the red run vanishes
+        self.preselect_max_age = 1.5   # Seconds a pre-selected next target stays valid
+        self.kill_confirmer = KillConfirmer()
+        self.last_health_status = None
+        self.preselected_target = None
+        self.preselected_at = 0.0
+        
         # Performance settings
         self.use_gpu = torch.cuda.is_available()
         self.fps_target = 30  # Target FPS for real-time processing
         
+        # Adaptive frame-rate governor - per-state loop rates capped by a CPU budget
+        self.state_frame_rates = {
+            'acquire': self.fps_target,  # Mobs in zone - react fast
+            'explore': 10,               # No mobs - walking around
+            'engage': 5,                 # Red health locked - only health checks needed
+            'finish': 10,                # Locked target almost dead - confirm the kill quickly
+            'dead': 1,                   # Waiting for the death window
+            'paused': 0.5                # CapsLock paused - near idle
+        }
+        self.cpu_budget = None  # Max fraction of one CPU core the loop's CPU time may use (None = no cap)
+        self.loop_cpu_start = 0.0
+        self.loop_cpu_time = None  # Process CPU seconds of the last iteration (sleeps and waits excluded)
+        self.frame_governor = FrameGovernor(self.state_frame_rates, self.cpu_budget)
+        
+        # Hunting state machine - transition events, dwell times and how often each state runs its checks
+        self.state_check_intervals = {
+            'acquire': {'death': 1.0},  # Full-screen death window check at most once a second while hunting
+            'explore': {'death': 1.0},
+            'engage': {'death': 2.0},   # Fighting - health every frame, death window every 2s
+            'finish': {'death': 2.0},
+            'dead': {'death': 0.0},     # Waiting for the death window - check it every frame
+        }
+        self.hunt_state = HuntStateMachine(self.state_check_intervals)
+        self.hunt_state.on_transition(self.on_state_change)
+        
+        # CPU thread/core planning (benchmarked once per host by cpu_tuner.py, then cached)
+        self.auto_tune_cpu = False  # Set to True to apply the fastest measured thread + pinning setup
+        self.cpu_plan = None
+        
+        # Fused preprocessing - letterbox the raw BGRA capture straight into a reusable model tensor
+        self.fused_preprocess = False  # Set to True to skip the per-frame RGB copies and ultralytics letterboxing
+        self.inference_imgsz = 640     # Model input size (long side)
+        self.preprocessor = None
+        
+        # UI check statistics - each health/pet/death capture is reduced to one histogram, thresholds are lookups
+        self.ui_stats = {'health': RoiStats(red=True), 'pet': RoiStats(), 'death': RoiStats()}
+        
+        # Session recording (frames + detections + states + input actions for offline replay)
+        self.record_session = False  # Set to True to record every hunting session to recordings/
+        self.recording_dir = "recordings"
+        self.recording_downscale = 0.5  # Store frames at half resolution
+        self.session_recorder = None
+        
+        # Long-term analytics (kills, deaths, pet clicks, state dwell, loop latency) - report with session_analytics.py
+        self.record_analytics = True  # Set to False to keep no statistics across sessions
+        self.analytics_db = "ihnt_analytics.db"
+        self.analytics = None
+        
+        # Live metrics - Prometheus text format on a local port (counters are always kept, the server is optional)
+        self.serve_metrics = False  # Set to True to expose http://127.0.0.1:<metrics_port>/metrics while hunting
+        self.metrics_host = "127.0.0.1"
+        self.metrics_port = 9109
+        self.metrics = HuntingMetrics()
+        self.metrics_server = None
+        
+        # Stall watchdog - recovers stuck health locks, death windows and empty exploration without F4
+        self.use_watchdog = False  # Set to True for unattended sessions (fights past the fight_lock limit get unlocked)
+        self.watchdog_limits = {}  # Seconds per condition, e.g. {'fight_lock': 60, 'no_detections': 120}
+        self.watchdog_dir = "watchdog"  # Screenshots taken when a stall is recovered
+        self.watchdog = None
+        
+        # Hard example mining - keep frames the model struggles with for labeling (see dataset_builder.py)
+        self.mine_hard_examples = False  # Set to True to save low-confidence, pet and missed-mob frames
+        self.hard_example_dir = "hard_examples"
+        self.hard_example_band = 0.15    # Detections below conf_threshold + band count as low confidence
+        self.hard_example_max_mb = 500   # Oldest examples are deleted above this store size
+        self.hard_example_miner = None
+        self.last_frame = None
+        
+        # Out-of-process inference (keeps YOLO off the hotkey/keyboard GIL)
+        self.use_inference_worker = False  # Set to True to run YOLO in a separate worker process
+        self.inference_worker = None
+        self.model_path = None
+        self.model_config = "model_config.json"  # Written by model_benchmark.py - used instead of yolov8n.pt when present
+        
+        # Hot model reload - new weights are loaded, warmed up and validated in the background, then swapped between frames
+        self.watch_model_file = True  # Set to False to reload only with F5
+        self.model_manager = None
+        
+        # Detection cascade - cheap "any mob present?" gate before full YOLO (train with mob_gate.py)
+        self.use_cascade_gate = False  # Set to True to skip YOLO when the hunting zone looks empty
+        self.cascade_gate_path = "mob_gate.npz"
+        self.cascade_audit_interval = 10  # Run full YOLO on every 10th skipped frame to count gate misses
+        self.cascade_collect_backgrounds = False  # Save empty-zone frames as gate training backgrounds
+        self.cascade_background_dir = "gate_backgrounds"
+        self.cascade_background_interval = 30.0  # Seconds between saved background frames
+        self.cascade_max_backgrounds = 200
+        self.mob_gate = None
+        self.cascade_skips_since_audit = 0
+        
+        # Detection cache - reuse YOLO results for frames whose fingerprint (dHash) was already seen
+        self.cache_detections = False  # Set to True for replay/benchmark/simulator runs (ignored live - see offline_session)
+        self.detection_cache_size = 256
+        self.offline_session = False   # Set by the simulator/replay tools - frames repeat exactly, never the live game
+        self.detection_cache = None
+        self.last_background_save = 0.0
+        
+        # Tiled inference - large zones (bow) are cut into overlapping native-resolution tiles, batched in one call
+        self.tiled_inference = False  # Set to True to find small distant mobs in large zones without a bigger model
+        self.tile_min_zone_radius = 400   # Only tile zones at least this large (bow, large custom areas)
+        self.tile_min_mob_pixels = 12     # Height of the smallest (most distant) mob at native resolution
+        self.tile_budget_ms = 200.0       # Latency budget per frame for the tile cost model
+        self.tiled_detector = None
+        
+        # Long-session mode - pooled capture buffers + memory growth sampling for overnight hunting
+        self.long_session_mode = False  # Set to True to keep frame buffers bounded and warn about memory growth
+        self.frame_pool_slots = 4            # Capture buffers in the ring (a frame is valid for this many ticks)
+        self.memory_sample_interval = 60.0   # Seconds between memory samples
+        self.memory_warmup = 300.0           # Baseline is taken after this long (model, caches and pools settled)
+        self.memory_growth_warn_mb = 64.0    # Warn each time RSS grows another 64MB past the baseline
+        self.trace_memory = False            # Set to True to attribute growth to subsystems with tracemalloc (slower)
+        self.memory_log = "memory_log.csv"   # Every sample is appended here (None = no log)
+        self.frame_pool = None
+        self.memory_sampler = None
+        
         print("🎮 I-HNT - Real-Time Gaming Assistant")
         print("=" * 50)
         print("☕ Coffee Status: Ready for long gaming sessions")
@@ -136,6 +308,10 @@ class IHNTMobFinder:
         start_time = time.time()
         
         try:
+            # A benchmark config (model_benchmark.py) carries the model path plus its tuned settings
+            if str(model_path).endswith('.json'):
+                model_path = self.apply_model_config(model_path)
+            
             # Check if custom trained model exists, otherwise use pretrained
             custom_model_exists = Path(model_path).exists()
             
@@ -153,6 +329,7 @@ class IHNTMobFinder:
             
             # Load model
             self.model = YOLO(model_path)
+            self.model_path = model_path
             
             # Get model info
             model_info = self.model.info() if hasattr(self.model, 'info') else None
@@ -169,9 +346,10 @@ class IHNTMobFinder:
                     print("   📖 See README_YOLO.md for training instructions")
             
             # Optimize for inference speed
-            if self.use_gpu:
-                self.model.to('cuda')
+            if self.move_to_gpu(self.model, model_path):
                 print("🔥 Model loaded on GPU for maximum speed")
+            elif self.use_gpu:
+                print("💻 Exported model - runs on the device its runtime picks")
             else:
                 print("💻 Model loaded on CPU")
                 
@@ -184,6 +362,26 @@ class IHNTMobFinder:
             test_results = self.model(dummy_frame, conf=0.1, verbose=False)
             print(f"✅ Model test successful - ready for detection")
             
+            # Preallocate the fused BGRA → tensor preprocessing buffers
+            if self.fused_preprocess:
+                self.setup_preprocessor()
+            
+            # Move inference into a worker process if enabled
+            if self.use_inference_worker:
+                self.start_inference_worker()
+            
+            # Later model updates are hot-swapped instead of requiring a restart
+            if self.model_manager is None:
+                self.model_manager = ModelManager(self.model_path, self.load_model_candidate, self.model_boxes,
+                                                  prestart=self.prepare_model_services,
+                                                  release=self.release_model_services)
+            
+            if self.cache_detections:
+                self.enable_detection_cache()
+            
+            if self.tiled_inference:
+                self.setup_tiled_inference()
+            
             return True
             
         except Exception as e:
@@ -194,6 +392,301 @@ class IHNTMobFinder:
             print("   🔧 Ensure sufficient RAM/GPU memory")
             return False
     
+    def enable_detection_cache(self):
+        """Start caching detections per frame fingerprint (offline sessions only, cleared whenever the model changes)"""
+        if not self.offline_session:
+            print("⚠️ Detection cache is for replay/benchmark/simulator runs only - live frames would get stale boxes")
+            return False
+        if self.detection_cache is None:
+            self.detection_cache = DetectionCache(self.detection_cache_size)
+            print(f"🗃️ Detection cache on: {self.detection_cache_size} frames")
+        else:
+            self.detection_cache.clear()
+        return True
+    
+    def inference_path(self):
+        """Which inference route run_inference() takes - they differ slightly in preprocessing"""
+        if self.use_tiles():
+            return ('tiles', self.tiled_detector.signature(self.hunting_zone_radius))
+        if self.inference_worker is not None and not self.inference_worker.failed:
+            return 'worker'
+        return 'fused' if self.preprocessor is not None else 'model'
+    
+    def detection_settings(self):
+        """Everything besides the frame that changes what the detector returns"""
+        return (str(self.model_path), self.conf_threshold, self.iou_threshold, self.inference_imgsz,
+                self.max_detections, self.inference_path())
+    
+    def create_tiled_detector(self):
+        """Tile planner for the game capture area (cost model not calibrated yet)"""
+        frame_height = self.screen_height - self.margin_top - self.margin_bottom
+        frame_width = self.screen_width - self.margin_left - self.margin_right
+        return TiledDetector(
+            (frame_width, frame_height),
+            (self.screen_width // 2 - self.margin_left, self.screen_height // 2 - self.margin_top),
+            imgsz=self.inference_imgsz,
+            min_mob_pixels=self.tile_min_mob_pixels,
+            budget_ms=self.tile_budget_ms
+        )
+    
+    def setup_tiled_inference(self):
+        """Calibrate the tile cost model for the current model and capture area"""
+        try:
+            self.tiled_detector = self.create_tiled_detector()
+            base_ms, per_image_ms = self.tiled_detector.calibrate(self.model_batch_boxes)
+            print(f"🧩 Tiled inference: {base_ms:.0f}ms + {per_image_ms:.0f}ms per {self.inference_imgsz}px tile")
+            print(f"   Bow zone: {self.tiled_detector.describe(self.detection_area_presets['bow'])}")
+            return True
+        except Exception as e:
+            print(f"❌ Tiled inference setup failed: {e} - using full-frame inference")
+            self.tiled_detector = None
+            return False
+    
+    def use_tiles(self):
+        """Whether the current hunting zone is large enough to tile"""
+        return self.tiled_detector is not None and self.hunting_zone_radius >= self.tile_min_zone_radius
+    
+    def apply_model_config(self, config_path):
+        """Apply imgsz/conf/iou from a model_benchmark.py config, returns its model path"""
+        with open(config_path) as f:
+            config = json.load(f)
+        self.inference_imgsz = int(config.get('imgsz', self.inference_imgsz))
+        self.conf_threshold = float(config.get('conf', self.conf_threshold))
+        self.iou_threshold = float(config.get('iou', self.iou_threshold))
+        benchmark = config.get('benchmark', {})
+        print(f"📋 Model config {config_path}: imgsz {self.inference_imgsz} | conf {self.conf_threshold} | "
+              f"iou {self.iou_threshold}" + (f" | benchmarked p95 {benchmark['p95_ms']:.0f}ms, "
+                                              f"recall {benchmark['recall']:.0%}" if benchmark else ""))
+        return config['model']
+    
+    def resolve_model_path(self, model_path):
+        """Model file load_yolo_model() will end up loading for model_path (config model, or the pretrained fallback)"""
+        try:
+            if str(model_path).endswith('.json'):
+                with open(model_path) as f:
+                    model_path = json.load(f)['model']
+        except Exception as e:
+            print(f"⚠️ Could not read model config {model_path}: {e}")
+            return "yolov8n.pt"
+        return model_path if Path(model_path).exists() else "yolov8n.pt"
+    
+    def load_model_candidate(self, model_path):
+        """Load a replacement model on the current device (runs on the model manager's thread)"""
+        model = YOLO(model_path)
+        self.move_to_gpu(model, model_path)
+        return model
+    
+    def move_to_gpu(self, model, model_path):
+        """Move a PyTorch (.pt) model to CUDA - exported models (ONNX, OpenVINO, ...) can't be moved"""
+        if not self.use_gpu or not str(model_path).endswith('.pt'):
+            return False
+        model.to('cuda')
+        return True
+    
+    def request_model_reload(self):
+        """Reload the model file in the background and swap it in when it validates"""
+        if self.model_manager is None:
+            print("⚠️ No model loaded yet - nothing to reload")
+            return
+        print(f"\n🔄 MODEL RELOAD requested: {self.model_manager.model_path}")
+        self.model_manager.request_reload()
+    
+    def prepare_model_services(self, model_path, model):
+        """Start the slow parts of a model swap for a candidate (runs on the model manager's thread)"""
+        services = {}
+        if self.inference_worker is not None:
+            worker = self.create_inference_worker(model_path)
+            if worker.start():
+                services['worker'] = worker
+            else:
+                worker.stop()
+        if self.tiled_detector is not None:
+            tiles = self.create_tiled_detector()
+            tiles.calibrate(lambda images, imgsz: self.model_batch_boxes(images, imgsz, model))
+            services['tiles'] = tiles
+        return services
+    
+    def release_model_services(self, services):
+        """Stop services prepared for a candidate that was never swapped in"""
+        if services.get('worker') is not None:
+            services['worker'].stop()
+    
+    def swap_model(self):
+        """Install the validated replacement model between two frames (only swaps references)"""
+        model, model_path, report, services = self.model_manager.take_ready()
+        self.model = model
+        self.model_path = model_path
+        self.model_manager.reloads += 1
+        if self.detection_cache is not None:
+            self.detection_cache.clear()  # Same path, different weights
+        if self.fused_preprocess:
+            self.setup_preprocessor()  # The new model may use a different stride (buffer allocation only)
+        if self.tiled_detector is not None and 'tiles' in services:
+            self.tiled_detector = services['tiles']  # Calibrated against the new weights in the background
+        if self.inference_worker is not None:
+            old_worker, self.inference_worker = self.inference_worker, services.get('worker')
+            threading.Thread(target=old_worker.stop, name="worker-stop", daemon=True).start()
+            if self.inference_worker is None:
+                print("⚠️ Replacement inference worker did not start - using in-process inference")
+        print(f"🔁 MODEL SWAPPED: {model_path} (recall vs previous {report['recall']:.0%}, "
+              f"{report['latency_ms']:.0f}ms/frame)")
+    
+    def apply_cpu_tuning(self, model_path="yolov8n.pt"):
+        """Load (or benchmark) the per-host CPU plan and apply torch thread counts"""
+        if self.use_gpu:
+            print("🔥 GPU inference - skipping CPU thread tuning")
+            return False
+        
+        print("\n🧪 Loading CPU thread plan for this host...")
+        try:
+            plan = get_cpu_plan(model_path)
+        except Exception as e:
+            print(f"❌ CPU tuning failed: {e}")
+            return False
+        
+        if plan is None:
+            print("⚠️ No CPU plan available - using torch defaults")
+            return False
+        
+        self.cpu_plan = plan
+        apply_torch_threads(plan['intra_op_threads'], plan['inter_op_threads'])
+        print(f"✅ CPU plan applied: {describe_plan(plan)} (p95 {plan['p95_ms']:.1f}ms)")
+        return True
+    
+    def pin_thread(self, *roles):
+        """Pin the calling thread to the planned cores for the given roles"""
+        if not self.cpu_plan or not self.cpu_plan.get('pin_threads'):
+            return False
+        
+        cores = sorted({core for role in roles for core in self.cpu_plan.get(f'{role}_cores', [])})
+        if pin_current_thread(cores):
+            print(f"📌 {threading.current_thread().name} pinned to cores {cores} ({'/'.join(roles)})")
+            return True
+        return False
+    
+    def setup_preprocessor(self):
+        """Allocate the reusable model input tensor for the game capture area"""
+        frame_height = self.screen_height - self.margin_top - self.margin_bottom
+        frame_width = self.screen_width - self.margin_left - self.margin_right
+        
+        try:
+            self.preprocessor = FramePreprocessor(
+                (frame_height, frame_width),
+                imgsz=self.inference_imgsz,
+                stride=int(max(getattr(self.model.model, 'stride', [32]))),
+                device='cuda' if self.use_gpu else 'cpu'
+            )
+            print(f"⚡ Fused preprocessing: {frame_width}x{frame_height} BGRA → "
+                  f"{self.preprocessor.input_width}x{self.preprocessor.input_height} tensor (reused every frame)")
+            return True
+        except Exception as e:
+            print(f"❌ Fused preprocessing setup failed: {e} - using standard preprocessing")
+            self.preprocessor = None
+            self.fused_preprocess = False
+            return False
+    
+    def create_inference_worker(self, model_path):
+        """Worker handle for the game capture area (not started yet)"""
+        frame_height = self.screen_height - self.margin_top - self.margin_bottom
+        frame_width = self.screen_width - self.margin_left - self.margin_right
+        return InferenceWorker(
+            model_path,
+            (frame_height, frame_width),
+            use_gpu=self.use_gpu,
+            max_det=self.max_detections,
+            cpu_plan=self.cpu_plan
+        )
+    
+    def start_inference_worker(self):
+        """Start the out-of-process YOLO worker for the game capture area"""
+        worker = self.create_inference_worker(self.model_path)
+        try:
+            if worker.start():
+                self.inference_worker = worker
+                return True
+        except Exception as e:
+            print(f"❌ Failed to start inference worker: {e}")
+        
+        worker.stop()
+        print("💻 Falling back to in-process inference")
+        return False
+    
+    def shutdown_inference_worker(self):
+        """Stop the inference worker process if running"""
+        if self.inference_worker is not None:
+            self.inference_worker.stop()
+            self.inference_worker = None
+    
+    def load_mob_gate(self):
+        """Load the trained cascade gate (tier 1 of detection)"""
+        if not Path(self.cascade_gate_path).exists():
+            print(f"⚠️ Cascade gate not found: {self.cascade_gate_path} - running full YOLO on every frame")
+            print("   💡 Train one with: python mob_gate.py --monsters monsters_images --backgrounds gate_backgrounds")
+            return False
+        
+        try:
+            self.mob_gate = MobGate.load(self.cascade_gate_path)
+            print(f"🚦 Cascade gate loaded: {self.cascade_gate_path} (threshold {self.mob_gate.threshold:.2f})")
+            return True
+        except Exception as e:
+            print(f"❌ Failed to load cascade gate: {e}")
+            return False
+    
+    def hunting_zone_box(self, frame):
+        """Hunting zone bounding box (left, top, right, bottom) in frame coordinates"""
+        char_x = self.screen_width // 2 - self.margin_left
+        char_y = self.screen_height // 2 - self.margin_top
+        radius = self.hunting_zone_radius
+        frame_height, frame_width = frame.shape[:2]
+        
+        return (max(0, char_x - radius), max(0, char_y - radius),
+                min(frame_width, char_x + radius), min(frame_height, char_y + radius))
+    
+    def cascade_gate_check(self, frame):
+        """Decide whether full YOLO should run, returns (run_full_pass, is_audit)"""
+        has_candidates, best_score = self.mob_gate.check(frame, self.hunting_zone_box(frame))
+        if has_candidates:
+            return True, False
+        
+        # Periodically run YOLO anyway to measure how many mobs the gate misses
+        self.cascade_skips_since_audit += 1
+        if self.cascade_audit_interval and self.cascade_skips_since_audit >= self.cascade_audit_interval:
+            self.cascade_skips_since_audit = 0
+            return True, True
+        
+        if self.debug_detections:
+            print(f"🚦 DEBUG: Cascade gate skipped YOLO (best cell {best_score:.2f} < {self.mob_gate.threshold:.2f})")
+        return False, False
+    
+    def count_zone_mobs(self, detections):
+        """Count detections inside the hunting zone (no debug output)"""
+        char_x, char_y = self.screen_width // 2, self.screen_height // 2
+        count = 0
+        for detection in detections:
+            x, y = detection['screen_position']
+            distance = ((x - char_x) ** 2 + (y - char_y) ** 2) ** 0.5
+            if self.character_protection_radius < distance <= self.hunting_zone_radius:
+                count += 1
+        return count
+    
+    def save_gate_background(self, frame):
+        """Save an empty-zone frame for cascade gate training (rate limited)"""
+        now = time.time()
+        if now - self.last_background_save < self.cascade_background_interval:
+            return
+        self.last_background_save = now
+        
+        try:
+            background_dir = Path(self.cascade_background_dir)
+            background_dir.mkdir(exist_ok=True)
+            if len(list(background_dir.glob("*.jpg"))) >= self.cascade_max_backgrounds:
+                return
+            filename = background_dir / f"background_{int(now)}.jpg"
+            cv2.imwrite(str(filename), cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR) if frame.shape[2] == 4 else frame)
+            print(f"   🌄 Saved gate background: {filename}")
+        except Exception as e:
+            print(f"   ⚠️ Failed to save gate background: {e}")
+    
     def detect_health_bar(self):
         """Detect if there's a health bar visible at top center (mob selected) and check for red health line"""
         try:
@@ -208,31 +701,14 @@ class IHNTMobFinder:
             # Capture health bar area
             with mss.mss() as sct:
                 health_screenshot = sct.grab(health_bar_area)
-            health_img = np.array(health_screenshot)
-            
-            # Convert to RGB for processing
-            health_rgb = cv2.cvtColor(health_img, cv2.COLOR_BGRA2RGB)
-            
-            # More focused red detection for actual health bars
-            # Convert to HSV for better red detection
-            hsv = cv2.cvtColor(health_rgb, cv2.COLOR_RGB2HSV)
-            
-            # More restrictive red color ranges to avoid false positives
-            # First red range (around 0 degrees) - more focused
-            lower_red1 = np.array([0, 80, 80])      # Higher saturation/value
-            upper_red1 = np.array([10, 255, 255])   # Narrower hue range
+            health_img = np.asarray(health_screenshot)  # Zero-copy view - measure() only reads it
             
-            # Second red range (around 180 degrees) - more focused
-            lower_red2 = np.array([170, 80, 80])    # Higher saturation/value  
-            upper_red2 = np.array([180, 255, 255])  # Narrower hue range
-            
-            # Create masks for red detection
-            mask1 = cv2.inRange(hsv, lower_red1, upper_red1)
-            mask2 = cv2.inRange(hsv, lower_red2, upper_red2)
-            red_mask = mask1 + mask2
+            # One pass over the raw BGRA capture: gray histogram + red count
+            # (hue 0-10 / 170-180 with saturation and value >= 80 - restrictive to avoid false positives)
+            stats = self.ui_stats['health'].measure(health_img)
             
             # Count red pixels (health line presence)
-            red_pixel_count = cv2.countNonZero(red_mask)
+            red_pixel_count = stats.red_pixels
             
             # MUCH higher threshold - health bars should have significant red pixels
             # With 200x40 area = 8000 total pixels, a health bar should have 100-1000 red pixels
@@ -243,22 +719,22 @@ class IHNTMobFinder:
             has_red_health = (red_pixel_count > red_health_threshold) and (red_pixel_count < max_reasonable_red)
             
             # Check for health bar UI presence by looking for health bar patterns
-            gray = cv2.cvtColor(health_rgb, cv2.COLOR_RGB2GRAY)
-            
             # Look for horizontal health bar patterns (dark background with bright borders)
-            dark_mask = gray < 60   # Darker threshold for health bar backgrounds
-            bright_mask = gray > 180  # Brighter threshold for health bar borders/text
-            dark_pixels = np.sum(dark_mask)
-            bright_pixels = np.sum(bright_mask)
+            dark_pixels = stats.below(60)     # Darker threshold for health bar backgrounds
+            bright_pixels = stats.above(180)  # Brighter threshold for health bar borders/text
+            
+            # Health bar UI visible (mob selected - alive or just killed), whatever its red fill
+            bar_visible = (dark_pixels > 50) and (bright_pixels > 10)
             
             # Health bar present if we have reasonable UI pattern AND reasonable red pixels
-            has_health_bar = has_red_health and (dark_pixels > 50) and (bright_pixels > 10)
+            has_health_bar = has_red_health and bar_visible
             
             # Debug output with filtering for noise
             if red_pixel_count > max_reasonable_red:
                 print(f"   🚫 TOO MUCH RED: {red_pixel_count} pixels - likely UI noise, ignoring")
                 has_health_bar = False
                 has_red_health = False
+                bar_visible = False
             elif has_health_bar and has_red_health:
                 print(f"   ❤️ HEALTH DETECTED: Mob alive with {red_pixel_count} red pixels - PAUSING DETECTION")
             elif red_pixel_count > 0 and red_pixel_count <= red_health_threshold:
@@ -267,16 +743,20 @@ class IHNTMobFinder:
             return {
                 'has_health_bar': has_health_bar,
                 'has_red_health': has_red_health,
+                'bar_visible': bar_visible,
                 'red_pixel_count': red_pixel_count
             }
             
         except Exception as e:
             print(f"   ⚠️ Health bar detection error: {e}")
-            return {'has_health_bar': False, 'has_red_health': False}
+            return {'has_health_bar': False, 'has_red_health': False, 'bar_visible': False}
     
     def detect_player_death(self):
         """Detect if player has died by looking for confirmation window in center of screen"""
         try:
+            if self.death_locator is not None:
+                return self.locate_death_buttons()
+            
             # Death confirmation window appears in center of screen
             # Use a much larger area to catch the window reliably
             death_window_area = {
@@ -289,27 +769,15 @@ class IHNTMobFinder:
             # Capture death window area
             with mss.mss() as sct:
                 death_screenshot = sct.grab(death_window_area)
-            death_img = np.array(death_screenshot)
+            death_img = np.asarray(death_screenshot)
             
-            # Convert to RGB for processing
-            death_rgb = cv2.cvtColor(death_img, cv2.COLOR_BGRA2RGB)
-            
-            # Convert to grayscale for analysis
-            gray = cv2.cvtColor(death_rgb, cv2.COLOR_RGB2GRAY)
+            # Gray histogram of the raw BGRA capture - every ratio below is a lookup
+            stats = self.ui_stats['death'].measure(death_img)
             
             # VERY aggressive detection - look for ANY dark areas
-            very_dark_mask = gray < 60
-            dark_mask = gray < 100
-            bright_mask = gray > 150
-            
-            very_dark_pixels = np.sum(very_dark_mask)   # Very dark pixels
-            dark_pixels = np.sum(dark_mask)             # Dark pixels
-            bright_pixels = np.sum(bright_mask)         # Bright pixels (text)
-            
-            total_pixels = gray.shape[0] * gray.shape[1]
-            very_dark_ratio = very_dark_pixels / total_pixels
-            dark_ratio = dark_pixels / total_pixels
-            bright_ratio = bright_pixels / total_pixels
+            very_dark_ratio = stats.ratio_below(60)   # Very dark pixels
+            dark_ratio = stats.ratio_below(100)       # Dark pixels
+            bright_ratio = stats.ratio_above(150)     # Bright pixels (text)
             
             # Balanced detection - strict enough to avoid false positives, sensitive enough for real deaths
             has_dark_area = very_dark_ratio > 0.08 or dark_ratio > 0.2
@@ -332,6 +800,62 @@ class IHNTMobFinder:
             print(f"   ⚠️ Death detection error: {e}")
             return False
     
+    def start_death_locator(self):
+        """Load the death dialog button templates (the pixel-ratio check stays in use without them)"""
+        locator = DeathDialogLocator(self.death_template_dir, (self.screen_width, self.screen_height))
+        if not locator.ready:
+            print(f"💡 No death dialog templates in {self.death_template_dir}/ - run "
+                  f"'python death_dialog_locator.py --capture' while the dialog shows (using the pixel-ratio check)")
+            return
+        self.death_locator = locator
+        print(f"💀 Death dialog locator ready - matching buttons in a {locator.search_area['width']}x"
+              f"{locator.search_area['height']} area")
+    
+    def locate_death_buttons(self, verbose=True):
+        """Template-match the death dialog buttons on the button-row area, True when both are found"""
+        with mss.mss() as sct:
+            area_img = np.asarray(sct.grab(self.death_locator.search_area))
+        result = self.death_locator.locate(area_img)
+        if result['found'] and verbose:
+            buttons = ", ".join(f"{name} ({x}, {y}) {score:.2f}" for name, (x, y, score) in result['buttons'].items())
+            print(f"💀 PLAYER DEATH DETECTED: Dialog buttons matched in {result['ms']:.1f}ms - {buttons}")
+        return result['found']
+    
+    def death_button_position(self, name):
+        """Where to click a death dialog button - its located position, else the fixed layout offset"""
+        if self.death_locator is not None:
+            position = self.death_locator.button_position(name)
+            if position is None and self.locate_death_buttons(verbose=False):
+                position = self.death_locator.button_position(name)
+            if position is not None:
+                return position
+            print("   ⚠️ Death dialog buttons not located - using the fixed offsets")
+        offset = -150 if name == 'resurrect' else 150  # Left / right side of center
+        return self.screen_width // 2 + offset, self.screen_height // 2 + 200  # Below center
+    
+    def wait_for_death_dialog_close(self, timeout, name, reason):
+        """Wait until the death dialog is gone, clicking the button once more if it stays (False if it never closes)"""
+        if self.death_locator is None:
+            time.sleep(timeout)  # No templates - can't tell when it closes
+            return True
+        
+        start = time.time()
+        clicked_again = False
+        while True:
+            time.sleep(0.1)
+            if not self.locate_death_buttons(verbose=False):
+                print(f"   ✅ Death dialog closed after {time.time() - start:.1f}s")
+                return True
+            if time.time() - start >= timeout:
+                if clicked_again:
+                    print("   ❌ Death dialog still open after clicking twice")
+                    return False
+                button_x, button_y = self.death_locator.button_position(name)
+                print(f"   🔁 Death dialog still open - clicking again at ({button_x}, {button_y})")
+                self.click_at(button_x, button_y, reason=reason)
+                clicked_again = True
+                start = time.time()
+    
     def handle_death_confirmation(self, mode=None):
         """Handle death confirmation window actions based on configured mode"""
         try:
@@ -342,16 +866,16 @@ class IHNTMobFinder:
             
             if mode == "respawn_town":
                 # Mode 1: Respawn at town - click left button and pause app
-                resurrect_button_x = self.screen_width // 2 - 150  # Left side of center
-                resurrect_button_y = self.screen_height // 2 + 200  # Below center
+                resurrect_button_x, resurrect_button_y = self.death_button_position('resurrect')
                 
                 print(f"💀 Mode 1: Clicking 'Resurrect at the specified point' button at ({resurrect_button_x}, {resurrect_button_y})")
-                pyautogui.click(resurrect_button_x, resurrect_button_y)
+                self.click_at(resurrect_button_x, resurrect_button_y, reason='death_resurrect')
                 print("   ✅ Click executed")
                 
                 # Wait for resurrection to complete
-                print("   ⏳ Waiting 3 seconds for resurrection...")
-                time.sleep(3)
+                print("   ⏳ Waiting for resurrection...")
+                if not self.wait_for_death_dialog_close(3, 'resurrect', 'death_resurrect'):
+                    return False
                 
                 # Reset death state before pausing
                 print("🔄 Resetting death state...")
@@ -368,35 +892,35 @@ class IHNTMobFinder:
                 
             elif mode == "wait_help":
                 # Mode 2: Wait for other players - click right button, press F4, use auto-res scroll
-                wait_button_x = self.screen_width // 2 + 150  # Right side of center
-                wait_button_y = self.screen_height // 2 + 200  # Below center
+                wait_button_x, wait_button_y = self.death_button_position('wait_help')
                 
                 print(f"💀 Mode 2: Clicking 'Waiting for other player's help' button at ({wait_button_x}, {wait_button_y})")
-                pyautogui.click(wait_button_x, wait_button_y)
+                self.click_at(wait_button_x, wait_button_y, reason='death_wait_help')
                 print("   ✅ Click executed")
                 
                 # Wait for window to close
-                print("   ⏳ Waiting 2 seconds for window to close...")
-                time.sleep(2)
+                print("   ⏳ Waiting for window to close...")
+                if not self.wait_for_death_dialog_close(2, 'wait_help', 'death_wait_help'):
+                    return False
                 
                 # Press F4 to open inventory/skills
                 print("💀 Pressing F4 to open inventory...")
-                pyautogui.press('f4')
+                self.press_key('f4', reason='death_inventory')
                 time.sleep(1)
                 
                 # Press "0" to use auto-res scroll
                 print("💀 Using auto-res scroll from slot 0...")
-                pyautogui.press('0')
+                self.press_key('0', reason='death_res_scroll')
                 time.sleep(2)
                 
                 # Press F4 again to close inventory
                 print("💀 Pressing F4 to close inventory...")
-                pyautogui.press('f4')
+                self.press_key('f4', reason='death_inventory')
                 time.sleep(1)
                 
                 # Press F1 to switch back to game
                 print("🎮 Pressing F1 to switch back to game...")
-                pyautogui.press('f1')
+                self.press_key('f1', reason='death_return')
                 time.sleep(0.5)
                 
                 print("✨ Auto-res scroll used - continuing hunting as usual")
@@ -411,18 +935,18 @@ class IHNTMobFinder:
         """Determine if we should switch to a new target based on health monitoring ONLY"""
         # Check health bar status immediately - no timeout needed
         health_status = self.detect_health_bar()
+        self.last_health_status = health_status
         
         if health_status['has_health_bar']:
-            if health_status['has_red_health']:
-                # Mob is selected and has red health line - COMPLETELY STOP all mouse actions
-                print(f"   🛑 MOUSE LOCKED: Red health detected ({health_status['red_pixel_count']} pixels) - NO MOUSE MOVEMENT OR CLICKS")
-                self.start_detection_pause()  # Pause detection to avoid jumping
-                return False  # DO NOT switch targets
-            else:
-                # Mob is selected but no red health line - mob is completely dead, resume mouse actions
-                print(f"   ✅ MOUSE UNLOCKED: No red health ({health_status['red_pixel_count']} pixels) - mob dead - resuming mouse actions")
-                self.clear_detection_pause()  # Clear pause when switching
-                return True  # Switch targets immediately
+            # Mob is selected and has red health line - COMPLETELY STOP all mouse actions
+            print(f"   🛑 MOUSE LOCKED: Red health detected ({health_status['red_pixel_count']} pixels) - NO MOUSE MOVEMENT OR CLICKS")
+            self.start_detection_pause()  # Pause detection to avoid jumping
+            return False  # DO NOT switch targets
+        elif health_status.get('bar_visible'):
+            # Mob is selected but no red health line - mob is completely dead, resume mouse actions
+            print(f"   ✅ MOUSE UNLOCKED: No red health ({health_status['red_pixel_count']} pixels) - mob dead - resuming mouse actions")
+            self.clear_detection_pause()  # Clear pause when switching
+            return True  # Switch targets immediately
         else:
             # No health bar visible - no mob selected, mouse can act freely
             print(f"   🆓 MOUSE FREE: No health bar visible - can select new target")
@@ -459,6 +983,16 @@ class IHNTMobFinder:
         """Generate effective movement position with validation to avoid small steps"""
         import math
         
+        if self.smart_exploration:
+            # Head toward the highest expected mob density, away from recently emptied sectors
+            move_pos, heading, distance, guided = self.exploration_planner.choose_move(
+                time.time(), self.min_movement_distance)
+            source = "mob heatmap" if guided else "sweep (no mob history yet)"
+            print(f"   🧭 Direction: {heading:.0f}° from {source}")
+            print(f"   📏 Movement distance: {distance:.0f}px (min: {self.min_movement_distance}px)")
+            print(f"   🎯 Target position: {move_pos} from character ({self.screen_width // 2}, {self.screen_height // 2})")
+            return move_pos
+        
         # Character position (center of screen)
         char_x, char_y = self.screen_width // 2, self.screen_height // 2
         
@@ -533,11 +1067,13 @@ class IHNTMobFinder:
     def adjust_camera_angle(self):
         """Adjust camera angle by right-click dragging left or right"""
         try:
-            import time
-            
             # Get screen center for camera drag
             center_x, center_y = self.screen_width // 2, self.screen_height // 2
             
+            # Turn toward the side with more expected mobs (alternating is the tie-breaker)
+            if self.smart_exploration:
+                self.camera_direction = self.exploration_planner.choose_camera_direction(self.camera_direction)
+            
             # Calculate drag distance (200 pixels left or right)
             drag_distance = 200 * self.camera_direction
             drag_end_x = center_x + drag_distance
@@ -549,6 +1085,7 @@ class IHNTMobFinder:
             print(f"📹 CAMERA ADJUSTMENT: Right-click dragging {direction_text} to change view angle")
             
             # Perform right-click drag
+            self.record_event('input', action='camera_drag', x=center_x, y=center_y, end_x=drag_end_x)
             pyautogui.mouseDown(center_x, center_y, button='right')
             time.sleep(0.1)  # Brief pause after mouse down
             
@@ -557,6 +1094,7 @@ class IHNTMobFinder:
             
             # Release right-click
             pyautogui.mouseUp(button='right')
+            self.exploration_planner.record_camera_turn(self.camera_direction)
             
             # Alternate direction for next camera adjustment
             self.camera_direction *= -1
@@ -583,7 +1121,10 @@ class IHNTMobFinder:
             
             try:
                 # Click to move character to zone boundary
-                pyautogui.click(move_pos[0], move_pos[1], button='left')
+                self.click_at(move_pos[0], move_pos[1], reason='explore_move')
+                if self.hard_example_miner is not None:
+                    self.hard_example_miner.record_move(self.last_frame, time.time())
+                self.exploration_planner.record_move(move_pos)
                 time.sleep(self.movement_click_delay)
                 
                 # Increment movement counter
@@ -604,6 +1145,7 @@ class IHNTMobFinder:
         
     def update_mob_detection_status(self, mobs_found):
         """Update mob detection status for zone movement"""
+        self.exploration_planner.record_zone_status(mobs_found, time.time())
         if mobs_found:
             # Mobs found in zone, reset timer and movement counter
             self.last_mob_seen_time = time.time()
@@ -628,7 +1170,10 @@ class IHNTMobFinder:
         """Setup global hotkeys that work even when game window is focused"""
         def on_hotkey_press(key):
             try:
-                if key == Key.caps_lock:
+                if self.orchestrator is not None:
+                    # Handled on the event loop, between two detection steps
+                    self.orchestrator.post_hotkey('caps_lock' if key == Key.caps_lock else str(key).replace('Key.', ''))
+                elif key == Key.caps_lock:
                     self.handle_capslock_toggle()
                 elif str(key) == 'Key.f2':
                     self.manual_death_test()
@@ -636,6 +1181,8 @@ class IHNTMobFinder:
                     self.cycle_detection_area()
                 elif str(key) == 'Key.f4':
                     self.emergency_unlock_mouse()
+                elif str(key) == 'Key.f5':
+                    self.request_model_reload()
             except Exception as e:
                 print(f"⚠️ Hotkey error: {e}")
         
@@ -650,6 +1197,7 @@ class IHNTMobFinder:
             print("   F2 = Manual Death Detection Test")
             print("   F3 = Cycle Detection Area (Sword→Spear→Bow→Custom)")
             print("   F4 = Emergency Mouse Unlock (if stuck)")
+            print("   F5 = Reload YOLO Model (hot swap, no restart)")
             return True
         except Exception as e:
             print(f"❌ Failed to setup hotkeys: {e}")
@@ -668,6 +1216,7 @@ class IHNTMobFinder:
             print("\n▶️ CAPS LOCK PRESSED - Detection RESUMED!")
             self.paused = False
             self.keyboard_active = True  # Resume keyboard automation
+            self.frame_governor.wake()  # Cut the idle paused sleep short
         else:
             # Currently running - pause
             print("\n⏸️ CAPS LOCK PRESSED - Detection PAUSED!")
@@ -706,6 +1255,8 @@ class IHNTMobFinder:
         print("=" * 30)
         print(f"   New weapon type: {self.current_weapon_type.title()}")
         print(f"   New radius: {self.hunting_zone_radius}px")
+        if self.use_tiles():
+            print(f"   🧩 Tiles: {self.tiled_detector.describe(self.hunting_zone_radius)}")
         print("=" * 30)
     
     
@@ -871,12 +1422,24 @@ class IHNTMobFinder:
                 
                 # Ultra-fast screen capture
                 screenshot = sct.grab(game_area)
+                self.last_capture_time = time.time()
+                
+                if self.fused_preprocess:
+                    # Zero-copy BGRA view - the preprocessor converts it straight into the model tensor
+                    return np.asarray(screenshot), game_area
+                
+                if self.frame_pool is not None:
+                    # Long session - convert straight into the next pooled buffer (no per-frame allocations)
+                    raw = np.asarray(screenshot)
+                    frame = self.frame_pool.take((raw.shape[0], raw.shape[1], 3))
+                    cv2.cvtColor(raw, cv2.COLOR_BGRA2BGR, dst=frame)
+                    return frame, game_area
                 
                 # Convert to numpy array for I-HNT AI
                 frame = np.array(screenshot)
                 
-                # Convert BGRA to RGB (I-HNT AI expects RGB)
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2RGB)
+                # Convert BGRA to BGR - ultralytics reads numpy images as BGR (same RGB model input as the fused tensor)
+                frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
                 
                 return frame, game_area
                 
@@ -892,59 +1455,45 @@ class IHNTMobFinder:
             return []
         
         try:
+            # Cascade tier 1 - skip full YOLO when the hunting zone looks empty
+            is_audit = False
+            if self.mob_gate is not None:
+                run_full_pass, is_audit = self.cascade_gate_check(frame)
+                if not run_full_pass:
+                    return []
+            
             if self.debug_detections:
                 print(f"🔍 DEBUG: YOLO inference starting...")
                 print(f"   📊 Frame size: {frame.shape}")
                 print(f"   ⚙️ Confidence threshold: {self.conf_threshold}")
                 print(f"   ⚙️ IoU threshold: {self.iou_threshold}")
             
-            # I-HNT AI inference - optimized for speed
-            results = self.model(
-                frame,
-                conf=self.conf_threshold,
-                iou=self.iou_threshold,
-                max_det=self.max_detections,
-                verbose=False  # Suppress output for speed
-            )
+            # I-HNT AI inference - optimized for speed (skipped for a frame seen before)
+            boxes = None
+            if self.detection_cache is not None:
+                cache_key = self.detection_cache.key(frame, self.detection_settings())
+                boxes = self.detection_cache.get(cache_key)
+            if boxes is None:
+                boxes = self.run_inference(frame)
+                if self.detection_cache is not None:
+                    self.detection_cache.put(cache_key, boxes)
+            raw_detection_count = len(boxes)
+            if self.model_manager is not None:
+                self.model_manager.offer_reference(frame, boxes, time.time())
+            if (self.hard_example_miner is not None and len(boxes)
+                    and boxes[:, 4].min() < self.conf_threshold + self.hard_example_band):
+                self.hard_example_miner.offer(frame, 'low_confidence', boxes)
+            if self.debug_detections:
+                print(f"📋 DEBUG: YOLO raw detections: {raw_detection_count}")
             
-            detections = []
-            raw_detection_count = 0
+            detections = self.boxes_to_detections(boxes)
+            if self.predict_motion:
+                self.motion_predictor.update(detections, self.last_capture_time or time.time())
             
-            # Process results
-            for result in results:
-                boxes = result.boxes
-                if boxes is not None:
-                    raw_detection_count = len(boxes)
-                    if self.debug_detections:
-                        print(f"📋 DEBUG: YOLO raw detections: {raw_detection_count}")
-                    
-                    for i in range(len(boxes)):
-                        # Get bounding box coordinates
-                        x1, y1, x2, y2 = boxes.xyxy[i].cpu().numpy()
-                        confidence = boxes.conf[i].cpu().numpy()
-                        class_id = int(boxes.cls[i].cpu().numpy())
-                        
-                        # Calculate center point for targeting
-                        center_x = int((x1 + x2) / 2)
-                        center_y = int((y1 + y2) / 2)
-                        
-                        # Convert back to screen coordinates
-                        screen_x = center_x + self.margin_left
-                        screen_y = center_y + self.margin_top
-                        
-                        detection = {
-                            'bbox': [x1, y1, x2, y2],
-                            'confidence': float(confidence),
-                            'class_id': class_id,
-                            'center': (center_x, center_y),
-                            'screen_position': (screen_x, screen_y),
-                            'target_position': (screen_x, screen_y + self.target_offset_y)
-                        }
-                        
-                        if self.debug_detections:
-                            print(f"   🎯 Detection {i+1}: pos=({screen_x},{screen_y}), conf={confidence:.3f}, class={class_id}")
-                        
-                        detections.append(detection)
+            if self.mob_gate is not None:
+                self.mob_gate.record_full_pass(self.count_zone_mobs(detections) > 0, audit=is_audit)
+            if self.cascade_collect_backgrounds and not detections:
+                self.save_gate_background(frame)
             
             if self.debug_detections:
                 if raw_detection_count == 0:
@@ -960,6 +1509,99 @@ class IHNTMobFinder:
             print(f"❌ I-HNT AI detection failed: {e}")
             return []
     
+    def run_inference(self, frame):
+        """Run YOLO on a frame and return an (n, 6) array of [x1, y1, x2, y2, conf, class] rows"""
+        if self.use_tiles():
+            # Large zone - overlapping native-resolution tiles in one batch, merged with cross-tile NMS
+            if frame.shape[2] == 4:
+                frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+            return self.tiled_detector.infer(frame, self.hunting_zone_radius, self.model_batch_boxes,
+                                             self.iou_threshold)
+        
+        if self.inference_worker is not None and not self.inference_worker.failed:
+            boxes = self.inference_worker.infer(frame, self.conf_threshold, self.iou_threshold, self.max_detections,
+                                                self.inference_imgsz)
+            if boxes is not None:
+                return boxes
+            # Worker is respawning - keep hunting with the in-process model for this frame
+        
+        if self.preprocessor is not None and frame.shape[2] == 4:
+            # Raw BGRA capture - fill the reusable tensor and map boxes back to frame pixels
+            results = self.model(
+                self.preprocessor(frame),
+                conf=self.conf_threshold,
+                iou=self.iou_threshold,
+                max_det=self.max_detections,
+                verbose=False
+            )
+            if not results or results[0].boxes is None:
+                return np.empty((0, 6), dtype=np.float32)
+            return self.preprocessor.scale_boxes(results[0].boxes.data.cpu().numpy())
+        
+        return self.model_boxes(self.model, frame)
+    
+    def model_boxes(self, model, frame):
+        """Run a YOLO model on a BGR (or raw BGRA) frame with the live detection settings"""
+        if frame.shape[2] == 4:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+        
+        results = model(
+            frame,
+            conf=self.conf_threshold,
+            iou=self.iou_threshold,
+            imgsz=self.inference_imgsz,
+            max_det=self.max_detections,
+            verbose=False  # Suppress output for speed
+        )
+        
+        if not results or results[0].boxes is None:
+            return np.empty((0, 6), dtype=np.float32)
+        return results[0].boxes.data.cpu().numpy()
+    
+    def model_batch_boxes(self, images, imgsz=None, model=None):
+        """Run the live (or given) model on a batch of same-size BGR images → one (n, 6) array per image"""
+        results = (model or self.model)(
+            images,
+            conf=self.conf_threshold,
+            iou=self.iou_threshold,
+            imgsz=imgsz or self.inference_imgsz,
+            max_det=self.max_detections,
+            verbose=False
+        )
+        return [result.boxes.data.cpu().numpy() if result.boxes is not None else np.empty((0, 6), dtype=np.float32)
+                for result in results]
+    
+    def boxes_to_detections(self, boxes):
+        """Convert compact detection rows into detection dicts with screen coordinates"""
+        detections = []
+        
+        for i, (x1, y1, x2, y2, confidence, class_id) in enumerate(boxes[:, :6]):
+            class_id = int(class_id)
+            
+            # Calculate center point for targeting
+            center_x = int((x1 + x2) / 2)
+            center_y = int((y1 + y2) / 2)
+            
+            # Convert back to screen coordinates
+            screen_x = center_x + self.margin_left
+            screen_y = center_y + self.margin_top
+            
+            detection = {
+                'bbox': [x1, y1, x2, y2],
+                'confidence': float(confidence),
+                'class_id': class_id,
+                'center': (center_x, center_y),
+                'screen_position': (screen_x, screen_y),
+                'target_position': (screen_x, screen_y + self.target_offset_y)
+            }
+            
+            if self.debug_detections:
+                print(f"   🎯 Detection {i+1}: pos=({screen_x},{screen_y}), conf={confidence:.3f}, class={class_id}")
+            
+            detections.append(detection)
+        
+        return detections
+    
     def detect_pet_card(self):
         """Detect if a pet card appears at top center after clicking"""
         try:
@@ -974,19 +1616,16 @@ class IHNTMobFinder:
             
             with mss.mss() as sct:
                 screenshot = sct.grab(pet_card_area)
-                frame = np.array(screenshot)
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2RGB)
+                frame = np.asarray(screenshot)
                 
                 # Look for dark pet card backgrounds (like in the images)
                 # Pet cards have distinctive dark backgrounds with pet names
-                gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+                stats = self.ui_stats['pet'].measure(frame)
                 
                 # Look for dark rectangular areas typical of pet cards
                 # Pet cards are darker than mob health bars
                 dark_threshold = 50  # Adjust based on pet card darkness
-                dark_pixels = np.sum(gray < dark_threshold)
-                total_pixels = gray.shape[0] * gray.shape[1]
-                dark_ratio = dark_pixels / total_pixels
+                dark_ratio = stats.ratio_below(dark_threshold)
                 
                 # If significant dark area detected, likely a pet card
                 if dark_ratio > 0.3:  # 30% dark pixels indicates pet card
@@ -1000,10 +1639,16 @@ class IHNTMobFinder:
     def click_target_with_pet_detection(self, target):
         """Click target and check for pet card to ignore pets"""
         target_x, target_y = target['screen_position']
+        if self.predict_motion:
+            # Aim where the mob will be now, not where it was when the frame was captured
+            (target_x, target_y), latency, compensated = self.motion_predictor.predict(target, time.time())
+            self.motion_predictor.record_click(latency, compensated)
+            if compensated:
+                print(f"   🏃 Leading moving target by {latency * 1000:.0f}ms → ({target_x}, {target_y})")
         
         # Click the target
         print(f"🖱️ Clicking target at ({target_x}, {target_y})")
-        pyautogui.click(target_x, target_y)
+        self.click_at(target_x, target_y, reason='target')
         
         # Brief delay for pet card to appear
         time.sleep(0.2)  
@@ -1016,8 +1661,22 @@ class IHNTMobFinder:
             print(f"   🔄 Immediately switching to next available target...")
             print(f"   📊 Session pets: {self.pets_in_current_session} | Total: {self.pets_detected_count}")
             self.current_target = None  # Clear current target to switch
+            self.target_ranker.record_pet((target_x, target_y), time.time())
+            self.metrics.pet_skips += 1
+            if self.hard_example_miner is not None:
+                self.hard_example_miner.offer(self.last_frame, 'pet_click',
+                                              [[*target['bbox'], target['confidence'], target['class_id']]],
+                                              pet_position=[target_x, target_y])
+            if self.analytics is not None:
+                self.analytics.record('pet_click', detail=f"{target_x},{target_y}")
+            if self.predict_motion:
+                self.motion_predictor.record_outcome(pet=True)
             return False  # Indicate pet was clicked
         
+        if self.predict_motion:
+            # Score the click for the prediction stats - a hit selects the mob and shows its health bar
+            self.motion_predictor.record_outcome(health_bar_visible=self.detect_health_bar()['has_health_bar'])
+        
         return True  # Indicate successful mob click
     
     def select_target_with_persistence(self, detections):
@@ -1032,16 +1691,21 @@ class IHNTMobFinder:
                 current_pos = self.current_target['screen_position']
                 
                 # Look for target near current position (within 100px)
+                detection_index = SpatialGrid(cell_size=100)
                 for detection in detections:
-                    det_pos = detection['screen_position']
-                    distance = ((det_pos[0] - current_pos[0]) ** 2 + (det_pos[1] - current_pos[1]) ** 2) ** 0.5
-                    
-                    if distance < 100:  # Same target if within 100px
-                        print(f"   🎯 Continuing with same target (moved {distance:.0f}px)")
-                        # Update target position but keep same target
-                        self.current_target['screen_position'] = det_pos
-                        self.current_target['target_position'] = detection['target_position']
-                        return self.current_target
+                    detection_index.insert(detection['screen_position'], detection)
+                match = detection_index.nearest(current_pos, 100)
+                
+                if match is not None:  # Same target if within 100px
+                    det_pos, detection, distance = match
+                    print(f"   🎯 Continuing with same target (moved {distance:.0f}px)")
+                    # Update target position but keep same target
+                    self.current_target['screen_position'] = det_pos
+                    self.current_target['target_position'] = detection['target_position']
+                    for key in ('bbox', 'captured_at', 'velocity', 'track_id'):
+                        if key in detection:
+                            self.current_target[key] = detection[key]
+                    return self.current_target
         
         # Filter to only mobs in hunting zone
         zone_mobs = self.filter_mobs_in_zone(detections)
@@ -1100,16 +1764,25 @@ class IHNTMobFinder:
         return zone_mobs
     
     def select_zone_target(self, zone_mobs):
-        """Select any mob within the hunting zone (no prioritization needed)"""
+        """Select the best mob within the hunting zone (nearest, most confident, not a pet spot)"""
         if not zone_mobs:
             return None
         
-        # Just pick the first mob in the zone - all are close enough
-        target = zone_mobs[0]
+        if self.smart_target_ranking:
+            self.target_ranker.zone_radius = self.hunting_zone_radius  # Follows the detection area setting
+            char_pos = (self.screen_width // 2, self.screen_height // 2)
+            target = self.target_ranker.rank(zone_mobs, char_pos, time.time())[0]
+        else:
+            # Just pick the first mob in the zone - all are close enough
+            target = zone_mobs[0]
         pos = target['screen_position']
         conf = target['confidence']
         
-        print(f"🎯 ZONE TARGET SELECTED: ({pos[0]}, {pos[1]}) - Conf: {conf:.2f}")
+        if 'distance' in target:
+            print(f"🎯 ZONE TARGET SELECTED: ({pos[0]}, {pos[1]}) - Conf: {conf:.2f} | "
+                  f"{target['distance']:.0f}px | score {target['rank_score']:.2f}")
+        else:
+            print(f"🎯 ZONE TARGET SELECTED: ({pos[0]}, {pos[1]}) - Conf: {conf:.2f}")
         return target
     
     def smart_target_cycling(self, zone_mobs):
@@ -1132,30 +1805,20 @@ class IHNTMobFinder:
                 print("🐕 Persistent target was a pet - cycling to next target")
         
         # If no persistent target or it was a pet, cycle through all available targets
-        attempted_positions = set()
+        attempted_positions = SpatialGrid(cell_size=50)
         
         # Add the attempted pet position to avoid retrying it
         if target:
-            attempted_positions.add(target['screen_position'])
+            attempted_positions.insert(target['screen_position'])
         
         targets_attempted = 0
         max_attempts = min(len(zone_mobs), 5)  # Try up to 5 targets to avoid infinite loops
         
         for attempt in range(max_attempts):
             # Get available targets excluding already attempted positions
-            available_targets = []
-            for mob in zone_mobs:
-                mob_pos = mob['screen_position']
-                # Check if this position is far enough from attempted positions (avoid duplicates)
-                is_new_target = True
-                for attempted_pos in attempted_positions:
-                    distance = ((mob_pos[0] - attempted_pos[0]) ** 2 + (mob_pos[1] - attempted_pos[1]) ** 2) ** 0.5
-                    if distance < 50:  # Same target if within 50px
-                        is_new_target = False
-                        break
-                
-                if is_new_target:
-                    available_targets.append(mob)
+            # (same target if within 50px of an attempted position - constant-time grid lookup)
+            available_targets = [mob for mob in zone_mobs
+                                 if not attempted_positions.has_neighbor(mob['screen_position'], 50)]
             
             if not available_targets:
                 print(f"🚫 All targets attempted ({targets_attempted} tries) - no more valid targets")
@@ -1167,7 +1830,7 @@ class IHNTMobFinder:
                 break
             
             targets_attempted += 1
-            attempted_positions.add(next_target['screen_position'])
+            attempted_positions.insert(next_target['screen_position'])
             
             print(f"🔄 Attempt {attempt + 1}/{max_attempts}: Trying next target at {next_target['screen_position']}")
             
@@ -1183,6 +1846,78 @@ class IHNTMobFinder:
         print(f"⚠️ All attempted targets were pets ({targets_attempted} pets found) - no valid mob targets")
         return False
     
+    def grab_target_crop(self, bbox):
+        """Small BGRA grab of a game-area box (for kill confirmation) - returns (crop, (left, top)) in game-area pixels"""
+        x1, y1, x2, y2 = bbox
+        left = int(max(0, x1 + self.margin_left))
+        top = int(max(0, y1 + self.margin_top))
+        width = int(min(self.screen_width - left, x2 - max(x1, -self.margin_left)))
+        height = int(min(self.screen_height - top, y2 - max(y1, -self.margin_top)))
+        if width < 4 or height < 4:
+            return None, None
+        try:
+            with mss.mss() as sct:
+                crop = np.asarray(sct.grab({'left': left, 'top': top, 'width': width, 'height': height}))
+            return crop, (left - self.margin_left, top - self.margin_top)
+        except Exception as e:
+            print(f"   ⚠️ Target crop failed: {e}")
+            return None, None
+    
+    def check_kill(self):
+        """Fast kill check for the locked target - returns ALIVE, DYING or DEAD"""
+        health = self.last_health_status or {}
+        red_pixels = health.get('red_pixel_count', 0) if health.get('has_health_bar') else 0
+        bbox = self.current_target.get('bbox')
+        now = time.time()
+        
+        if not self.kill_confirmer.is_locked_on(self.target_selected_time):
+            # First engage tick on this target - the bbox crop becomes the reference
+            crop = self.grab_target_crop(bbox)[0] if bbox is not None else None
+            self.kill_confirmer.lock(self.target_selected_time, crop, red_pixels, now)
+        
+        # Later ticks search around the bbox - the sprite moves on screen as the character and camera do
+        window, origin = self.grab_target_crop(self.kill_confirmer.search_box(bbox)) if bbox is not None else (None, None)
+        status = self.kill_confirmer.update(window, red_pixels, now)
+        offset = self.kill_confirmer.last_offset
+        if status != DEAD and window is not None and offset is not None:
+            # Re-project the bbox to where the sprite was found so the next window follows it
+            x1, y1, x2, y2 = bbox
+            dx, dy = origin[0] + offset[0] - x1, origin[1] + offset[1] - y1
+            self.current_target['bbox'] = (x1 + dx, y1 + dy, x2 + dx, y2 + dy)
+        return status
+    
+    def preselect_next_target(self):
+        """Run one detection pass while the target is dying and remember the best next mob"""
+        frame, _ = self.capture_game_area()
+        if frame is None:
+            return
+        detections = self.detect_mobs_ai(frame)
+        current_pos = self.current_target['screen_position'] if self.current_target else None
+        
+        candidates = []
+        for mob in self.filter_mobs_in_zone(detections):
+            x, y = mob['screen_position']
+            if current_pos is None or ((x - current_pos[0]) ** 2 + (y - current_pos[1]) ** 2) ** 0.5 >= 50:
+                candidates.append(mob)  # Skip the dying target itself
+        
+        self.preselected_at = time.time()  # Also throttles retries when nothing else is in the zone
+        if candidates:
+            print("   🎯 Pre-selecting next target while the current one is dying")
+            self.preselected_target = self.select_zone_target(candidates)
+    
+    def engage_preselected_target(self):
+        """Click the pre-selected next target right after a kill, returns True if a mob was selected"""
+        target = self.preselected_target
+        self.preselected_target = None
+        if target is None or time.time() - self.preselected_at > self.preselect_max_age:
+            return False
+        
+        print(f"⚡ INSTANT RETARGET: {target['screen_position']}")
+        if self.click_target_with_pet_detection(target):
+            self.set_current_target(target)
+            return True
+        return False
+    
     def click_target(self, target):
         """Click on the selected target"""
         try:
@@ -1191,7 +1926,7 @@ class IHNTMobFinder:
             print(f"🖱️ Clicking target at {target_pos}")
             
             # Direct click for maximum speed
-            pyautogui.click(target_pos[0], target_pos[1], button='left')
+            self.click_at(target_pos[0], target_pos[1], reason='target')
             
             print("✅ Target clicked!")
             return True
@@ -1200,9 +1935,209 @@ class IHNTMobFinder:
             print(f"❌ Click failed: {e}")
             return False
     
+    def click_at(self, x, y, button='left', reason=''):
+        """Click a screen position (recorded when session recording is on)"""
+        self.record_event('input', action='click', x=int(x), y=int(y), button=button, reason=reason)
+        pyautogui.click(x, y, button=button)
+    
+    def press_key(self, key, reason=''):
+        """Press a key (recorded when session recording is on)"""
+        self.record_event('input', action='press', key=key, reason=reason)
+        pyautogui.press(key)
+    
+    def record_event(self, kind, **data):
+        """Record a session event if recording is active"""
+        if self.session_recorder is not None:
+            self.session_recorder.record_event(kind, data)
+    
+    def start_session_recording(self):
+        """Start recording this hunting session"""
+        try:
+            self.session_recorder = SessionRecorder(self.recording_dir, downscale=self.recording_downscale)
+            self.session_recorder.copy_frames = self.frame_pool is not None
+            self.session_recorder.start()
+        except Exception as e:
+            print(f"❌ Failed to start session recording: {e}")
+            self.session_recorder = None
+    
+    def stop_session_recording(self):
+        """Finish writing the session recording"""
+        if self.session_recorder is not None:
+            recorder, self.session_recorder = self.session_recorder, None
+            recorder.stop()
+    
+    def start_analytics(self):
+        """Open the analytics database and start a new session row"""
+        try:
+            self.analytics = AnalyticsStore(self.analytics_db)
+            self.analytics.start_session(weapon=self.current_weapon_type, radius=self.hunting_zone_radius,
+                                         model=str(self.model_path), conf_threshold=self.conf_threshold)
+        except Exception as e:
+            print(f"❌ Failed to start analytics: {e}")
+            self.analytics = None
+    
+    def stop_analytics(self):
+        """Close the current state's dwell time and write the rest of the session"""
+        if self.analytics is not None:
+            analytics, self.analytics = self.analytics, None
+            if self.hunt_state.state is not None:
+                analytics.record('state', self.hunt_state.dwell_time(time.time()), self.hunt_state.state)
+            analytics.end_session()
+    
+    def start_metrics_server(self):
+        """Serve the live metrics from a background thread"""
+        try:
+            self.metrics_server = MetricsServer(self.metrics, self.metrics_host, self.metrics_port)
+            self.metrics_server.start()
+        except OSError as e:
+            print(f"❌ Failed to start metrics endpoint on port {self.metrics_port}: {e}")
+            self.metrics_server = None
+    
+    def stop_metrics_server(self):
+        """Stop serving the live metrics"""
+        if self.metrics_server is not None:
+            server, self.metrics_server = self.metrics_server, None
+            server.stop()
+    
+    def start_watchdog(self):
+        """Start the stall watchdog thread"""
+        self.watchdog = StallWatchdog(self.watchdog_probe, self.watchdog_limits, clock=time.time,
+                                      log_path=str(Path(self.watchdog_dir) / "watchdog_log.jsonl"))
+        Path(self.watchdog_dir).mkdir(exist_ok=True)
+        self.watchdog.start()
+    
+    def stop_watchdog(self):
+        """Stop the stall watchdog thread"""
+        if self.watchdog is not None:
+            watchdog, self.watchdog = self.watchdog, None
+            watchdog.stop()
+    
+    def watchdog_probe(self):
+        """Loop flags the watchdog reads (and logs in its snapshots)"""
+        return {
+            'detection_paused': self.detection_paused,
+            'lock_started': max(self.detection_pause_start, self.target_selected_time or 0.0)
+            if self.detection_pause_start else None,
+            'player_dead': self.player_dead,
+            'keyboard_active': self.keyboard_active,
+            'paused': self.paused,
+            'target': self.current_target['screen_position'] if self.current_target else None,
+            'last_health': {key: self.last_health_status.get(key) for key in ('has_health_bar', 'has_red_health', 'bar_visible', 'red_pixel_count')}
+            if self.last_health_status else None,
+            'last_detections': self.metrics.last_detections,
+            'movement_count': self.movement_count,
+        }
+    
+    def save_watchdog_frame(self, name):
+        """Keep a screenshot of what the loop was looking at when it got stuck"""
+        try:
+            frame, _ = self.capture_game_area()
+            if frame is None:
+                return
+            if frame.shape[2] == 4:
+                frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+            path = Path(self.watchdog_dir) / f"{name}_{int(time.time())}.png"
+            cv2.imwrite(str(path), frame)
+            print(f"   📸 Watchdog screenshot: {path}")
+        except Exception as e:
+            print(f"   ⚠️ Watchdog screenshot failed: {e}")
+    
+    def run_watchdog_recoveries(self):
+        """Apply recoveries the watchdog queued (runs on the detection thread)"""
+        while self.watchdog is not None:
+            request = self.watchdog.next_recovery()
+            if request is None:
+                return
+            name, attempt, snapshot = request
+            print(f"🐕‍🦺 WATCHDOG RECOVERY: {name} (attempt {attempt}, stuck {snapshot['dwell']:.0f}s)")
+            if name == 'fight_lock':
+                self.save_watchdog_frame(name)
+                self.emergency_unlock_mouse()
+                self.kill_confirmer.release()
+                self.preselected_target = None
+                if attempt >= 2:
+                    # The same lock came straight back - walk away from whatever keeps the red health showing
+                    move_pos = self.generate_movement_position()
+                    print(f"   🚶 Walking away from the stuck target to {move_pos}")
+                    self.click_at(move_pos[0], move_pos[1], reason='watchdog_move')
+                if attempt >= 3:
+                    print("   💡 Red health keeps showing - the health detection area probably needs adjustment")
+            elif name == 'death_stuck':
+                self.save_watchdog_frame(name)
+                if self.auto_handle_death and self.death_handling_mode:
+                    if self.handle_death_confirmation():
+                        self.player_dead = False
+                        self.detection_paused = False
+                        self.keyboard_active = True
+                        print("   ✅ Death confirmation handled on retry")
+                elif attempt == 1:
+                    print("   ⏳ Death window still open - waiting for the player (no auto death handling configured)")
+            elif name == 'no_detections':
+                self.adjust_camera_angle()
+                self.movement_count = 0
+                if attempt >= 2:
+                    # Forget the heatmaps - whatever they point at is not producing mobs
+                    self.exploration_planner = ExplorationPlanner((self.screen_width, self.screen_height),
+                                                                  camera_degrees_per_drag=self.camera_degrees_per_drag)
+                if attempt >= 3:
+                    self.save_watchdog_frame(name)
+                    print("   💡 Still no detections - check the game window, camera zoom and YOLO model")
+    
+    def start_hard_example_mining(self):
+        """Start the hard example writer thread"""
+        try:
+            self.hard_example_miner = HardExampleMiner(self.hard_example_dir, self.hard_example_max_mb)
+            self.hard_example_miner.copy_frames = self.frame_pool is not None
+            self.hard_example_miner.start()
+        except Exception as e:
+            print(f"❌ Failed to start hard example mining: {e}")
+            self.hard_example_miner = None
+    
+    def start_memory_monitor(self):
+        """Pool the capture buffers and start sampling memory growth"""
+        try:
+            self.frame_pool = BufferPool(self.frame_pool_slots)
+            self.memory_sampler = MemorySampler(self.memory_sample_interval, self.memory_warmup,
+                                                self.memory_growth_warn_mb, self.trace_memory, self.memory_log)
+            self.memory_sampler.start(time.time())
+            print(f"🧠 Long-session mode: {self.frame_pool_slots} pooled capture buffers, memory sampled every "
+                  f"{self.memory_sample_interval:.0f}s{' (tracemalloc on)' if self.trace_memory else ''}")
+        except Exception as e:
+            print(f"❌ Failed to start the memory monitor: {e}")
+            self.frame_pool = None
+            self.memory_sampler = None
+    
+    def stop_memory_monitor(self):
+        """Final memory report, then stop tracing and release the buffer pool"""
+        if self.memory_sampler is not None:
+            sampler, self.memory_sampler = self.memory_sampler, None
+            sampler.sample(time.time())
+            print(f"   {sampler.stats_summary()}")
+            sampler.stop()
+        self.frame_pool = None
+    
+    def stop_hard_example_mining(self):
+        """Write the queued examples and stop the writer"""
+        if self.hard_example_miner is not None:
+            miner, self.hard_example_miner = self.hard_example_miner, None
+            miner.stop()
+    
+    def record_kill(self):
+        """Count a kill with its time-to-kill for the analytics"""
+        self.metrics.kills += 1
+        if self.analytics is not None and self.target_selected_time is not None:
+            self.analytics.record('kill', time.time() - self.target_selected_time)
+    
+    def record_lost_target(self):
+        """Count a target that was deselected, walked away or vanished - not a kill"""
+        self.metrics.lost_targets += 1
+        if self.analytics is not None and self.target_selected_time is not None:
+            self.analytics.record('lost_target', time.time() - self.target_selected_time)
+    
     def continuous_keyboard_automation(self):
         """Continuous keyboard pressing in background thread"""
         print("⌨️ Starting keyboard automation: 123145 sequence")
+        self.pin_thread('actuator')
         self.keyboard_active = True
         sequence = "123145"
         
@@ -1215,7 +2150,7 @@ class IHNTMobFinder:
                             break
                         
                         try:
-                            pyautogui.press(key)
+                            self.press_key(key, reason='skill')
                             time.sleep(0.1)
                         except Exception as e:
                             print(f"❌ Key press failed: {e}")
@@ -1232,8 +2167,8 @@ class IHNTMobFinder:
             self.keyboard_active = False
             print("⌨️ Keyboard automation stopped")
     
-    def real_time_detection_loop(self):
-        """Main real-time detection and targeting loop"""
+    def begin_hunting(self):
+        """Announce the session, pin the capture thread and start the per-session services"""
         print("\n⚡ STARTING REAL-TIME I-HNT AI DETECTION")
         print("=" * 50)
         print("🎮 Features:")
@@ -1247,8 +2182,262 @@ class IHNTMobFinder:
         print("=" * 50)
         
         self.monitoring_active = True
-        frame_count = 0
-        start_time = time.time()
+        self.frame_count = 0
+        self.hunt_start_time = time.time()
+        self.hunt_state.reset()
+        
+        # Capture runs here; inference too unless it lives in the worker process
+        if self.inference_worker is not None:
+            self.pin_thread('capture')
+        else:
+            self.pin_thread('capture', 'inference')
+        
+        # Pooled buffers first - the recorder and miner copy the frames they keep when pooling is on
+        if self.long_session_mode:
+            self.start_memory_monitor()
+        
+        # Start session recording before any input is issued
+        if self.record_session:
+            self.start_session_recording()
+        if self.record_analytics:
+            self.start_analytics()
+        if self.serve_metrics:
+            self.start_metrics_server()
+        if self.use_watchdog:
+            self.start_watchdog()
+        if self.watch_model_file and self.model_manager is not None:
+            self.model_manager.start_watching()
+        if self.mine_hard_examples:
+            self.start_hard_example_mining()
+        if self.locate_death_dialog:
+            self.start_death_locator()
+    
+    def detection_step(self, loop_start):
+        """One detection loop iteration - returns the hunting state to pace by (None if the capture failed)"""
+        self.loop_cpu_start = time.process_time()
+        # Check if paused
+        if self.paused:
+            print("⏸️ Detection paused - press CapsLock to resume")
+            return 'paused'
+        
+        # Check if player has died (priority check - as often as the current state asks for)
+        if self.death_detection_active and self.hunt_state.should_run('death', loop_start):
+            if self.detect_player_death():
+                if not self.player_dead:
+                    self.player_dead = True
+                    print("💀 PLAYER DEATH CONFIRMED - Stopping all actions!")
+                    self.metrics.deaths += 1
+                    if self.analytics is not None:
+                        self.analytics.record('death')
+                    
+                    # Handle death confirmation based on configured mode
+                    print(f"   🔍 Debug: auto_handle_death={self.auto_handle_death}, death_handling_mode={self.death_handling_mode}")
+                    if self.auto_handle_death and self.death_handling_mode:
+                        print(f"   🤖 Auto-handling death confirmation: {self.death_handling_mode}")
+                        success = self.handle_death_confirmation()
+                        if success:
+                            print("   ✅ Death confirmation handled successfully")
+                            # Death handling completed successfully, resume normal detection
+                            self.player_dead = False
+                            self.detection_paused = False
+                            self.keyboard_active = True
+                            print("🔄 Resuming normal hunting after death handling...")
+                            # Continue to normal detection loop (don't continue to death checking)
+                        else:
+                            print("   ❌ Death confirmation handling failed")
+                            # Stop all hunting activities on failure
+                            self.keyboard_active = False
+                            self.detection_paused = True
+                            # Continue checking for death window to disappear
+                            return 'dead'
+                    else:
+                        print("   ⏳ Waiting for player to handle death confirmation...")
+                        print("   💡 Tip: Configure death handling mode at startup")
+                        # Stop all hunting activities
+                        self.keyboard_active = False
+                        self.detection_paused = True
+                        # Continue checking for death window to disappear
+                        return 'dead'
+                else:
+                    # Player is still dead, continue checking for death window to disappear
+                    return 'dead'
+            elif self.player_dead:
+                # Player was dead but death window is gone - player has been resurrected
+                self.player_dead = False
+                print("✨ PLAYER RESURRECTED - Resuming hunting activities!")
+                self.keyboard_active = True
+                self.detection_paused = False
+        
+        # Check if detection is paused (when fighting a mob with red health)
+        if self.is_detection_paused():
+            # During pause, only check if we should switch targets (health monitoring)
+            if (self.current_target is not None and self.hunt_state.should_run('health', loop_start)
+                    and self.should_switch_target()):
+                # Target died (health bar without red) or was lost (no health bar), clear pause and continue detection
+                self.clear_detection_pause()
+                if self.last_health_status.get('bar_visible'):
+                    print("   📋 Target killed during pause - resuming full detection")
+                    self.record_kill()
+                    if self.fast_kill_confirm and self.kill_confirmer.is_locked_on(self.target_selected_time):
+                        self.kill_confirmer.confirm('health', time.time())
+                else:
+                    print("   📋 Target lost during pause (no health bar) - resuming full detection")
+                    self.record_lost_target()
+                if self.fast_kill_confirm:
+                    if self.engage_preselected_target():
+                        return 'acquire'
+            elif (self.fast_kill_confirm and self.current_target is not None
+                  and self.hunt_state.should_run('kill', loop_start)):
+                kill_status = self.check_kill()
+                if kill_status == DEAD:
+                    print("   ⚡ KILL CONFIRMED (sprite/HP trend) - not waiting for the red run to vanish")
+                    self.record_kill()
+                    self.clear_detection_pause()
+                    self.current_target = None
+                    if self.engage_preselected_target():
+                        return 'acquire'
+                else:
+                    if kill_status == DYING and time.time() - self.preselected_at > self.preselect_max_age:
+                        self.preselect_next_target()
+                    return 'finish' if kill_status == DYING else 'engage'
+            else:
+                # Still fighting current target, skip detection this frame
+                return 'engage'
+        
+        # Capture game area
+        stage_start = time.time()
+        frame, game_area = self.capture_game_area()
+        self.metrics.observe_stage('capture', time.time() - stage_start)
+        if frame is None:
+            return None
+        self.last_frame = frame
+        if self.session_recorder is not None:
+            self.session_recorder.record_frame(frame)
+        
+        # I-HNT AI detection (only when not paused)
+        stage_start = time.time()
+        detections = self.detect_mobs_ai(frame)
+        self.metrics.observe_stage('detect', time.time() - stage_start)
+        stage_start = time.time()
+        if self.session_recorder is not None:
+            self.record_event('detections', boxes=[
+                [*d['screen_position'], round(d['confidence'], 3), d['class_id']] for d in detections
+            ])
+        loop_state = 'explore'
+        
+        if detections:
+            print(f"🔍 Found {len(detections)} potential mobs")
+            
+            # No filtering needed - target all detected mobs
+            print(f"🎯 Targeting all {len(detections)} detected mobs")
+            zone_mobs = self.filter_mobs_in_zone(detections)
+            self.metrics.record_detections(len(detections), len(zone_mobs))
+            self.exploration_planner.record_detections(
+                [d['screen_position'] for d in detections],
+                [m['screen_position'] for m in zone_mobs], time.time())
+            
+            # Auto-disable verbose debugging after first successful detection cycle
+            if self.debug_detections and len(detections) > 0:
+                print("📊 DEBUG: First detection cycle complete - auto-disabling verbose debugging")
+                print("💡 Use Ctrl+D in terminal to re-enable debugging if needed")
+                self.debug_detections = False
+                self.debug_filtering = False
+                
+            if zone_mobs:
+                # Mobs in zone - select target
+                print(f"✅ {len(zone_mobs)} mobs in hunting zone")
+                self.update_mob_detection_status(True)
+                loop_state = 'acquire'
+                if self.hard_example_miner is not None:
+                    self.hard_example_miner.record_zone_mobs(time.time())
+                
+                # Try targeting mobs with smart pet cycling
+                self.smart_target_cycling(zone_mobs)
+            else:
+                # No mobs in zone - move to find some
+                print("📍 No mobs in hunting zone - initiating movement")
+                self.update_mob_detection_status(False)
+                self.zone_movement_mode()
+        else:
+            # No detections at all - move around
+            print("🔍 No mobs detected - moving within zone")
+            self.metrics.record_detections(0, 0)
+            self.update_mob_detection_status(False)
+            self.zone_movement_mode()
+        self.metrics.observe_stage('act', time.time() - stage_start)
+        
+        # Count the full detection pass (FPS reporting every 30 frames)
+        self.frame_count += 1
+        if self.frame_count % 30 == 0:
+            self.print_loop_stats()
+        return loop_state
+    
+    def print_loop_stats(self):
+        """FPS and per-module stats block"""
+        elapsed = time.time() - self.hunt_start_time
+        current_fps = self.frame_count / elapsed
+        print(f"📊 FPS: {current_fps:.1f} | Processed {self.frame_count} frames")
+        print(f"   {self.frame_governor.stats_summary()}")
+        print(f"   {self.hunt_state.stats_summary(time.time())}")
+        print(f"   {ui_stats_summary(self.ui_stats)}")
+        if self.smart_exploration:
+            print(f"   {self.exploration_planner.stats_summary()}")
+        if self.predict_motion:
+            print(f"   {self.motion_predictor.stats_summary()}")
+        if self.smart_target_ranking:
+            print(f"   {self.target_ranker.stats_summary()}")
+        if self.fast_kill_confirm:
+            print(f"   {self.kill_confirmer.stats_summary()}")
+        if self.mob_gate is not None:
+            print(f"   {self.mob_gate.stats_summary()}")
+        if self.session_recorder is not None:
+            print(f"   {self.session_recorder.stats_summary()}")
+        if self.analytics is not None:
+            print(f"   {self.analytics.stats_summary()}")
+        if self.metrics_server is not None:
+            print(f"   📡 Metrics: {self.metrics_server.scrapes} scrapes on port {self.metrics_port}")
+        if self.watchdog is not None:
+            print(f"   {self.watchdog.stats_summary()}")
+        if self.model_manager is not None:
+            print(f"   {self.model_manager.stats_summary()}")
+        if self.hard_example_miner is not None:
+            print(f"   {self.hard_example_miner.stats_summary()}")
+        if self.death_locator is not None:
+            print(f"   {self.death_locator.stats_summary()}")
+        if self.orchestrator is not None:
+            print(f"   {self.orchestrator.stats_summary()}")
+        if self.detection_cache is not None:
+            print(f"   {self.detection_cache.stats_summary()}")
+        if self.tiled_detector is not None:
+            print(f"   {self.tiled_detector.stats_summary()}")
+        if self.frame_pool is not None:
+            print(f"   {self.frame_pool.stats_summary()}")
+        if self.memory_sampler is not None:
+            print(f"   {self.memory_sampler.stats_summary()}")
+    
+    def end_hunting(self, keyboard_thread=None):
+        """Stop the per-session services (after the loop has exited)"""
+        self.monitoring_active = False
+        self.keyboard_active = False
+        
+        # Wait for keyboard thread
+        if keyboard_thread is not None and keyboard_thread.is_alive():
+            keyboard_thread.join(timeout=2)
+        
+        self.stop_session_recording()
+        self.stop_analytics()
+        self.stop_metrics_server()
+        self.stop_watchdog()
+        if self.model_manager is not None:
+            self.model_manager.stop_watching()
+        self.stop_hard_example_mining()
+        self.stop_memory_monitor()
+        
+        print("🏁 Real-time detection ended")
+    
+    def real_time_detection_loop(self):
+        """Main real-time detection and targeting loop"""
+        self.begin_hunting()
         
         # Start keyboard automation thread
         keyboard_thread = threading.Thread(target=self.continuous_keyboard_automation, daemon=True)
@@ -1262,142 +2451,46 @@ class IHNTMobFinder:
         try:
             while self.monitoring_active and not self.stop_requested:
                 loop_start = time.time()
-                
-                # Check if paused
-                if self.paused:
-                    print("⏸️ Detection paused - press CapsLock to resume")
-                    time.sleep(1)
+                state = self.detection_step(loop_start)
+                if state is None:
+                    time.sleep(0.1)  # Capture failed - retry shortly
                     continue
-                
-                # Check if player has died (priority check)
-                if self.death_detection_active:
-                    if self.detect_player_death():
-                        if not self.player_dead:
-                            self.player_dead = True
-                            print("💀 PLAYER DEATH CONFIRMED - Stopping all actions!")
-                            
-                            # Handle death confirmation based on configured mode
-                            print(f"   🔍 Debug: auto_handle_death={self.auto_handle_death}, death_handling_mode={self.death_handling_mode}")
-                            if self.auto_handle_death and self.death_handling_mode:
-                                print(f"   🤖 Auto-handling death confirmation: {self.death_handling_mode}")
-                                success = self.handle_death_confirmation()
-                                if success:
-                                    print("   ✅ Death confirmation handled successfully")
-                                    # Death handling completed successfully, resume normal detection
-                                    self.player_dead = False
-                                    self.detection_paused = False
-                                    self.keyboard_active = True
-                                    print("🔄 Resuming normal hunting after death handling...")
-                                    # Continue to normal detection loop (don't continue to death checking)
-                                else:
-                                    print("   ❌ Death confirmation handling failed")
-                                    # Stop all hunting activities on failure
-                                    self.keyboard_active = False
-                                    self.detection_paused = True
-                                    # Continue checking for death window to disappear
-                                    time.sleep(1)
-                                    continue
-                            else:
-                                print("   ⏳ Waiting for player to handle death confirmation...")
-                                print("   💡 Tip: Configure death handling mode at startup")
-                                # Stop all hunting activities
-                                self.keyboard_active = False
-                                self.detection_paused = True
-                                # Continue checking for death window to disappear
-                                time.sleep(1)
-                                continue
-                        else:
-                            # Player is still dead, continue checking for death window to disappear
-                            time.sleep(1)
-                            continue
-                    elif self.player_dead:
-                        # Player was dead but death window is gone - player has been resurrected
-                        self.player_dead = False
-                        print("✨ PLAYER RESURRECTED - Resuming hunting activities!")
-                        self.keyboard_active = True
-                        self.detection_paused = False
-                
-                # Check if detection is paused (when fighting a mob with red health)
-                if self.is_detection_paused():
-                    # During pause, only check if we should switch targets (health monitoring)
-                    if self.current_target is not None and self.should_switch_target():
-                        # Target died or timed out, clear pause and continue detection
-                        print("   📋 Target lost during pause - resuming full detection")
-                        self.clear_detection_pause()
-                    else:
-                        # Still fighting current target, skip detection this frame
-                        time.sleep(0.1)
-                        continue
-                
-                # Capture game area
-                frame, game_area = self.capture_game_area()
-                if frame is None:
-                    time.sleep(0.1)
-                    continue
-                
-                # I-HNT AI detection (only when not paused)
-                detections = self.detect_mobs_ai(frame)
-                
-                if detections:
-                    print(f"🔍 Found {len(detections)} potential mobs")
-                    
-                    # No filtering needed - target all detected mobs
-                    print(f"🎯 Targeting all {len(detections)} detected mobs")
-                    zone_mobs = self.filter_mobs_in_zone(detections)
-                    
-                    # Auto-disable verbose debugging after first successful detection cycle
-                    if self.debug_detections and len(detections) > 0:
-                        print("📊 DEBUG: First detection cycle complete - auto-disabling verbose debugging")
-                        print("💡 Use Ctrl+D in terminal to re-enable debugging if needed")
-                        self.debug_detections = False
-                        self.debug_filtering = False
-                        
-                    if zone_mobs:
-                        # Mobs in zone - select target
-                        print(f"✅ {len(zone_mobs)} mobs in hunting zone")
-                        self.update_mob_detection_status(True)
-                        
-                        # Try targeting mobs with smart pet cycling
-                        self.smart_target_cycling(zone_mobs)
-                    else:
-                        # No mobs in zone - move to find some
-                        print("📍 No mobs in hunting zone - initiating movement")
-                        self.update_mob_detection_status(False)
-                        self.zone_movement_mode()
-                else:
-                    # No detections at all - move around
-                    print("🔍 No mobs detected - moving within zone")
-                    self.update_mob_detection_status(False)
-                    self.zone_movement_mode()
-                
-                # Calculate and maintain FPS
-                frame_count += 1
-                loop_time = time.time() - loop_start
-                
-                # FPS control
-                target_frame_time = 1.0 / self.fps_target
-                if loop_time < target_frame_time:
-                    time.sleep(target_frame_time - loop_time)
-                
-                # FPS reporting every 30 frames
-                if frame_count % 30 == 0:
-                    elapsed = time.time() - start_time
-                    current_fps = frame_count / elapsed
-                    print(f"📊 FPS: {current_fps:.1f} | Processed {frame_count} frames")
+                self.pace_loop(state, loop_start)
                 
         except KeyboardInterrupt:
             print("\n⏹️ Detection stopped by user")
         except Exception as e:
             print(f"\n❌ Detection error: {e}")
         finally:
-            self.monitoring_active = False
-            self.keyboard_active = False
-            
-            # Wait for keyboard thread
-            if keyboard_thread.is_alive():
-                keyboard_thread.join(timeout=2)
-            
-            print("🏁 Real-time detection ended")
+            self.end_hunting(keyboard_thread)
+    
+    def pace_loop(self, state, loop_start):
+        """Sleep until the next detection frame is due for the given hunting state"""
+        self.finish_frame(state, loop_start)
+        self.frame_governor.end_frame(state, time.time() - loop_start, self.loop_cpu_time)
+    
+    def finish_frame(self, state, loop_start):
+        """Per-iteration bookkeeping (recording, metrics, watchdog, model swap) before the frame wait"""
+        now = time.time()
+        self.loop_cpu_time = time.process_time() - self.loop_cpu_start
+        self.hunt_state.enter(state, now)
+        self.metrics.record_loop(state, now - loop_start, now)
+        if self.analytics is not None:
+            self.analytics.record_loop(now - loop_start, now)
+        if self.watchdog is not None:
+            self.watchdog.heartbeat(state, self.metrics.last_detections)
+            self.run_watchdog_recoveries()
+        if self.model_manager is not None and self.model_manager.ready is not None:
+            self.swap_model()
+        if self.memory_sampler is not None:
+            self.memory_sampler.maybe_sample(now)
+    
+    def on_state_change(self, previous, state, dwell, now):
+        """Hunting state transition - log it to the recording and the previous state's dwell to analytics"""
+        if self.session_recorder is not None:
+            self.record_event('state', state=state, previous=previous)
+        if self.analytics is not None and previous is not None:
+            self.analytics.record('state', dwell, previous, now)
     
     def start_detection_thread(self):
         """Start detection in a separate thread for hotkey control"""
@@ -1431,11 +2524,25 @@ def main():
     # Setup smart targeting system
     i_hnt.setup_smart_targeting()
     
+    model_source = i_hnt.model_config if Path(i_hnt.model_config).exists() else "yolov8n.pt"
+    
+    # Apply measured CPU thread/pinning plan (for the model that will be loaded) before torch starts its thread pools
+    if i_hnt.auto_tune_cpu:
+        i_hnt.apply_cpu_tuning(i_hnt.resolve_model_path(model_source))
+    
     # Load I-HNT AI model
-    if not i_hnt.load_yolo_model():
+    if not i_hnt.load_yolo_model(model_source):
         print("❌ Cannot continue without I-HNT AI model")
         return
     
+    # Load detection cascade gate (optional)
+    if i_hnt.use_cascade_gate:
+        i_hnt.load_mob_gate()
+    
+    # One event loop for detection, skills and hotkeys (instead of threads + the sleep loop below)
+    if i_hnt.use_async_orchestrator:
+        i_hnt.orchestrator = HuntOrchestrator(i_hnt)
+    
     # Setup global hotkeys
     if not i_hnt.setup_global_hotkeys():
         print("⚠️ Continuing without global hotkeys...")
@@ -1455,13 +2562,17 @@ def main():
         print("💡 Press F3 to change detection area for different weapons!")
         print("💡 All hotkeys work globally (no need to focus terminal)")
         
-        # Keep main thread alive for hotkeys
-        while True:
-            time.sleep(1)
-            
-            # Check if user requested stop
-            if i_hnt.stop_requested:
-                break
+        if i_hnt.orchestrator is not None:
+            # The event loop serves hotkeys and runs the hunting sessions until stopped
+            asyncio.run(i_hnt.orchestrator.run())
+        else:
+            # Keep main thread alive for hotkeys
+            while True:
+                time.sleep(1)
+                
+                # Check if user requested stop
+                if i_hnt.stop_requested:
+                    break
                 
         print("\n🏁 Detection stopped")
         
@@ -1475,6 +2586,7 @@ def main():
     finally:
         # Cleanup
         i_hnt.cleanup_hotkeys()
+        i_hnt.shutdown_inference_worker()
     
     print("\n🏁 I-HNT Gaming Assistant complete!")
     print("🎮 Happy Gaming and thanks for using I-HNT! 🎯")
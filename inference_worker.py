@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+I-HNT Inference Worker
+Runs YOLO inference in a separate process so the hotkey listener and
+keyboard automation never fight the model for the GIL.
+
+Frames travel through multiprocessing.shared_memory ring slots (no pickling),
+the worker writes compact [x1, y1, x2, y2, conf, class] float32 rows back
+into a shared result buffer, and only tiny fixed-size control messages go
+through the pipe. The parent notices crashes/hangs and respawns the worker
+in the background: until the new process reports READY, infer() returns None
+and the caller keeps hunting with its in-process model.
+"""
+
+import struct
+import time
+from collections import deque
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Control messages (parent -> worker / worker -> parent), packed with struct
+REQUEST_FORMAT = "<iIffIIII"  # slot, seq, conf, iou, max_det, imgsz (0 = model default), height, width
+REPLY_FORMAT = "<iIi"         # slot, seq, detection count (-1 = inference error)
+READY_MESSAGE = b"READY"
+STOP_MESSAGE = b"STOP"
+
+DETECTION_FIELDS = 6  # x1, y1, x2, y2, confidence, class_id
+
+
+def attach_shared_memory(name):
+    """Attach to an existing shared memory block without registering it for cleanup"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def inference_worker_main(model_path, use_gpu, frame_shm_name, result_shm_name,
+                          slot_count, slot_bytes, max_det, conn, cpu_plan=None):
+    """Worker process entry point - loads the model and serves frames from shared memory"""
+    if cpu_plan:
+        from cpu_tuner import apply_torch_threads, pin_process
+        if cpu_plan.get('pin_threads'):
+            pin_process(cpu_plan['inference_cores'])
+        apply_torch_threads(cpu_plan['intra_op_threads'], cpu_plan['inter_op_threads'])
+
+    frame_shm = attach_shared_memory(frame_shm_name)
+    result_shm = attach_shared_memory(result_shm_name)
+    results = np.ndarray((slot_count, max_det, DETECTION_FIELDS), dtype=np.float32, buffer=result_shm.buf)
+
+    try:
+        from ultralytics import YOLO
+
+        model = YOLO(model_path)
+        if use_gpu and str(model_path).endswith('.pt'):
+            model.to('cuda')  # Exported models (ONNX, OpenVINO, ...) can't be moved
+        model(np.zeros((100, 100, 3), dtype=np.uint8), conf=0.1, verbose=False)  # Warm-up
+        conn.send_bytes(READY_MESSAGE)
+
+        while True:
+            message = conn.recv_bytes()
+            if message == STOP_MESSAGE:
+                break
+
+            slot, seq, conf, iou, request_max_det, imgsz, height, width = struct.unpack(REQUEST_FORMAT, message)
+            frame = np.ndarray((height, width, 3), dtype=np.uint8, buffer=frame_shm.buf, offset=slot * slot_bytes)
+            size = {'imgsz': imgsz} if imgsz else {}
+
+            try:
+                output = model(frame, conf=conf, iou=iou, max_det=request_max_det, verbose=False, **size)
+                boxes = output[0].boxes if output else None
+                data = boxes.data.cpu().numpy() if boxes is not None else np.empty((0, DETECTION_FIELDS))
+                count = min(len(data), max_det)
+                results[slot, :count] = data[:count, :DETECTION_FIELDS]
+            except Exception as e:
+                print(f"⚠️ Inference worker error: {e}")
+                count = -1
+
+            conn.send_bytes(struct.pack(REPLY_FORMAT, slot, seq, count))
+
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        del results
+        frame_shm.close()
+        result_shm.close()
+
+
+class InferenceWorker:
+    """Parent-side handle for the out-of-process YOLO worker"""
+
+    def __init__(self, model_path, frame_shape, use_gpu=False, slot_count=3, max_det=300,
+                 reply_timeout=2.0, ready_timeout=120.0, max_respawns=5, healthy_frames=1000, cpu_plan=None):
+        self.model_path = model_path
+        self.frame_shape = frame_shape  # Largest (height, width) a slot can hold
+        self.use_gpu = use_gpu
+        self.slot_count = slot_count
+        self.max_det = max_det
+        self.reply_timeout = reply_timeout
+        self.ready_timeout = ready_timeout
+        self.max_respawns = max_respawns
+        self.healthy_frames = healthy_frames  # Frames in a row after which earlier respawns are forgiven
+        self.cpu_plan = cpu_plan  # Thread counts / core pinning from cpu_tuner
+
+        self.slot_bytes = frame_shape[0] * frame_shape[1] * 3
+        self.frame_shm = None
+        self.result_shm = None
+        self.results = None
+
+        self.context = mp.get_context('spawn')  # Never fork a process that holds torch threads
+        self.process = None
+        self.conn = None
+        self.next_seq = 0
+        self.pending = deque()  # (slot, seq) tickets awaiting a reply, oldest first
+        self.starting = False   # Process launched, READY not received yet
+        self.ready_deadline = 0.0
+
+        # Statistics
+        self.frames_processed = 0
+        self.frames_since_respawn = 0
+        self.respawn_count = 0
+        self.failed = False  # True once the worker could not be kept alive
+
+    def start(self, wait=True):
+        """Allocate shared memory and start the worker process
+
+        With wait=False the call returns right away; the worker is used once
+        poll_ready() has seen its READY message.
+        """
+        if self.frame_shm is None:
+            self.frame_shm = shared_memory.SharedMemory(create=True, size=self.slot_count * self.slot_bytes)
+            result_size = self.slot_count * self.max_det * DETECTION_FIELDS * 4
+            self.result_shm = shared_memory.SharedMemory(create=True, size=result_size)
+            self.results = np.ndarray((self.slot_count, self.max_det, DETECTION_FIELDS),
+                                      dtype=np.float32, buffer=self.result_shm.buf)
+
+        parent_conn, child_conn = self.context.Pipe()
+        self.process = self.context.Process(
+            target=inference_worker_main,
+            args=(self.model_path, self.use_gpu, self.frame_shm.name, self.result_shm.name,
+                  self.slot_count, self.slot_bytes, self.max_det, child_conn, self.cpu_plan),
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        self.pending.clear()
+        self.starting = True
+        self.ready_deadline = time.time() + self.ready_timeout
+
+        print(f"🧵 Inference worker starting (pid {self.process.pid}, {self.slot_count} shared frame slots)...")
+        if not wait:
+            return False
+        return self.poll_ready(self.ready_timeout)
+
+    def poll_ready(self, timeout=0.0):
+        """Check (or wait up to timeout) for the starting worker's READY message"""
+        if not self.starting:
+            return self.is_alive()
+        try:
+            if not self.conn.poll(timeout):
+                if time.time() < self.ready_deadline:
+                    return False  # Still loading the model
+                print("❌ Inference worker did not become ready in time")
+                ready = False
+            else:
+                ready = self.conn.recv_bytes() == READY_MESSAGE
+                if not ready:
+                    print("❌ Inference worker failed to load the model")
+        except (EOFError, OSError):
+            print("❌ Inference worker failed to load the model")
+            ready = False
+
+        self.starting = False
+        if not ready:
+            self.kill_process()
+            return False
+        print("✅ Inference worker ready - YOLO now runs outside the hotkey/keyboard process")
+        return True
+
+    @property
+    def ready(self):
+        """Whether frames can be submitted right now"""
+        return not self.failed and not self.starting and self.is_alive()
+
+    def is_alive(self):
+        """Check whether the worker process is running"""
+        return self.process is not None and self.process.is_alive()
+
+    def submit(self, frame, conf, iou, max_det, imgsz=None):
+        """Copy a frame into the next ring slot and queue it for inference, returns a ticket
+
+        Returns None (never blocks) while a replacement worker is still loading.
+        """
+        if self.failed:
+            return None
+        if self.starting and not self.poll_ready():
+            if not self.starting and not self.failed:
+                self.respawn("replacement worker did not start")
+            return None
+        if not self.is_alive():
+            self.respawn("worker process is not running")
+            return None
+
+        height, width = frame.shape[:2]
+        if height > self.frame_shape[0] or width > self.frame_shape[1]:
+            raise ValueError(f"frame {width}x{height} exceeds worker slot size {self.frame_shape[1]}x{self.frame_shape[0]}")
+
+        # Never overwrite a slot that the worker may still be reading
+        while len(self.pending) >= self.slot_count:
+            self.collect(self.pending[0])
+
+        seq = self.next_seq
+        self.next_seq = (self.next_seq + 1) & 0xFFFFFFFF
+        slot = seq % self.slot_count
+
+        slot_view = np.ndarray((height, width, 3), dtype=np.uint8, buffer=self.frame_shm.buf,
+                               offset=slot * self.slot_bytes)
+        slot_view[...] = frame[..., :3]
+
+        try:
+            self.conn.send_bytes(struct.pack(REQUEST_FORMAT, slot, seq, conf, iou,
+                                             min(max_det, self.max_det), imgsz or 0, height, width))
+        except (BrokenPipeError, OSError):
+            self.respawn("pipe to worker is broken")
+            return None
+
+        ticket = (slot, seq)
+        self.pending.append(ticket)
+        return ticket
+
+    def collect(self, ticket, timeout=None):
+        """Wait for a ticket's detections, returns an (n, 6) float32 array or None"""
+        if ticket is None or ticket not in self.pending:
+            return None
+        timeout = self.reply_timeout if timeout is None else timeout
+        deadline = time.time() + timeout
+
+        while self.pending:
+            remaining = deadline - time.time()
+            try:
+                if remaining <= 0 or not self.conn.poll(remaining):
+                    self.respawn(f"no reply within {timeout:.1f}s")
+                    return None
+                slot, seq, count = struct.unpack(REPLY_FORMAT, self.conn.recv_bytes())
+            except (EOFError, OSError):
+                self.respawn("worker process crashed")
+                return None
+
+            if self.pending and self.pending[0][1] == seq:
+                self.pending.popleft()
+            if seq != ticket[1]:
+                continue  # Reply for an older ticket nobody waited for
+
+            if count < 0:
+                return None
+            self.frames_processed += 1
+            self.frames_since_respawn += 1
+            if self.respawn_count and self.frames_since_respawn >= self.healthy_frames:
+                print(f"💚 Inference worker healthy for {self.frames_since_respawn} frames - respawn budget reset")
+                self.respawn_count = 0
+            return self.results[slot, :count].copy()
+
+        return None
+
+    def infer(self, frame, conf, iou, max_det, imgsz=None):
+        """Run one frame through the worker synchronously (None while it is down or restarting)"""
+        return self.collect(self.submit(frame, conf, iou, max_det, imgsz))
+
+    def respawn(self, reason):
+        """Replace a crashed or hung worker with a fresh process (started in the background)"""
+        print(f"⚠️ Inference worker lost ({reason}) - respawning in the background...")
+        self.kill_process()
+        self.frames_since_respawn = 0
+
+        if self.respawn_count >= self.max_respawns:
+            print(f"❌ Inference worker failed {self.respawn_count} times in a row - giving up on worker process")
+            self.failed = True
+            return False
+
+        self.respawn_count += 1
+        self.start(wait=False)
+        print(f"🔄 Inference worker respawning ({self.respawn_count}/{self.max_respawns}) - "
+              f"in-process inference until it is ready")
+        return True
+
+    def kill_process(self):
+        """Terminate the worker process and close the pipe"""
+        if self.process is not None:
+            if self.process.is_alive():
+                self.process.terminate()
+            self.process.join(timeout=2)
+            self.process = None
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+        self.pending.clear()
+        self.starting = False
+
+    def stop(self):
+        """Stop the worker and release shared memory"""
+        if self.conn is not None and self.is_alive():
+            try:
+                self.conn.send_bytes(STOP_MESSAGE)
+                self.process.join(timeout=2)
+            except (BrokenPipeError, OSError):
+                pass
+        self.kill_process()
+
+        self.results = None
+        for shm in (self.frame_shm, self.result_shm):
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+        self.frame_shm = None
+        self.result_shm = None
+        print("🧵 Inference worker stopped")
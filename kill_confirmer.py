@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+I-HNT Kill Confirmer
+Recognises a kill before the red health run has fully disappeared.
+
+While a target is locked, every engage tick grabs a search window around the
+target's bounding box, finds where the sprite taken when the fight started
+has moved to (the character and the camera keep moving during a fight) and
+compares the crop at that spot with the reference. It also keeps a short
+history of the health bar's red pixel count. A kill is confirmed when the
+health is nearly gone and the sprite has changed (death animation / corpse),
+when the HP trend says it has already reached zero, or when the red run is
+gone. Once the health is low the target is reported as "dying" so the
+caller can watch more often and pick the next target ahead of time.
+"""
+
+from collections import deque
+
+import cv2
+import numpy as np
+
+ALIVE, DYING, DEAD = 'alive', 'dying', 'dead'
+
+
+class KillConfirmer:
+    """Bbox pixel-diff + HP-trend kill detection for the locked target"""
+
+    def __init__(self, crop_size=32, pixel_threshold=30, changed_fraction=0.45, finish_fraction=0.25,
+                 trend_window=6, trend_horizon=0.0, search_margin=0.5):
+        self.crop_size = crop_size                # Crops are compared at this resolution
+        self.search_margin = search_margin        # Search window padding around the bbox (fraction of its size)
+        self.pixel_threshold = pixel_threshold    # Gray-level change that counts as a changed pixel
+        self.changed_fraction = changed_fraction  # Share of changed pixels that means the sprite is gone
+        self.finish_fraction = finish_fraction    # Health share below which the target is "dying"
+        self.trend_window = trend_window          # Red-pixel samples used for the HP trend
+        self.trend_horizon = trend_horizon        # Confirm once the trend is this close to zero (0 = already past it)
+
+        self.target_key = None
+        self.reference = None
+        self.reference_gray = None                # Full-size lock-time sprite, located in each search window
+        self.last_offset = None                   # Where it was found in the last search window (x, y)
+        self.peak_red = 0
+        self.history = deque(maxlen=trend_window)
+        self.locked_at = None
+
+        # Statistics
+        self.confirmations = {'health': 0, 'pixel_diff': 0, 'hp_trend': 0}
+        self.fight_time_total = 0.0
+
+    @staticmethod
+    def to_gray(crop):
+        if crop.ndim == 3:
+            crop = cv2.cvtColor(crop, cv2.COLOR_BGRA2GRAY if crop.shape[2] == 4 else cv2.COLOR_BGR2GRAY)
+        return crop
+
+    def prepare_crop(self, crop):
+        """Grayscale, fixed-size crop for comparisons"""
+        return cv2.resize(self.to_gray(crop), (self.crop_size, self.crop_size),
+                          interpolation=cv2.INTER_AREA).astype(np.int16)
+
+    def search_box(self, bbox):
+        """Bbox padded by search_margin on every side - grab this region for update()"""
+        x1, y1, x2, y2 = bbox
+        pad_x = (x2 - x1) * self.search_margin
+        pad_y = (y2 - y1) * self.search_margin
+        return (x1 - pad_x, y1 - pad_y, x2 + pad_x, y2 + pad_y)
+
+    def locate(self, window):
+        """Crop of the search window where the lock-time sprite matches best (None if it doesn't fit)"""
+        self.last_offset = None
+        if self.reference_gray is None or window is None:
+            return None
+        window = self.to_gray(window)
+        height, width = self.reference_gray.shape
+        if window.shape[0] < height or window.shape[1] < width:
+            return None
+        scores = cv2.matchTemplate(window, self.reference_gray, cv2.TM_SQDIFF)
+        x, y = cv2.minMaxLoc(scores)[2]
+        self.last_offset = (x, y)
+        return window[y:y + height, x:x + width]
+
+    def is_locked_on(self, target_key):
+        return self.target_key is not None and self.target_key == target_key
+
+    def lock(self, target_key, crop, red_pixels, now):
+        """Start watching a new target"""
+        self.target_key = target_key
+        self.reference = self.prepare_crop(crop) if crop is not None else None
+        self.reference_gray = self.to_gray(crop) if crop is not None else None
+        self.last_offset = None
+        self.peak_red = max(red_pixels, 1)
+        self.history.clear()
+        self.history.append((now, red_pixels))
+        self.locked_at = now
+
+    def release(self):
+        """Stop watching (target switched, player died, ...)"""
+        self.target_key = None
+        self.reference = None
+        self.reference_gray = None
+        self.last_offset = None
+        self.history.clear()
+
+    def changed_share(self, crop):
+        """Share of crop pixels that differ from the lock-time reference"""
+        if self.reference is None or crop is None:
+            return 0.0
+        difference = np.abs(self.prepare_crop(crop) - self.reference)
+        return float(np.count_nonzero(difference > self.pixel_threshold)) / difference.size
+
+    def seconds_to_zero(self):
+        """Linear HP-trend estimate of when the red run reaches zero (None if not falling)"""
+        if len(self.history) < 3:
+            return None
+        times = np.array([t for t, _ in self.history])
+        reds = np.array([r for _, r in self.history], dtype=np.float64)
+        slope, intercept = np.polyfit(times - times[-1], reds, 1)
+        if slope >= 0:
+            return None
+        return -intercept / slope
+
+    def update(self, window, red_pixels, now):
+        """Classify the locked target as ALIVE, DYING or DEAD from a search window grab and red count"""
+        crop = self.locate(window)
+        self.peak_red = max(self.peak_red, red_pixels)
+        self.history.append((now, red_pixels))
+        health = red_pixels / self.peak_red
+
+        if red_pixels == 0:
+            return self.confirm('health', now)
+
+        low_health = health < self.finish_fraction
+        if low_health and self.changed_share(crop) > self.changed_fraction:
+            return self.confirm('pixel_diff', now)
+
+        remaining = self.seconds_to_zero()
+        if low_health and remaining is not None and remaining <= self.trend_horizon:
+            return self.confirm('hp_trend', now)
+
+        if low_health or (remaining is not None and remaining < 1.0):
+            return DYING
+        return ALIVE
+
+    def confirm(self, reason, now):
+        """Count a confirmed kill and release the target"""
+        self.confirmations[reason] += 1
+        if self.locked_at is not None:
+            self.fight_time_total += now - self.locked_at
+        self.release()
+        return DEAD
+
+    def stats_summary(self):
+        """One-line kill confirmation report for the stats output"""
+        total = sum(self.confirmations.values())
+        early = total - self.confirmations['health']
+        average_fight = self.fight_time_total / total if total else 0.0
+        return (f"⚔️ Kill confirm: {total} kills ({early} before the red run vanished: "
+                f"{self.confirmations['pixel_diff']} pixel diff, {self.confirmations['hp_trend']} HP trend) | "
+                f"avg fight {average_fight:.1f}s")
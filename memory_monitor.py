@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+I-HNT Memory Monitor
+Keeps overnight hunting sessions memory-bounded, and proves it.
+
+    BufferPool      Fixed rings of reusable numpy buffers for the hot path.
+                    The game capture is converted straight into the next ring
+                    slot instead of a fresh copy every tick, so after the first
+                    few frames the loop allocates no frame-sized arrays at all.
+    MemorySampler   Samples the process RSS every minute. With trace=True it
+                    also takes tracemalloc snapshots and attributes Python
+                    allocations to subsystems (i_hnt modules by file, libraries
+                    by package). After a warm-up the first sample becomes the
+                    baseline; growth past the threshold prints a warning with
+                    the top growing subsystems and source lines. Samples can be
+                    appended to a CSV file for plotting a whole night.
+
+A frame taken from a pool is only valid until the ring comes round again -
+anything that keeps it longer (background writers, queues) has to copy it.
+"""
+
+import csv
+import os
+import sys
+import time
+import tracemalloc
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_DIR = Path(__file__).resolve().parent
+
+
+def current_rss_mb():
+    """Resident memory of this process in MB (None if the platform can't tell)"""
+    try:
+        if sys.platform == 'win32':
+            import ctypes
+            from ctypes import wintypes
+
+            class ProcessMemoryCounters(ctypes.Structure):
+                _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                            ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                            ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                            ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                            ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)]
+
+            counters = ProcessMemoryCounters()
+            counters.cb = ctypes.sizeof(counters)
+            ctypes.windll.psapi.GetProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(),
+                                                     ctypes.byref(counters), counters.cb)
+            return counters.WorkingSetSize / 1e6
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1e6
+    except Exception:
+        return None
+
+
+def subsystem_of(filename):
+    """Subsystem a source file belongs to: i_hnt module name, library package, or 'python'"""
+    path = Path(filename)
+    parts = path.parts
+    for marker in ('site-packages', 'dist-packages'):
+        if marker in parts and parts.index(marker) + 1 < len(parts):
+            return parts[parts.index(marker) + 1].split('.')[0]
+    try:
+        path.resolve().relative_to(PROJECT_DIR)
+        return path.stem
+    except (ValueError, OSError):
+        return 'python'
+
+
+class BufferPool:
+    """Fixed rings of reusable numpy buffers, one ring per shape/dtype"""
+
+    def __init__(self, slots=4):
+        self.slots = slots
+        self.rings = {}           # (shape, dtype) → [buffers, next index]
+
+        # Statistics
+        self.takes = 0
+        self.allocations = 0
+
+    def take(self, shape, dtype=np.uint8):
+        """Next buffer of this shape (allocated only while its ring is still filling up)"""
+        key = (tuple(shape), np.dtype(dtype).str)
+        ring = self.rings.setdefault(key, [[], 0])
+        buffers, index = ring
+        if len(buffers) < self.slots:
+            buffers.append(np.empty(shape, dtype=dtype))
+            self.allocations += 1
+            index = len(buffers) - 1
+        ring[1] = (index + 1) % self.slots
+        self.takes += 1
+        return buffers[index]
+
+    def nbytes(self):
+        return sum(buffer.nbytes for buffers, _ in self.rings.values() for buffer in buffers)
+
+    def stats_summary(self):
+        """One-line pool report for the stats output"""
+        return (f"♻️ Buffer pool: {self.takes} takes, {self.allocations} allocations | "
+                f"{len(self.rings)} rings x {self.slots} slots, {self.nbytes() / 1e6:.1f}MB fixed")
+
+
+class MemorySampler:
+    """Periodic RSS (+ tracemalloc per-subsystem) samples with growth warnings after a warm-up"""
+
+    def __init__(self, interval=60.0, warmup=300.0, growth_warn_mb=64.0, trace=False, log_path=None,
+                 history=1440, top=3):
+        self.interval = interval              # Seconds between samples
+        self.warmup = warmup                  # Seconds before the baseline is taken (model, caches, pools settle)
+        self.growth_warn_mb = growth_warn_mb  # Warn each time growth passes another multiple of this
+        self.trace = trace                    # tracemalloc attribution (a few % slower - for leak hunting)
+        self.log_path = Path(log_path) if log_path else None
+        self.top = top
+
+        self.started_at = None
+        self.last_sample = 0.0
+        self.baseline = None                  # {'time', 'rss', 'subsystems', 'snapshot'}
+        self.samples = deque(maxlen=history)  # (time, rss MB, {subsystem: MB})
+        self.warned_level = 0
+        self.started_tracing = False
+
+        # Statistics
+        self.sample_count = 0
+        self.warnings = 0
+        self.sample_seconds = 0.0
+
+    def start(self, now=None):
+        self.started_at = time.time() if now is None else now
+        self.last_sample = self.started_at
+        if self.trace and not tracemalloc.is_tracing():
+            tracemalloc.start(1)
+            self.started_tracing = True
+        if self.log_path is not None and not self.log_path.exists():
+            with open(self.log_path, 'w', newline='') as log:
+                csv.writer(log).writerow(['time', 'rss_mb', 'subsystem', 'traced_mb'])
+
+    def stop(self):
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+    def maybe_sample(self, now=None):
+        """Take a sample if the interval has passed (cheap to call every frame)"""
+        now = time.time() if now is None else now
+        if self.started_at is None or now - self.last_sample < self.interval:
+            return False
+        self.sample(now)
+        return True
+
+    def sample(self, now=None):
+        now = time.time() if now is None else now
+        start = time.perf_counter()
+        self.last_sample = now
+        rss = current_rss_mb()
+        snapshot = subsystems = None
+        if self.trace and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+            ])
+            subsystems = {}
+            for stat in snapshot.statistics('filename'):
+                name = subsystem_of(stat.traceback[0].filename)
+                subsystems[name] = subsystems.get(name, 0.0) + stat.size / 1e6
+        self.samples.append((now, rss, subsystems or {}))
+        self.sample_count += 1
+        self.log(now, rss, subsystems)
+
+        if self.baseline is None and now - self.started_at >= self.warmup:
+            self.baseline = {'time': now, 'rss': rss, 'subsystems': subsystems or {}, 'snapshot': snapshot}
+            print(f"🧠 Memory baseline after warm-up: {self.format_mb(rss)} RSS")
+        elif self.baseline is not None:
+            self.check_growth(rss, subsystems, snapshot)
+        self.sample_seconds += time.perf_counter() - start
+
+    def log(self, now, rss, subsystems):
+        if self.log_path is None:
+            return
+        try:
+            with open(self.log_path, 'a', newline='') as log:
+                writer = csv.writer(log)
+                writer.writerow([f"{now:.0f}", f"{rss:.1f}" if rss is not None else '', 'total', ''])
+                for name, size in sorted((subsystems or {}).items(), key=lambda item: -item[1])[:10]:
+                    writer.writerow([f"{now:.0f}", '', name, f"{size:.2f}"])
+        except Exception as e:
+            print(f"⚠️ Memory log write failed: {e}")
+
+    def growth(self):
+        """RSS growth since the baseline in MB (None before the baseline or without RSS)"""
+        if self.baseline is None or self.baseline['rss'] is None or not self.samples or self.samples[-1][1] is None:
+            return None
+        return self.samples[-1][1] - self.baseline['rss']
+
+    def growth_rate(self):
+        """RSS trend since the baseline in MB per hour (least squares over the samples)"""
+        if self.baseline is None:
+            return None
+        points = [(t, rss) for t, rss, _ in self.samples if t >= self.baseline['time'] and rss is not None]
+        if len(points) < 3:
+            return None
+        times, values = np.array(points).T
+        return float(np.polyfit((times - times[0]) / 3600, values, 1)[0])
+
+    def subsystem_growth(self, subsystems):
+        base = self.baseline['subsystems']
+        return sorted(((name, size - base.get(name, 0.0)) for name, size in subsystems.items()),
+                      key=lambda item: -item[1])
+
+    def check_growth(self, rss, subsystems, snapshot):
+        """Warn each time RSS (or traced) growth passes another growth_warn_mb"""
+        growth = self.growth()
+        if growth is None and subsystems:
+            growth = sum(subsystems.values()) - sum(self.baseline['subsystems'].values())
+        if growth is None or self.growth_warn_mb <= 0:
+            return
+        level = int(growth // self.growth_warn_mb)
+        if level <= self.warned_level:
+            return
+        self.warned_level = level
+        self.warnings += 1
+        minutes = (self.samples[-1][0] - self.baseline['time']) / 60
+        print(f"\n⚠️ MEMORY GROWTH: +{growth:.0f}MB in {minutes:.0f} min since warm-up "
+              f"({self.format_mb(rss)} RSS, trend {self.format_rate(self.growth_rate())})")
+        if subsystems:
+            for name, delta in self.subsystem_growth(subsystems)[:self.top]:
+                print(f"   📦 {name}: {delta:+.1f}MB")
+        if snapshot is not None and self.baseline['snapshot'] is not None:
+            for stat in snapshot.compare_to(self.baseline['snapshot'], 'lineno')[:self.top]:
+                frame = stat.traceback[0]
+                print(f"   📍 {Path(frame.filename).name}:{frame.lineno} {stat.size_diff / 1e6:+.1f}MB "
+                      f"({stat.count_diff:+d} blocks)")
+        if not subsystems:
+            print("   💡 Enable trace_memory to see which subsystem is growing")
+
+    @staticmethod
+    def format_mb(value):
+        return f"{value:.0f}MB" if value is not None else "n/a"
+
+    @staticmethod
+    def format_rate(value):
+        return f"{value:+.1f}MB/h" if value is not None else "n/a"
+
+    def stats_summary(self):
+        """One-line memory report for the stats output"""
+        rss = self.samples[-1][1] if self.samples else current_rss_mb()
+        if self.baseline is None:
+            trend = "warming up"
+        else:
+            growth = self.growth()
+            trend = f"{growth:+.1f}MB since warm-up, {self.format_rate(self.growth_rate())}" \
+                if growth is not None else "no RSS"
+        top = ""
+        if self.baseline is not None and self.samples and self.samples[-1][2]:
+            name, delta = self.subsystem_growth(self.samples[-1][2])[0]
+            top = f" | top growth {name} {delta:+.1f}MB"
+        return (f"🧠 Memory: {self.format_mb(rss)} RSS ({trend}){top} | "
+                f"{self.sample_count} samples, {self.warnings} warnings")
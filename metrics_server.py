@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+I-HNT Metrics Server
+Serves live hunting metrics in Prometheus text format on a local HTTP port so
+unattended machines can be scraped instead of watched.
+
+    curl http://127.0.0.1:9109/metrics
+
+The detection loop is the only writer: it bumps plain integer/float
+attributes and fixed-bucket histogram lists. The HTTP thread never takes a
+lock - it copies those values (atomic under the GIL) while rendering, so a
+scrape can at worst see a histogram sum one observation ahead of its count,
+and never blocks the loop.
+"""
+
+import bisect
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+HUNTING_STATES = ('acquire', 'explore', 'engage', 'finish', 'dead', 'paused')
+STAGE_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram written by a single thread"""
+
+    def __init__(self, buckets=STAGE_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self):
+        """Cumulative bucket counts, sum and count for rendering"""
+        counts = list(self.counts)
+        cumulative, running = [], 0
+        for count in counts:
+            running += count
+            cumulative.append(running)
+        return cumulative, self.sum, running
+
+
+class HuntingMetrics:
+    """Counters, gauges and per-stage histograms updated by the detection loop"""
+
+    def __init__(self, fps_smoothing=0.1):
+        self.fps_smoothing = fps_smoothing
+        self.started = time.time()
+
+        self.frames = 0
+        self.detections_total = 0
+        self.last_detections = 0
+        self.zone_mobs = 0
+        self.kills = 0
+        self.lost_targets = 0
+        self.pet_skips = 0
+        self.deaths = 0
+        self.state = None
+        self.fps = 0.0
+        self.last_frame_at = None
+        self.stages = {stage: Histogram() for stage in ('capture', 'detect', 'act', 'loop')}
+        self.detections_per_frame = Histogram((0, 1, 2, 3, 5, 8, 13, 21))
+
+    # ------------------------------------------------------------ writer side (detection loop)
+
+    def observe_stage(self, stage, seconds):
+        """Add one latency sample for a loop stage"""
+        self.stages[stage].observe(seconds)
+
+    def record_detections(self, detections, zone_mobs):
+        """Count the detections of one full detection pass"""
+        self.last_detections = detections
+        self.zone_mobs = zone_mobs
+        self.detections_total += detections
+        self.detections_per_frame.observe(detections)
+
+    def record_loop(self, state, loop_time, now):
+        """Finish a loop iteration - state, loop latency and smoothed FPS"""
+        self.state = state
+        self.frames += 1
+        self.stages['loop'].observe(loop_time)
+        if self.last_frame_at is not None and now > self.last_frame_at:
+            rate = 1.0 / (now - self.last_frame_at)
+            self.fps = rate if self.fps == 0.0 else self.fps + self.fps_smoothing * (rate - self.fps)
+        self.last_frame_at = now
+
+    # ------------------------------------------------------------ reader side (HTTP thread)
+
+    def render(self):
+        """Prometheus text exposition of the current values"""
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{name}{labels} {value}")
+
+        metric("ihnt_uptime_seconds", "gauge", "Seconds since the detection loop started",
+               [("", round(time.time() - self.started, 3))])
+        metric("ihnt_loop_fps", "gauge", "Smoothed detection loop rate",
+               [("", round(self.fps, 3))])
+        metric("ihnt_frames_total", "counter", "Detection loop iterations", [("", self.frames)])
+        state = self.state
+        metric("ihnt_state", "gauge", "Current hunting state (1 = active)",
+               [(f'{{state="{name}"}}', int(name == state)) for name in HUNTING_STATES])
+        metric("ihnt_detections_total", "counter", "Mobs detected over all full detection passes",
+               [("", self.detections_total)])
+        metric("ihnt_detections_last", "gauge", "Mobs detected in the latest full pass",
+               [("", self.last_detections)])
+        metric("ihnt_zone_mobs_last", "gauge", "Mobs inside the hunting zone in the latest full pass",
+               [("", self.zone_mobs)])
+        metric("ihnt_kills_total", "counter", "Confirmed kills", [("", self.kills)])
+        metric("ihnt_lost_targets_total", "counter", "Targets lost without a kill (deselected, out of range)",
+               [("", self.lost_targets)])
+        metric("ihnt_pet_skips_total", "counter", "Clicks that selected a pet and were skipped",
+               [("", self.pet_skips)])
+        metric("ihnt_deaths_total", "counter", "Player deaths", [("", self.deaths)])
+
+        lines.append("# HELP ihnt_stage_seconds Latency of each detection loop stage")
+        lines.append("# TYPE ihnt_stage_seconds histogram")
+        for stage, histogram in list(self.stages.items()):
+            self.render_histogram(lines, "ihnt_stage_seconds", histogram, f'stage="{stage}",')
+
+        lines.append("# HELP ihnt_detections_per_frame Mobs detected per full detection pass")
+        lines.append("# TYPE ihnt_detections_per_frame histogram")
+        self.render_histogram(lines, "ihnt_detections_per_frame", self.detections_per_frame, "")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def render_histogram(lines, name, histogram, labels):
+        cumulative, total, count = histogram.snapshot()
+        for bound, value in zip(histogram.buckets, cumulative):
+            lines.append(f'{name}_bucket{{{labels}le="{bound}"}} {value}')
+        lines.append(f'{name}_bucket{{{labels}le="+Inf"}} {cumulative[-1]}')
+        label_block = f"{{{labels.rstrip(',')}}}" if labels else ""
+        lines.append(f"{name}_sum{label_block} {total:.6f}")
+        lines.append(f"{name}_count{label_block} {count}")
+
+
+class MetricsServer:
+    """Background HTTP server exposing HuntingMetrics at /metrics"""
+
+    def __init__(self, metrics, host="127.0.0.1", port=9109):
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self.server = None
+        self.thread = None
+        self.scrapes = 0
+
+    def start(self):
+        """Bind the port and serve from a daemon thread"""
+        owner = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/metrics', '/'):
+                    self.send_error(404)
+                    return
+                body = owner.metrics.render().encode('utf-8')
+                owner.scrapes += 1
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep the console for the hunting log
+
+        self.server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, name="metrics-server", daemon=True)
+        self.thread.start()
+        print(f"📡 Metrics endpoint: http://{self.host}:{self.server.server_address[1]}/metrics")
+
+    def stop(self):
+        """Shut the server down"""
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
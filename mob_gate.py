@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+I-HNT Mob Gate - cheap "any mob present?" check before full YOLO
+Tier 1 of the detection cascade: the hunting zone is shrunk to a tiny grid of
+16x16 cells and a logistic-regression classifier scores each cell from color
+and edge statistics. Full YOLO (tier 2) only runs when some cell looks like a mob.
+
+Train it from the sprites in monsters_images/ plus background screenshots of
+empty hunting areas (I-HNT can collect those for you into gate_backgrounds/):
+
+    python mob_gate.py --monsters monsters_images --backgrounds gate_backgrounds
+"""
+
+import argparse
+import random
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+CELL_PIXELS = 16        # Each gate cell is resized to 16x16 pixels
+HUE_BINS = 8
+VALUE_BINS = 4
+FEATURE_COUNT = HUE_BINS * 2 + VALUE_BINS + 2 + 3
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+
+def window_features(images):
+    """Gate features for every half-overlapping 16x16 window of a (B, H, W, 3) uint8 RGB batch
+
+    H and W must be multiples of 16. Statistics are summed per 8x8 block once and
+    neighbouring blocks are added up, so overlapping windows cost almost nothing.
+    """
+    batch, height, width, _ = images.shape
+    block = CELL_PIXELS // 2
+    blocks_y, blocks_x = height // block, width // block
+    block_count = batch * blocks_y * blocks_x
+
+    hsv = cv2.cvtColor(images.reshape(-1, width, 3), cv2.COLOR_RGB2HSV).reshape(batch, height, width, 3)
+    hue_sat = hsv[..., 0].astype(np.int32) * HUE_BINS // 180 * 2 + (hsv[..., 1] >= 80)
+    value = hsv[..., 2].astype(np.int32) * VALUE_BINS // 256
+
+    # Block index of every pixel, used as a bincount offset
+    block_ids = (np.arange(batch)[:, None, None] * blocks_y + np.arange(height)[None, :, None] // block) * blocks_x \
+        + np.arange(width)[None, None, :] // block
+    hue_sat_hist = np.bincount((block_ids * HUE_BINS * 2 + hue_sat).ravel(), minlength=block_count * HUE_BINS * 2)
+    value_hist = np.bincount((block_ids * VALUE_BINS + value).ravel(), minlength=block_count * VALUE_BINS)
+
+    # Edge energy, ignoring differences that cross an 8x8 block boundary
+    pixels = images.astype(np.float32)
+    gray = pixels.mean(axis=3)
+    grad_x = np.zeros_like(gray)
+    grad_y = np.zeros_like(gray)
+    grad_x[:, :, :-1] = np.abs(np.diff(gray, axis=2))
+    grad_y[:, :-1, :] = np.abs(np.diff(gray, axis=1))
+    grad_x[:, :, block - 1::block] = 0
+    grad_y[:, block - 1::block, :] = 0
+
+    per_pixel = np.concatenate([grad_x[..., None], grad_x[..., None] ** 2, grad_y[..., None], grad_y[..., None] ** 2,
+                                pixels, pixels ** 2], axis=3)
+    sums = per_pixel.reshape(batch, blocks_y, block, blocks_x, block, -1).sum(axis=(2, 4))
+    sums = np.concatenate([hue_sat_hist.reshape(batch, blocks_y, blocks_x, -1),
+                           value_hist.reshape(batch, blocks_y, blocks_x, -1), sums], axis=3).astype(np.float32)
+
+    # 2x2 blocks make one window
+    windows = sums[:, :-1, :-1] + sums[:, 1:, :-1] + sums[:, :-1, 1:] + sums[:, 1:, 1:]
+    windows = windows.reshape(-1, windows.shape[-1])
+
+    window_pixels = CELL_PIXELS * CELL_PIXELS
+    gradient_pixels = CELL_PIXELS * (CELL_PIXELS - 2)
+    histograms = windows[:, :HUE_BINS * 2 + VALUE_BINS] / window_pixels
+    gx_mean, gx_sq, gy_mean, gy_sq = (windows[:, HUE_BINS * 2 + VALUE_BINS + i] / gradient_pixels for i in range(4))
+    gradients = np.stack([gx_mean + gy_mean,
+                          np.sqrt(np.maximum(gx_sq - gx_mean ** 2, 0)) + np.sqrt(np.maximum(gy_sq - gy_mean ** 2, 0))],
+                         axis=1) / 64.0
+    color_mean = windows[:, -6:-3] / window_pixels
+    color_spread = np.sqrt(np.maximum(windows[:, -3:] / window_pixels - color_mean ** 2, 0)) / 64.0
+
+    return np.hstack([histograms, gradients, color_spread]).astype(np.float32)
+
+
+def load_images(folder):
+    """Load every image in a folder as RGB"""
+    images = []
+    for path in sorted(Path(folder).iterdir()):
+        if path.suffix.lower() in IMAGE_EXTENSIONS:
+            image = cv2.imread(str(path))
+            if image is not None:
+                images.append(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+    return images
+
+
+def random_crop(image, size):
+    """Take a random square crop (size is clamped to the image)"""
+    height, width = image.shape[:2]
+    size = min(size, height, width)
+    top = random.randint(0, height - size)
+    left = random.randint(0, width - size)
+    return image[top:top + size, left:left + size]
+
+
+def composite_sprite(sprite, background, sprite_size):
+    """Paste a white-background sprite onto a background crop at a random position"""
+    sprite = cv2.resize(sprite, (sprite_size, sprite_size), interpolation=cv2.INTER_AREA)
+    # Sprites have near-white backgrounds - treat those pixels as transparent
+    alpha = (sprite.min(axis=2) < 235).astype(np.float32)
+    alpha = cv2.GaussianBlur(alpha, (3, 3), 0)[..., None]
+
+    canvas = background.copy()
+    size = canvas.shape[0]
+    top = random.randint(0, max(0, size - sprite_size))
+    left = random.randint(0, max(0, size - sprite_size))
+    region = canvas[top:top + sprite_size, left:left + sprite_size].astype(np.float32)
+    blended = alpha[:region.shape[0], :region.shape[1]] * sprite[:region.shape[0], :region.shape[1]] + \
+        (1 - alpha[:region.shape[0], :region.shape[1]]) * region
+    canvas[top:top + sprite_size, left:left + sprite_size] = blended.astype(np.uint8)
+    return canvas
+
+
+def to_cell(image):
+    """Resize an RGB crop to a single gate cell"""
+    return cv2.resize(image, (CELL_PIXELS, CELL_PIXELS), interpolation=cv2.INTER_AREA)
+
+
+class MobGate:
+    """Tiny per-cell mob classifier used as the first tier of the detection cascade"""
+
+    def __init__(self, weights=None, bias=0.0, mean=None, std=None, threshold=0.5, cell_size=96):
+        self.weights = np.zeros(FEATURE_COUNT, dtype=np.float32) if weights is None else weights
+        self.bias = float(bias)
+        self.mean = np.zeros(FEATURE_COUNT, dtype=np.float32) if mean is None else mean
+        self.std = np.ones(FEATURE_COUNT, dtype=np.float32) if std is None else std
+        self.threshold = float(threshold)
+        self.cell_size = int(cell_size)  # Native screen pixels covered by one gate cell
+
+        # Cascade statistics
+        self.checks = 0
+        self.skipped = 0
+        self.full_passes = 0
+        self.full_pass_hits = 0   # Full passes that really found mobs in the zone
+        self.audits = 0
+        self.audit_misses = 0     # Skipped frames where an audit found mobs anyway
+        self.total_check_time = 0.0
+
+    # ------------------------------------------------------------------ scoring
+
+    def score_windows(self, images):
+        """Mob probability for each 16x16 window of a (B, H, W, 3) batch"""
+        features = (window_features(images) - self.mean) / self.std
+        return 1.0 / (1.0 + np.exp(-(features @ self.weights + self.bias)))
+
+    def zone_image(self, frame, zone_box):
+        """Shrink the hunting zone so one gate cell covers cell_size screen pixels"""
+        left, top, right, bottom = zone_box
+        zone = frame[top:bottom, left:right]
+        if zone.size == 0:
+            return None
+
+        grid_x = max(1, int(np.ceil(zone.shape[1] / self.cell_size)))
+        grid_y = max(1, int(np.ceil(zone.shape[0] / self.cell_size)))
+        small = cv2.resize(zone, (grid_x * CELL_PIXELS, grid_y * CELL_PIXELS), interpolation=cv2.INTER_AREA)
+        # The gate works on RGB - convert only the tiny zone image (raw BGRA or BGR capture)
+        small = cv2.cvtColor(small, cv2.COLOR_BGRA2RGB if small.shape[2] == 4 else cv2.COLOR_BGR2RGB)
+        return small
+
+    def check(self, frame, zone_box):
+        """Return (mob_candidates_present, best_cell_score) for the hunting zone"""
+        start = time.perf_counter()
+        small = self.zone_image(frame, zone_box)
+        best_score = float(self.score_windows(small[None]).max()) if small is not None else 0.0
+        self.total_check_time += time.perf_counter() - start
+
+        self.checks += 1
+        has_candidates = best_score >= self.threshold
+        if not has_candidates:
+            self.skipped += 1
+        return has_candidates, best_score
+
+    def record_full_pass(self, found_zone_mobs, audit=False):
+        """Record what the full YOLO pass found after a gate decision"""
+        if audit:
+            self.audits += 1
+            if found_zone_mobs:
+                self.audit_misses += 1
+        else:
+            self.full_passes += 1
+            if found_zone_mobs:
+                self.full_pass_hits += 1
+
+    def stats_summary(self):
+        """One-line cascade report for the stats output"""
+        skip_rate = self.skipped / self.checks * 100 if self.checks else 0.0
+        hit_rate = self.full_pass_hits / self.full_passes * 100 if self.full_passes else 0.0
+        avg_ms = self.total_check_time / self.checks * 1000 if self.checks else 0.0
+        return (f"🚦 Cascade: threshold {self.threshold:.2f} | {self.checks} checks ({avg_ms:.2f}ms avg) | "
+                f"skipped {self.skipped} ({skip_rate:.0f}%) | full-pass hit rate {hit_rate:.0f}% | "
+                f"audit misses {self.audit_misses}/{self.audits}")
+
+    # ------------------------------------------------------------ persistence
+
+    def save(self, path):
+        """Save the trained gate to an .npz file"""
+        np.savez(path, weights=self.weights, bias=self.bias, mean=self.mean, std=self.std,
+                 threshold=self.threshold, cell_size=self.cell_size)
+
+    @classmethod
+    def load(cls, path):
+        """Load a trained gate from an .npz file"""
+        data = np.load(path)
+        return cls(weights=data['weights'].astype(np.float32), bias=float(data['bias']),
+                   mean=data['mean'].astype(np.float32), std=data['std'].astype(np.float32),
+                   threshold=float(data['threshold']), cell_size=int(data['cell_size']))
+
+    # --------------------------------------------------------------- training
+
+    @classmethod
+    def train(cls, sprites, backgrounds, samples=4000, cell_size=96, target_recall=0.98,
+              epochs=400, learning_rate=0.5, l2=1e-3, seed=0):
+        """Train the gate from mob sprites composited onto background crops"""
+        random.seed(seed)
+        np.random.seed(seed)
+
+        positives, negatives = [], []
+        for _ in range(samples):
+            crop_size = int(cell_size * random.uniform(0.7, 1.5))
+            negatives.append(to_cell(random_crop(random.choice(backgrounds), crop_size)))
+
+            background = cv2.resize(random_crop(random.choice(backgrounds), crop_size), (crop_size, crop_size))
+            sprite_size = max(8, int(crop_size * random.uniform(0.5, 1.0)))
+            positives.append(to_cell(composite_sprite(random.choice(sprites), background, sprite_size)))
+
+        cells = np.stack(positives + negatives)
+        features = np.vstack([window_features(cells[i:i + 1000]) for i in range(0, len(cells), 1000)])
+        labels = np.concatenate([np.ones(len(positives)), np.zeros(len(negatives))]).astype(np.float32)
+
+        # Hold out 20% to calibrate the threshold
+        order = np.random.permutation(len(labels))
+        split = int(len(order) * 0.8)
+        train_idx, val_idx = order[:split], order[split:]
+
+        mean = features[train_idx].mean(axis=0)
+        std = features[train_idx].std(axis=0) + 1e-6
+        x_train = (features[train_idx] - mean) / std
+        y_train = labels[train_idx]
+
+        # Plain batch gradient descent logistic regression
+        weights = np.zeros(FEATURE_COUNT, dtype=np.float32)
+        bias = 0.0
+        for _ in range(epochs):
+            predictions = 1.0 / (1.0 + np.exp(-(x_train @ weights + bias)))
+            error = predictions - y_train
+            weights -= learning_rate * (x_train.T @ error / len(y_train) + l2 * weights)
+            bias -= learning_rate * float(error.mean())
+
+        gate = cls(weights=weights.astype(np.float32), bias=bias, mean=mean, std=std, cell_size=cell_size)
+
+        # Lowest threshold that still keeps the requested recall on held-out mobs
+        val_scores = gate.score_windows(cells[val_idx])
+        val_labels = labels[val_idx]
+        mob_scores = np.sort(val_scores[val_labels == 1])
+        cut = int(np.floor((1.0 - target_recall) * len(mob_scores)))
+        gate.threshold = float(mob_scores[cut]) if len(mob_scores) else 0.5
+
+        predicted = val_scores >= gate.threshold
+        recall = predicted[val_labels == 1].mean() if (val_labels == 1).any() else 0.0
+        background_pass = predicted[val_labels == 0].mean() if (val_labels == 0).any() else 0.0
+        return gate, recall, background_pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the I-HNT mob gate (detection cascade tier 1)")
+    parser.add_argument('--monsters', default='monsters_images', help="Folder with mob sprite images")
+    parser.add_argument('--backgrounds', default='gate_backgrounds', help="Folder with empty-area screenshots")
+    parser.add_argument('--output', default='mob_gate.npz', help="Where to save the trained gate")
+    parser.add_argument('--samples', type=int, default=4000, help="Positive/negative samples to generate")
+    parser.add_argument('--cell-size', type=int, default=96, help="Screen pixels covered by one gate cell")
+    parser.add_argument('--recall', type=float, default=0.98, help="Target mob recall for the threshold")
+    args = parser.parse_args()
+
+    print("🚦 I-HNT Mob Gate Training")
+    print("=" * 50)
+    sprites = load_images(args.monsters)
+    backgrounds = load_images(args.backgrounds) if Path(args.backgrounds).exists() else []
+    print(f"   🐲 Mob sprites: {len(sprites)} from {args.monsters}")
+    print(f"   🌄 Backgrounds: {len(backgrounds)} from {args.backgrounds}")
+
+    if not sprites or not backgrounds:
+        print("❌ Need both mob sprites and background screenshots to train")
+        print("💡 Enable cascade_collect_backgrounds in i_hnt.py to gather backgrounds while hunting")
+        return
+
+    start_time = time.time()
+    gate, recall, background_pass = MobGate.train(sprites, backgrounds, samples=args.samples,
+                                                  cell_size=args.cell_size, target_recall=args.recall)
+    gate.save(args.output)
+
+    print(f"✅ Gate trained in {time.time() - start_time:.1f}s - saved to {args.output}")
+    print(f"   🎯 Threshold: {gate.threshold:.3f}")
+    print(f"   📈 Held-out mob recall: {recall * 100:.1f}%")
+    print(f"   🌄 Held-out background pass rate: {background_pass * 100:.1f}% (lower = more YOLO skipped)")
+
+
+if __name__ == "__main__":
+    main()
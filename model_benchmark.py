@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+I-HNT Model Benchmark
+Compares detector configurations (model file, export format, imgsz, conf,
+iou) on a labeled image folder and writes the best one to model_config.json,
+which load_yolo_model reads directly.
+
+    python model_benchmark.py --models yolov8n.pt runs/train/weights/best.pt --imgsz 480 640
+    python model_benchmark.py --models best.pt --formats pt onnx --conf 0.25 0.35 --max-p95 60
+
+The labeled folder uses the YOLO layout written by dataset_builder.py
+(dataset/images/val + dataset/labels/val), or images with .txt labels next
+to them. Every configuration runs in a fresh process so cold-start time and
+peak memory are measured cleanly:
+
+    cold      model load + first inference
+    warm      p50 / p95 latency per image after warm-up, and throughput
+    memory    peak resident set size of the benchmark process
+    quality   precision / recall / F1 at IoU 0.5 (class-agnostic by default)
+"""
+
+import argparse
+import itertools
+import json
+import multiprocessing as mp
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from model_manager import box_iou
+
+CONFIG_FILE = "model_config.json"
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process in MB (None if the platform can't tell)"""
+    try:
+        if sys.platform == 'win32':
+            import ctypes
+            from ctypes import wintypes
+
+            class ProcessMemoryCounters(ctypes.Structure):
+                _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                            ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                            ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                            ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                            ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)]
+
+            counters = ProcessMemoryCounters()
+            counters.cb = ctypes.sizeof(counters)
+            ctypes.windll.psapi.GetProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(),
+                                                     ctypes.byref(counters), counters.cb)
+            return counters.PeakWorkingSetSize / 1e6
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1e6 if sys.platform == 'darwin' else peak / 1e3  # macOS reports bytes, Linux KB
+    except Exception:
+        return None
+
+
+# ------------------------------------------------------------------ labeled data
+
+def load_labeled_images(data_dir, limit=None):
+    """[(image path, (n, 5) array of class x1 y1 x2 y2 in pixels)] from a YOLO-format folder"""
+    data_dir = Path(data_dir)
+    if (data_dir / 'images' / 'val').exists():
+        image_dir, label_dir = data_dir / 'images' / 'val', data_dir / 'labels' / 'val'
+    else:
+        image_dir = label_dir = data_dir
+    samples = []
+    for path in sorted(image_dir.iterdir()):
+        if path.suffix.lower() not in IMAGE_EXTENSIONS:
+            continue
+        label_path = label_dir / f"{path.stem}.txt"
+        image = cv2.imread(str(path))
+        if image is None:
+            continue
+        height, width = image.shape[:2]
+        boxes = []
+        if label_path.exists():
+            for line in label_path.read_text().split('\n'):
+                parts = line.split()
+                if len(parts) < 5:
+                    continue
+                class_id, cx, cy, w, h = int(parts[0]), *map(float, parts[1:5])
+                boxes.append([class_id, (cx - w / 2) * width, (cy - h / 2) * height,
+                              (cx + w / 2) * width, (cy + h / 2) * height])
+        samples.append((str(path), np.array(boxes, dtype=np.float32).reshape(-1, 5)))
+        if limit and len(samples) >= limit:
+            break
+    return samples
+
+
+def match_counts(predictions, truth, iou_threshold=0.5, class_aware=False):
+    """(true positives, false positives, false negatives) for one image, greedy by confidence"""
+    if len(truth) == 0:
+        return 0, len(predictions), 0
+    if len(predictions) == 0:
+        return 0, 0, len(truth)
+    unmatched = np.ones(len(truth), dtype=bool)
+    true_positives = 0
+    for x1, y1, x2, y2, _, class_id in predictions[np.argsort(-predictions[:, 4])][:, :6]:
+        ious = box_iou((x1, y1, x2, y2), truth[:, 1:5]) * unmatched
+        if class_aware:
+            ious *= truth[:, 0] == int(class_id)
+        best = int(np.argmax(ious))
+        if ious[best] >= iou_threshold:
+            unmatched[best] = False
+            true_positives += 1
+    return true_positives, len(predictions) - true_positives, int(unmatched.sum())
+
+
+# ------------------------------------------------------------------ benchmarking
+
+def export_model(model_path, export_format, imgsz):
+    """Path of model_path exported to a format (exported once, then reused)"""
+    if export_format == 'pt':
+        return model_path
+    from ultralytics import YOLO
+    print(f"   📦 Exporting {model_path} to {export_format} (imgsz {imgsz})...")
+    return str(YOLO(model_path).export(format=export_format, imgsz=imgsz))
+
+
+def benchmark_config(config, samples, warmup=3, repeats=2, class_aware=False):
+    """Measure one configuration (runs inside a fresh process)"""
+    from ultralytics import YOLO
+    options = dict(conf=config['conf'], iou=config['iou'], imgsz=config['imgsz'], verbose=False)
+    images = [cv2.imread(path) for path, _ in samples]  # BGR, like the live capture
+
+    start = time.perf_counter()
+    model = YOLO(config['model'])
+    load_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    model(images[0], **options)
+    first_seconds = time.perf_counter() - start
+
+    for i in range(warmup):
+        model(images[i % len(images)], **options)
+
+    latencies, counts = [], np.zeros(3, dtype=np.int64)
+    for repeat in range(repeats):
+        for image, (_, truth) in zip(images, samples):
+            start = time.perf_counter()
+            results = model(image, **options)
+            latencies.append(time.perf_counter() - start)
+            if repeat == 0:
+                boxes = results[0].boxes.data.cpu().numpy() if results and results[0].boxes is not None \
+                    else np.empty((0, 6), dtype=np.float32)
+                counts += match_counts(boxes, truth, class_aware=class_aware)
+
+    true_positives, false_positives, false_negatives = (int(c) for c in counts)
+    precision = true_positives / (true_positives + false_positives) if true_positives + false_positives else 0.0
+    recall = true_positives / (true_positives + false_negatives) if true_positives + false_negatives else 0.0
+    return {
+        'cold_load_ms': load_seconds * 1000,
+        'cold_first_ms': first_seconds * 1000,
+        'p50_ms': float(np.percentile(latencies, 50) * 1000),
+        'p95_ms': float(np.percentile(latencies, 95) * 1000),
+        'throughput_fps': len(latencies) / sum(latencies),
+        'peak_rss_mb': peak_rss_mb(),
+        'precision': precision,
+        'recall': recall,
+        'f1': 2 * precision * recall / (precision + recall) if precision + recall else 0.0,
+    }
+
+
+def describe_config(config):
+    """Short human-readable configuration label"""
+    return f"{Path(config['model']).name} imgsz={config['imgsz']} conf={config['conf']} iou={config['iou']}"
+
+
+def run_benchmark(models, data_dir, formats=('pt',), imgsz_values=(640,), conf_values=(0.25,), iou_values=(0.45,),
+                  limit=50, class_aware=False):
+    """Benchmark every combination, returns the list of configs with their measurements"""
+    samples = load_labeled_images(data_dir, limit)
+    if not samples:
+        print(f"❌ No images found in {data_dir}")
+        return []
+    labeled = sum(len(truth) for _, truth in samples)
+    print(f"🧪 {len(samples)} images with {labeled} labeled mobs from {data_dir}")
+
+    context = mp.get_context('spawn')
+    configs = []
+    for model_path, export_format, imgsz in itertools.product(models, formats, imgsz_values):
+        try:
+            exported = export_model(model_path, export_format, imgsz)
+        except Exception as e:
+            print(f"   ❌ {model_path} → {export_format}: {e}")
+            continue
+        for conf, iou in itertools.product(conf_values, iou_values):
+            config = {'model': exported, 'format': export_format, 'imgsz': imgsz, 'conf': conf, 'iou': iou}
+            try:
+                with context.Pool(1) as pool:
+                    config.update(pool.apply(benchmark_config, (config, samples), {'class_aware': class_aware}))
+            except Exception as e:
+                print(f"   ❌ {describe_config(config)}: {e}")
+                continue
+            configs.append(config)
+            print(f"   ⏱️ {describe_config(config):<48} p95 {config['p95_ms']:6.1f}ms | "
+                  f"P {config['precision']:.2f} R {config['recall']:.2f}")
+    return configs
+
+
+def select_config(configs, max_p95_ms=None, f1_tolerance=0.01):
+    """Best F1 within the latency budget; near-ties go to the faster configuration"""
+    eligible = [c for c in configs if max_p95_ms is None or c['p95_ms'] <= max_p95_ms] or configs
+    if not eligible:
+        return None
+    best_f1 = max(c['f1'] for c in eligible)
+    return min((c for c in eligible if c['f1'] >= best_f1 - f1_tolerance), key=lambda c: c['p95_ms'])
+
+
+def print_table(configs, selected):
+    print(f"{'':2}{'Configuration':<48} {'Load ms':>8} {'1st ms':>7} {'p50 ms':>7} {'p95 ms':>7} "
+          f"{'FPS':>6} {'RSS MB':>7} {'Prec':>5} {'Rec':>5} {'F1':>5}")
+    for config in sorted(configs, key=lambda c: -c['f1']):
+        rss = f"{config['peak_rss_mb']:.0f}" if config['peak_rss_mb'] is not None else "-"
+        marker = "⭐" if config is selected else "  "
+        print(f"{marker}{describe_config(config):<48} {config['cold_load_ms']:>8.0f} {config['cold_first_ms']:>7.0f} "
+              f"{config['p50_ms']:>7.1f} {config['p95_ms']:>7.1f} {config['throughput_fps']:>6.1f} {rss:>7} "
+              f"{config['precision']:>5.2f} {config['recall']:>5.2f} {config['f1']:>5.2f}")
+
+
+def write_config(config, path=CONFIG_FILE):
+    """Save the chosen configuration in the format load_yolo_model reads"""
+    with open(path, 'w') as f:
+        json.dump({
+            'model': config['model'],
+            'imgsz': config['imgsz'],
+            'conf': config['conf'],
+            'iou': config['iou'],
+            'benchmark': {key: config[key] for key in ('p50_ms', 'p95_ms', 'precision', 'recall', 'f1')},
+        }, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark detector configurations and pick one for I-HNT")
+    parser.add_argument('--models', nargs='+', default=['yolov8n.pt'], help="Model files to compare")
+    parser.add_argument('--data', default='dataset', help="Labeled YOLO folder (dataset_builder.py output)")
+    parser.add_argument('--formats', nargs='+', default=['pt'], help="Export formats to try (pt, onnx, openvino, ...)")
+    parser.add_argument('--imgsz', nargs='+', type=int, default=[640], help="Inference sizes to try")
+    parser.add_argument('--conf', nargs='+', type=float, default=[0.25], help="Confidence thresholds to try")
+    parser.add_argument('--iou', nargs='+', type=float, default=[0.45], help="NMS IoU thresholds to try")
+    parser.add_argument('--limit', type=int, default=50, help="Max images to evaluate")
+    parser.add_argument('--max-p95', type=float, help="Latency budget (ms) for the recommendation")
+    parser.add_argument('--class-aware', action='store_true', help="Require matching class ids")
+    parser.add_argument('--output', default=CONFIG_FILE, help="Where to write the recommended config")
+    args = parser.parse_args()
+
+    print("🧪 I-HNT Model Benchmark")
+    print("=" * 50)
+    configs = run_benchmark(args.models, args.data, args.formats, args.imgsz, args.conf, args.iou,
+                            args.limit, args.class_aware)
+    if not configs:
+        print("❌ No configuration could be benchmarked")
+        return
+    selected = select_config(configs, args.max_p95)
+    print("=" * 110)
+    print_table(configs, selected)
+    write_config(selected, args.output)
+    print("=" * 110)
+    print(f"✅ Recommended: {describe_config(selected)} → {args.output} (used by load_yolo_model on the next start)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+I-HNT Model Manager
+Reloads the YOLO model while the bot keeps hunting.
+
+A watcher thread polls the model file's size and modification time (or a
+reload is requested with a hotkey). Once the file has stopped changing, the
+new weights are loaded and warmed up in a background thread, then validated
+against a few recent reference frames: the candidate must run cleanly and
+find most of the mobs the current model found on them. Anything else the
+new model needs that is slow to start (an inference worker process, tile
+cost calibration) is prepared on the same background thread. A candidate
+that passes is handed to the detection loop, which only swaps references
+between two frames, so a retrained model costs seconds instead of a restart.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+
+def box_iou(box, boxes):
+    """IoU of one [x1, y1, x2, y2] box against an (n, 4) array"""
+    x1 = np.maximum(box[0], boxes[:, 0])
+    y1 = np.maximum(box[1], boxes[:, 1])
+    x2 = np.minimum(box[2], boxes[:, 2])
+    y2 = np.minimum(box[3], boxes[:, 3])
+    intersection = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    area = (box[2] - box[0]) * (box[3] - box[1])
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    return intersection / np.maximum(area + areas - intersection, 1e-9)
+
+
+def matched_boxes(reference, candidate, iou_threshold=0.5):
+    """How many reference boxes have a candidate box overlapping them"""
+    if len(reference) == 0 or len(candidate) == 0:
+        return 0
+    return sum(1 for box in reference if box_iou(box[:4], candidate[:, :4]).max() >= iou_threshold)
+
+
+class ModelManager:
+    """Watches the model file, prepares replacement models in the background and hands them over"""
+
+    def __init__(self, model_path, loader, predictor, poll_interval=2.0, settle_time=1.5, warmup_runs=3,
+                 min_recall=0.5, reference_count=8, reference_interval=10.0, prestart=None, release=None):
+        self.model_path = str(model_path)
+        self.loader = loader                  # path → ready model (device placement included)
+        self.predictor = predictor            # (model, frame) → (n, 6) boxes, same settings as the live loop
+        self.prestart = prestart              # (path, model) → services dict, started before the swap
+        self.release = release                # services dict → None, for candidates that are never swapped in
+        self.poll_interval = poll_interval
+        self.settle_time = settle_time        # File must be unchanged this long before loading (copy finished)
+        self.warmup_runs = warmup_runs
+        self.min_recall = min_recall          # Share of the current model's boxes the candidate must also find
+        self.reference_count = reference_count
+        self.reference_interval = reference_interval
+
+        self.references = []                  # (frame, boxes from the current model)
+        self.last_reference_at = 0.0
+        self.file_signature = self.signature()
+        self.changed_at = None
+        self.pending_signature = None
+        self.loading = threading.Lock()
+        self.ready = None                     # (model, path, report, services) waiting for the loop to swap it in
+        self.stop_event = threading.Event()
+        self.thread = None
+
+        # Statistics
+        self.reloads = 0
+        self.rejected = 0
+        self.last_report = None
+
+    def signature(self):
+        """(size, mtime) of the model file, None if missing"""
+        try:
+            stat = Path(self.model_path).stat()
+            return stat.st_size, stat.st_mtime
+        except OSError:
+            return None
+
+    # ------------------------------------------------------------ detection thread side
+
+    def offer_reference(self, frame, boxes, now):
+        """Keep an occasional live frame (with the current model's boxes) for validating new models"""
+        if len(boxes) == 0 or now - self.last_reference_at < self.reference_interval:
+            return
+        self.last_reference_at = now
+        self.references.append((frame.copy(), np.array(boxes[:, :6], dtype=np.float32)))
+        if len(self.references) > self.reference_count:
+            self.references.pop(0)
+
+    def take_ready(self):
+        """The validated replacement (model, path, report, services), once - or None"""
+        ready, self.ready = self.ready, None
+        return ready
+
+    # ------------------------------------------------------------ background side
+
+    def start_watching(self):
+        """Poll the model file from a daemon thread"""
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.watch_loop, name="model-watcher", daemon=True)
+        self.thread.start()
+        print(f"👀 Watching {self.model_path} for updates")
+
+    def stop_watching(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=2)
+
+    def watch_loop(self):
+        while not self.stop_event.wait(self.poll_interval):
+            signature = self.signature()
+            if signature is None or signature == self.file_signature:
+                self.changed_at = None
+                continue
+            if self.changed_at is None or signature != self.pending_signature:
+                # Still being written - wait until it stops changing
+                self.changed_at, self.pending_signature = time.time(), signature
+                continue
+            if time.time() - self.changed_at >= self.settle_time:
+                self.file_signature = signature
+                self.changed_at = None
+                print(f"🔄 Model file changed: {self.model_path}")
+                self.prepare(self.model_path)
+
+    def request_reload(self, path=None):
+        """Load + validate a model in the background (hotkey entry point)"""
+        path = str(path or self.model_path)
+        threading.Thread(target=self.prepare, args=(path,), name="model-loader", daemon=True).start()
+
+    def prepare(self, path):
+        """Load, warm up and validate a candidate; queue it for the swap if it passes"""
+        if not self.loading.acquire(blocking=False):
+            print("⏳ A model reload is already in progress")
+            return False
+        try:
+            start = time.time()
+            print(f"📦 Loading candidate model {path} in the background...")
+            try:
+                model = self.loader(path)
+                report = self.validate(model)
+            except Exception as e:
+                self.rejected += 1
+                print(f"❌ Candidate model failed to load/run: {e} - keeping the current model")
+                return False
+
+            report['load_seconds'] = time.time() - start
+            self.last_report = report
+            if not report['accepted']:
+                self.rejected += 1
+                print(f"❌ Candidate model rejected: {report['reason']} - keeping the current model")
+                return False
+
+            services = {}
+            if self.prestart is not None:
+                try:
+                    services = self.prestart(path, model)
+                except Exception as e:
+                    print(f"⚠️ Preparing services for the candidate failed: {e} - they restart at the swap")
+            superseded, self.ready = self.ready, (model, path, report, services)
+            if superseded is not None and self.release is not None:
+                self.release(superseded[3])
+            print(f"✅ Candidate model ready in {report['load_seconds']:.1f}s "
+                  f"(recall vs current {report['recall']:.0%} on {report['frames']} frames, "
+                  f"{report['latency_ms']:.0f}ms/frame) - swapping at the next frame")
+            return True
+        finally:
+            self.loading.release()
+
+    def validate(self, model):
+        """Warm the candidate up and compare it with the current model on the reference frames"""
+        references = list(self.references)
+        warmup_frame = references[0][0] if references else np.zeros((640, 640, 3), dtype=np.uint8)
+        for _ in range(self.warmup_runs):
+            self.predictor(model, warmup_frame)
+
+        expected = found = 0
+        timings = []
+        for frame, reference_boxes in references:
+            start = time.perf_counter()
+            boxes = np.asarray(self.predictor(model, frame))
+            timings.append(time.perf_counter() - start)
+            if boxes.ndim != 2 or (len(boxes) and boxes.shape[1] < 6):
+                return {'accepted': False, 'reason': f"unexpected output shape {boxes.shape}",
+                        'frames': len(references), 'recall': 0.0, 'latency_ms': 0.0}
+            expected += len(reference_boxes)
+            found += matched_boxes(reference_boxes, boxes)
+
+        recall = found / expected if expected else 1.0
+        report = {
+            'frames': len(references),
+            'recall': recall,
+            'latency_ms': float(np.median(timings)) * 1000 if timings else 0.0,
+            'accepted': recall >= self.min_recall,
+            'reason': None,
+        }
+        if not references:
+            print("⚠️ No reference frames collected yet - candidate only checked for running cleanly")
+        elif not report['accepted']:
+            report['reason'] = (f"finds only {recall:.0%} of the current model's mobs "
+                                f"(minimum {self.min_recall:.0%})")
+        return report
+
+    def stats_summary(self):
+        """One-line reload report for the stats output"""
+        return (f"🔄 Models: {self.reloads} hot reloads, {self.rejected} rejected | "
+                f"{len(self.references)} reference frames")
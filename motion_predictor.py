@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+I-HNT Motion Predictor
+Compensates click targeting for the time between screen capture and click.
+
+Detections from consecutive frames are linked into short-lived tracks (nearest
+neighbour within a gate), each with an exponentially smoothed screen velocity.
+When a target is clicked its position is projected forward by the measured
+capture-to-click latency, so mobs that walked on during inference are still
+hit. Every click is scored afterwards - a hit means the mob's health bar
+appeared - split by compensated and uncompensated clicks so the gain can be
+tuned from the stats output.
+"""
+
+import math
+
+
+class TargetTrack:
+    """One mob followed across frames"""
+
+    def __init__(self, track_id, position, timestamp):
+        self.track_id = track_id
+        self.position = position
+        self.velocity = (0.0, 0.0)
+        self.last_seen = timestamp
+        self.observations = 1
+
+
+class MotionPredictor:
+    """Per-target velocity tracks and latency-compensated click positions"""
+
+    def __init__(self, match_distance=120, max_track_age=0.6, smoothing=0.5, min_speed=25.0,
+                 max_lead=0.5, max_shift=120, gain=1.0):
+        self.match_distance = match_distance  # Max pixels a mob may move between frames to stay the same track
+        self.max_track_age = max_track_age    # Drop tracks not seen for this many seconds
+        self.smoothing = smoothing            # Weight of the newest velocity sample
+        self.min_speed = min_speed            # Below this (px/s) a mob counts as standing still
+        self.max_lead = max_lead              # Never project further ahead than this (seconds)
+        self.max_shift = max_shift            # Never move the click point further than this (pixels)
+        self.gain = gain                      # Scale on the projected shift (tune with the hit stats)
+
+        self.tracks = {}
+        self.next_track_id = 0
+        self.pending_click = None
+
+        # Statistics
+        self.latency_total = 0.0
+        self.clicks = 0
+        self.results = {'compensated': [0, 0], 'static': [0, 0]}  # [hits, misses]
+        self.pet_clicks = 0
+
+    def update(self, detections, timestamp):
+        """Link this frame's detections to tracks and annotate them with track id, velocity and capture time"""
+        unmatched = dict(self.tracks)
+        for detection in detections:
+            x, y = detection['screen_position']
+            best_id, best_distance = None, self.match_distance
+            for track_id, track in unmatched.items():
+                distance = math.hypot(x - track.position[0], y - track.position[1])
+                if distance < best_distance:
+                    best_id, best_distance = track_id, distance
+
+            if best_id is None:
+                track = TargetTrack(self.next_track_id, (x, y), timestamp)
+                self.tracks[track.track_id] = track
+                self.next_track_id += 1
+            else:
+                track = unmatched.pop(best_id)
+                dt = timestamp - track.last_seen
+                if dt > 1e-3:
+                    sample = ((x - track.position[0]) / dt, (y - track.position[1]) / dt)
+                    if track.observations == 1:
+                        track.velocity = sample
+                    else:
+                        track.velocity = (track.velocity[0] + self.smoothing * (sample[0] - track.velocity[0]),
+                                          track.velocity[1] + self.smoothing * (sample[1] - track.velocity[1]))
+                track.position = (x, y)
+                track.last_seen = timestamp
+                track.observations += 1
+
+            detection['track_id'] = track.track_id
+            detection['velocity'] = track.velocity if track.observations > 1 else (0.0, 0.0)
+            detection['captured_at'] = timestamp
+
+        for track_id, track in unmatched.items():
+            if timestamp - track.last_seen > self.max_track_age:
+                del self.tracks[track_id]
+
+    def predict(self, target, now):
+        """Click position for a target at time `now`, returns ((x, y), latency, compensated)"""
+        x, y = target['screen_position']
+        captured_at = target.get('captured_at')
+        if captured_at is None:
+            return (x, y), 0.0, False
+
+        latency = max(0.0, now - captured_at)
+        vx, vy = target.get('velocity', (0.0, 0.0))
+        if math.hypot(vx, vy) < self.min_speed:
+            return (x, y), latency, False
+
+        lead = min(latency, self.max_lead) * self.gain
+        shift_x, shift_y = vx * lead, vy * lead
+        shift = math.hypot(shift_x, shift_y)
+        if shift > self.max_shift:
+            shift_x, shift_y = shift_x * self.max_shift / shift, shift_y * self.max_shift / shift
+        return (int(round(x + shift_x)), int(round(y + shift_y))), latency, True
+
+    def record_click(self, latency, compensated):
+        """Remember a target click until its outcome is known"""
+        self.clicks += 1
+        self.latency_total += latency
+        self.pending_click = 'compensated' if compensated else 'static'
+
+    def record_outcome(self, health_bar_visible=False, pet=False):
+        """Score the pending click - hit when the target's health bar appeared"""
+        if self.pending_click is None:
+            return
+        if pet:
+            self.pet_clicks += 1
+        else:
+            self.results[self.pending_click][0 if health_bar_visible else 1] += 1
+        self.pending_click = None
+
+    def hit_rate(self, kind):
+        """Hit rate for 'compensated' or 'static' clicks (None without data)"""
+        hits, misses = self.results[kind]
+        return hits / (hits + misses) if hits + misses else None
+
+    def stats_summary(self):
+        """One-line prediction report for the stats output"""
+        average_latency = self.latency_total / self.clicks * 1000 if self.clicks else 0.0
+        parts = []
+        for kind in ('compensated', 'static'):
+            hits, misses = self.results[kind]
+            rate = self.hit_rate(kind)
+            parts.append(f"{kind} {hits}/{hits + misses}" + (f" ({rate:.0%})" if rate is not None else ""))
+        return (f"🎯 Click prediction: capture→click {average_latency:.0f}ms | hits {' | '.join(parts)} | "
+                f"{len(self.tracks)} tracks | gain {self.gain:.2f}")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+I-HNT ROI Statistics
+One-pass pixel statistics for the UI checks (health bar, pet card, death
+window).
+
+Those checks only ever ask "how many pixels are darker / brighter than X"
+and "how many pixels are red". Instead of converting the capture to RGB,
+then to gray/HSV, and building one full-size mask per threshold, the raw
+BGRA capture goes through a single conversion into a buffer that is reused
+every tick, and is reduced to a 256-bin histogram. Its cumulative sum then
+works as a lookup table: any threshold count is one index, no matter how
+many thresholds a detector asks for.
+
+    stats = RoiStats(red=True)
+    stats.measure(bgra)
+    stats.below(60), stats.above(180), stats.red_pixels
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+# Mob health red - same ranges the health bar check always used (OpenCV hue 0-180)
+RED_HUE_LOW = 10          # Hue 0..10
+RED_HUE_HIGH = 170        # Hue 170..179
+RED_MIN_SATURATION = 80
+RED_MIN_VALUE = 80
+
+
+class RoiStats:
+    """Reusable per-ROI buffers + cumulative gray (and hue) histograms"""
+
+    def __init__(self, red=False):
+        self.red = red                       # Also count health-bar red (needs the HSV pass)
+        self.shape = None
+        self.gray = None                     # Reused conversion buffers, sized on first use
+        self.hsv = None
+        self.saturated = None
+        self.cumulative = np.zeros(256, dtype=np.int64)
+        self.total = 0
+        self.red_pixels = 0
+
+        # Statistics
+        self.calls = 0
+        self.seconds = 0.0
+
+    def allocate(self, shape):
+        height, width = shape[:2]
+        self.shape = shape
+        self.gray = np.empty((height, width), dtype=np.uint8)
+        if self.red:
+            self.hsv = np.empty((height, width, 3), dtype=np.uint8)
+            self.saturated = np.empty((height, width), dtype=np.uint8)
+
+    def measure(self, bgra):
+        """Histogram one raw BGRA (or BGR) capture - every count below is a lookup afterwards"""
+        start = time.perf_counter()
+        if bgra.shape != self.shape:
+            self.allocate(bgra.shape)
+        conversion = cv2.COLOR_BGRA2GRAY if bgra.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+        cv2.cvtColor(bgra, conversion, dst=self.gray)
+        histogram = cv2.calcHist([self.gray], [0], None, [256], [0, 256])
+        np.cumsum(histogram.ravel(), out=self.cumulative, dtype=np.int64)
+        self.total = self.gray.size
+
+        if self.red:
+            # BGR2HSV reads the first three channels, so the BGRA capture needs no copy
+            cv2.cvtColor(bgra, cv2.COLOR_BGR2HSV, dst=self.hsv)
+            cv2.inRange(self.hsv, (0, RED_MIN_SATURATION, RED_MIN_VALUE), (180, 255, 255), dst=self.saturated)
+            hues = np.cumsum(cv2.calcHist([self.hsv], [0], self.saturated, [180], [0, 180]).ravel())
+            self.red_pixels = int(hues[RED_HUE_LOW] + hues[-1] - hues[RED_HUE_HIGH - 1])
+
+        self.calls += 1
+        self.seconds += time.perf_counter() - start
+        return self
+
+    def below(self, threshold):
+        """Pixels with gray < threshold"""
+        return int(self.cumulative[threshold - 1]) if threshold > 0 else 0
+
+    def above(self, threshold):
+        """Pixels with gray > threshold"""
+        return self.total - int(self.cumulative[threshold])
+
+    def ratio_below(self, threshold):
+        return self.below(threshold) / self.total if self.total else 0.0
+
+    def ratio_above(self, threshold):
+        return self.above(threshold) / self.total if self.total else 0.0
+
+    def average_ms(self):
+        return self.seconds / self.calls * 1000 if self.calls else 0.0
+
+
+def stats_summary(kernels):
+    """One-line UI check cost report for the stats output ({name: RoiStats})"""
+    return "🧮 UI checks: " + (" | ".join(
+        f"{name} {kernel.average_ms():.2f}ms x{kernel.calls}" for name, kernel in kernels.items() if kernel.calls
+    ) or "none yet")
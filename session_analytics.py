@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+I-HNT Session Analytics
+Keeps hunting statistics across sessions in a local SQLite database.
+
+The detection loop only appends tuples to in-memory ring buffers; a background
+writer drains them every few seconds and inserts them in one transaction.
+Loop latencies are stored as per-minute histograms (fixed log-spaced bins) so
+percentiles can be merged over any number of sessions without keeping every
+frame.
+
+    python session_analytics.py                 # Report for the last 7 days
+    python session_analytics.py --days 30
+    python session_analytics.py --session 12    # One session in detail
+"""
+
+import argparse
+import json
+import math
+import platform
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+import numpy as np
+
+DB_FILE = "ihnt_analytics.db"
+
+# Loop latency histogram: 48 log-spaced bins from 1ms to ~4s (bin 0 also holds anything faster)
+LATENCY_BINS = 48
+LATENCY_MIN_MS = 1.0
+LATENCY_BIN_RATIO = 4000.0 ** (1 / LATENCY_BINS)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started REAL NOT NULL,
+    ended REAL,
+    host TEXT,
+    meta TEXT
+);
+CREATE TABLE IF NOT EXISTS events (
+    session_id INTEGER NOT NULL,
+    t REAL NOT NULL,
+    kind TEXT NOT NULL,
+    value REAL,
+    detail TEXT
+);
+CREATE TABLE IF NOT EXISTS loop_latency (
+    session_id INTEGER NOT NULL,
+    minute INTEGER NOT NULL,
+    bin INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (session_id, minute, bin)
+);
+CREATE INDEX IF NOT EXISTS events_by_session ON events (session_id, kind);
+"""
+
+
+def latency_bin(seconds):
+    """Histogram bin for a loop latency"""
+    ms = seconds * 1000
+    if ms <= LATENCY_MIN_MS:
+        return 0
+    return min(LATENCY_BINS - 1, int(math.log(ms / LATENCY_MIN_MS, LATENCY_BIN_RATIO)))
+
+
+def bin_upper_ms(index):
+    """Upper edge of a histogram bin in milliseconds"""
+    return LATENCY_MIN_MS * LATENCY_BIN_RATIO ** (index + 1)
+
+
+def histogram_percentile(counts, percentile):
+    """Percentile (ms, bin upper edge) from histogram counts"""
+    total = sum(counts)
+    if total == 0:
+        return 0.0
+    threshold = total * percentile / 100
+    running = 0
+    for index, count in enumerate(counts):
+        running += count
+        if running >= threshold:
+            return bin_upper_ms(index)
+    return bin_upper_ms(len(counts) - 1)
+
+
+class AnalyticsStore:
+    """Ring-buffered session analytics with a batching SQLite writer thread"""
+
+    def __init__(self, db_path=DB_FILE, flush_interval=2.0, ring_size=20000):
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.events = deque(maxlen=ring_size)      # (t, kind, value, detail) - append only on the hot path
+        self.latencies = deque(maxlen=ring_size)   # (t, loop seconds)
+        self.session_id = None
+        self.session_started = None
+        self.connection = None
+        self.writer_thread = None
+        self.stop_event = threading.Event()
+
+        # Statistics
+        self.rows_written = 0
+        self.batches_written = 0
+        self.dropped = 0
+
+    def start_session(self, **meta):
+        """Open the database, create the session row and start the writer thread"""
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.session_started = time.time()
+        cursor = self.connection.execute("INSERT INTO sessions (started, host, meta) VALUES (?, ?, ?)",
+                                         (self.session_started, platform.node(), json.dumps(meta)))
+        self.connection.commit()
+        self.session_id = cursor.lastrowid
+
+        self.stop_event.clear()
+        self.writer_thread = threading.Thread(target=self.writer_loop, name="analytics-writer", daemon=True)
+        self.writer_thread.start()
+        print(f"📈 Analytics session #{self.session_id} → {self.db_path}")
+
+    # ------------------------------------------------------------ hot path
+
+    def record(self, kind, value=None, detail=None, timestamp=None):
+        """Queue an event (kill, death, pet_click, state, ...) - O(1), thread safe"""
+        if len(self.events) == self.events.maxlen:
+            self.dropped += 1
+        self.events.append((timestamp or time.time(), kind, value, detail))
+
+    def record_loop(self, loop_time, timestamp=None):
+        """Queue one loop latency sample"""
+        self.latencies.append((timestamp or time.time(), loop_time))
+
+    # ------------------------------------------------------------ writer
+
+    def flush(self):
+        """Write everything queued so far in one transaction"""
+        if self.connection is None:
+            return 0
+        events = []
+        while self.events:
+            t, kind, value, detail = self.events.popleft()
+            if detail is not None and not isinstance(detail, str):
+                detail = json.dumps(detail)
+            events.append((self.session_id, t, kind, value, detail))
+
+        histogram = {}
+        while self.latencies:
+            t, loop_time = self.latencies.popleft()
+            key = (int(t // 60), latency_bin(loop_time))
+            histogram[key] = histogram.get(key, 0) + 1
+
+        if not events and not histogram:
+            return 0
+        with self.connection:
+            self.connection.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?)", events)
+            self.connection.executemany(
+                "INSERT INTO loop_latency VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (session_id, minute, bin) DO UPDATE SET count = count + excluded.count",
+                [(self.session_id, minute, index, count) for (minute, index), count in histogram.items()])
+        written = len(events) + len(histogram)
+        self.rows_written += written
+        self.batches_written += 1
+        return written
+
+    def writer_loop(self):
+        """Flush the rings every flush_interval seconds"""
+        while not self.stop_event.wait(self.flush_interval):
+            try:
+                self.flush()
+            except sqlite3.Error as e:
+                print(f"⚠️ Analytics write error: {e}")
+
+    def end_session(self):
+        """Flush, close the session row and stop the writer"""
+        if self.connection is None:
+            return
+        self.stop_event.set()
+        if self.writer_thread is not None:
+            self.writer_thread.join(timeout=5)
+        try:
+            self.flush()
+            with self.connection:
+                self.connection.execute("UPDATE sessions SET ended = ? WHERE id = ?", (time.time(), self.session_id))
+        except sqlite3.Error as e:
+            print(f"⚠️ Analytics write error: {e}")
+        self.connection.close()
+        self.connection = None
+        print(f"📈 Analytics session #{self.session_id} saved ({self.rows_written} rows in {self.batches_written} batches)")
+
+    def stats_summary(self):
+        """One-line analytics report for the stats output"""
+        return (f"📈 Analytics: session #{self.session_id} | {self.rows_written} rows in {self.batches_written} batches | "
+                f"{len(self.events) + len(self.latencies)} queued | {self.dropped} dropped")
+
+
+# ------------------------------------------------------------------ report
+
+def session_report(connection, session_id):
+    """Aggregate numbers for one session"""
+    started, ended = connection.execute("SELECT started, ended FROM sessions WHERE id = ?", (session_id,)).fetchone()
+    if ended is None:
+        ended = connection.execute("SELECT MAX(t) FROM events WHERE session_id = ?", (session_id,)).fetchone()[0] or started
+    hours = max(ended - started, 1e-9) / 3600
+
+    def count(kind):
+        return connection.execute("SELECT COUNT(*) FROM events WHERE session_id = ? AND kind = ?",
+                                  (session_id, kind)).fetchone()[0]
+
+    kill_times = [row[0] for row in connection.execute(
+        "SELECT value FROM events WHERE session_id = ? AND kind = 'kill' AND value IS NOT NULL", (session_id,))]
+    state_time = dict(connection.execute(
+        "SELECT detail, SUM(value) FROM events WHERE session_id = ? AND kind = 'state' GROUP BY detail",
+        (session_id,)).fetchall())
+
+    counts = [0] * LATENCY_BINS
+    for index, total in connection.execute(
+            "SELECT bin, SUM(count) FROM loop_latency WHERE session_id = ? GROUP BY bin", (session_id,)):
+        counts[index] = total
+
+    kills = count('kill')
+    return {
+        'session': session_id,
+        'started': started,
+        'hours': hours,
+        'kills': kills,
+        'kills_per_hour': kills / hours,
+        'time_to_kill': float(np.mean(kill_times)) if kill_times else 0.0,
+        'idle_seconds': state_time.get('explore', 0.0) or 0.0,
+        'deaths': count('death'),
+        'lost_targets': count('lost_target'),
+        'pet_clicks': count('pet_click'),
+        'latency_counts': counts,
+    }
+
+
+def print_report(db_path=DB_FILE, days=7.0, session_id=None):
+    """Print per-session and overall statistics"""
+    connection = sqlite3.connect(db_path)
+    if session_id is not None:
+        session_ids = [session_id]
+    else:
+        since = time.time() - days * 86400
+        session_ids = [row[0] for row in connection.execute(
+            "SELECT id FROM sessions WHERE started >= ? ORDER BY started", (since,))]
+    if not session_ids:
+        print("📭 No sessions recorded in that period")
+        return
+
+    print(f"{'#':>5} {'Started':<17} {'Hours':>6} {'Kills':>6} {'K/h':>6} {'TTK s':>6} "
+          f"{'Idle %':>7} {'Deaths':>6} {'Lost':>5} {'Pets':>5} {'p50 ms':>7} {'p95 ms':>7}")
+    total_counts = [0] * LATENCY_BINS
+    totals = {'hours': 0.0, 'kills': 0, 'deaths': 0, 'lost_targets': 0, 'pet_clicks': 0, 'idle_seconds': 0.0}
+    for sid in session_ids:
+        report = session_report(connection, sid)
+        counts = report['latency_counts']
+        started = datetime.fromtimestamp(report['started']).strftime('%Y-%m-%d %H:%M')
+        idle_share = report['idle_seconds'] / (report['hours'] * 3600) * 100
+        print(f"{sid:>5} {started:<17} {report['hours']:>6.2f} {report['kills']:>6} {report['kills_per_hour']:>6.0f} "
+              f"{report['time_to_kill']:>6.1f} {idle_share:>6.0f}% {report['deaths']:>6} {report['lost_targets']:>5} "
+              f"{report['pet_clicks']:>5} {histogram_percentile(counts, 50):>7.1f} {histogram_percentile(counts, 95):>7.1f}")
+        total_counts = [a + b for a, b in zip(total_counts, counts)]
+        for key in totals:
+            totals[key] += report[key]
+
+    hours = max(totals['hours'], 1e-9)
+    print("=" * 96)
+    print(f"📊 {len(session_ids)} sessions | {totals['hours']:.1f}h hunting | {totals['kills']} kills "
+          f"({totals['kills'] / hours:.0f}/hour) | idle {totals['idle_seconds'] / (hours * 3600):.0%} | "
+          f"{totals['deaths']} deaths | {totals['lost_targets']} lost targets | {totals['pet_clicks']} pet clicks")
+    print(f"⏱️ Loop latency: p50 {histogram_percentile(total_counts, 50):.1f}ms | "
+          f"p95 {histogram_percentile(total_counts, 95):.1f}ms | p99 {histogram_percentile(total_counts, 99):.1f}ms")
+    connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report I-HNT hunting statistics across sessions")
+    parser.add_argument('--db', default=DB_FILE, help="Analytics database")
+    parser.add_argument('--days', type=float, default=7.0, help="Report sessions from the last N days")
+    parser.add_argument('--session', type=int, help="Report a single session")
+    args = parser.parse_args()
+
+    print("📈 I-HNT Session Analytics")
+    print("=" * 96)
+    print_report(args.db, args.days, args.session)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+I-HNT Session Recorder
+Records hunting sessions so failures (stuck mouse locks, false deaths, missed
+mobs) can be replayed and debugged offline.
+
+The detection loop only hands the frame to a thread pool and appends events to
+a deque - downscaling and JPEG encoding happen on pool threads and a writer
+thread appends the results to chunked files:
+
+    recordings/session_YYYYmmdd_HHMMSS/
+        meta.json           Session settings
+        chunk_0000.bin      Concatenated JPEG frames
+        chunk_0000.idx      Fixed-size index records (timestamp, offset, length, frame)
+        events.jsonl        Detections, state transitions and input actions
+
+Both .bin and .idx files are memory-mapped by the replay tool:
+
+    python session_recorder.py recordings/session_20250101_120000 --speed 4 --show
+"""
+
+import argparse
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+INDEX_DTYPE = np.dtype([('timestamp', '<f8'), ('offset', '<u8'), ('length', '<u4'), ('frame', '<u4')])
+
+
+def encode_frame(frame, downscale, jpeg_quality):
+    """Downscale and JPEG-encode a frame (BGR or raw BGRA capture)"""
+    if downscale != 1.0:
+        frame = cv2.resize(frame, None, fx=downscale, fy=downscale, interpolation=cv2.INTER_AREA)
+    if frame.shape[2] == 4:
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+    ok, encoded = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, jpeg_quality])
+    return encoded.tobytes() if ok else b''
+
+
+class SessionRecorder:
+    """Background recorder for frames, detections, states and input actions"""
+
+    def __init__(self, root_dir="recordings", downscale=0.5, jpeg_quality=70, encode_workers=2,
+                 chunk_frames=500, max_pending=8):
+        self.session_dir = Path(root_dir) / datetime.now().strftime("session_%Y%m%d_%H%M%S")
+        self.downscale = downscale
+        self.jpeg_quality = jpeg_quality
+        self.chunk_frames = chunk_frames
+        self.max_pending = max_pending  # Drop frames instead of stalling if encoding falls behind
+        self.copy_frames = False        # Frames come from a reused buffer pool - copy before encoding in the background
+
+        self.executor = ThreadPoolExecutor(max_workers=encode_workers, thread_name_prefix="recorder-encode")
+        self.frame_queue = queue.Queue()   # (timestamp, frame_no, future) in capture order
+        self.events = deque()              # Event dicts waiting for the writer
+        self.writer_thread = None
+        self.running = False
+
+        self.chunk_index = -1
+        self.chunk_file = None
+        self.index_file = None
+        self.events_file = None
+        self.chunk_offset = 0
+        self.frames_in_chunk = 0
+
+        # Statistics
+        self.frames_recorded = 0
+        self.frames_dropped = 0
+        self.events_recorded = 0
+        self.hot_path_time = 0.0
+        self.hot_path_calls = 0
+
+    def start(self):
+        """Create the session folder and start the writer thread"""
+        self.session_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.session_dir / "meta.json", 'w') as f:
+            json.dump({'started': time.time(), 'downscale': self.downscale,
+                       'jpeg_quality': self.jpeg_quality, 'chunk_frames': self.chunk_frames}, f, indent=2)
+        self.events_file = open(self.session_dir / "events.jsonl", 'a')
+
+        self.running = True
+        self.writer_thread = threading.Thread(target=self.writer_loop, name="recorder-writer", daemon=True)
+        self.writer_thread.start()
+        print(f"🎥 Session recording to {self.session_dir}")
+
+    # ------------------------------------------------------------ hot path
+
+    def record_frame(self, frame, timestamp=None):
+        """Queue a frame for background encoding (never blocks the detection loop)"""
+        start = time.perf_counter()
+        if self.running:
+            if self.frame_queue.qsize() >= self.max_pending:
+                self.frames_dropped += 1
+            else:
+                if self.copy_frames:
+                    frame = frame.copy()
+                future = self.executor.submit(encode_frame, frame, self.downscale, self.jpeg_quality)
+                self.frame_queue.put((timestamp or time.time(), self.frames_recorded + self.frames_dropped, future))
+                self.frames_recorded += 1
+        self.hot_path_time += time.perf_counter() - start
+        self.hot_path_calls += 1
+
+    def record_event(self, kind, data=None, timestamp=None):
+        """Append an event (detections, state change, input action) - thread safe"""
+        if self.running:
+            self.events.append({'t': timestamp or time.time(), 'kind': kind, **(data or {})})
+
+    # ------------------------------------------------------------ writer
+
+    def open_next_chunk(self):
+        """Close the current chunk files and start a new chunk"""
+        for handle in (self.chunk_file, self.index_file):
+            if handle is not None:
+                handle.close()
+        self.chunk_index += 1
+        name = f"chunk_{self.chunk_index:04d}"
+        self.chunk_file = open(self.session_dir / f"{name}.bin", 'ab')
+        self.index_file = open(self.session_dir / f"{name}.idx", 'ab')
+        self.chunk_offset = 0
+        self.frames_in_chunk = 0
+
+    def write_frame(self, timestamp, frame_no, data):
+        """Append one encoded frame and its index record"""
+        if self.chunk_file is None or self.frames_in_chunk >= self.chunk_frames:
+            self.open_next_chunk()
+        self.chunk_file.write(data)
+        record = np.array([(timestamp, self.chunk_offset, len(data), frame_no)], dtype=INDEX_DTYPE)
+        self.index_file.write(record.tobytes())
+        self.chunk_offset += len(data)
+        self.frames_in_chunk += 1
+
+    def flush_events(self):
+        """Write queued events to events.jsonl"""
+        written = 0
+        while self.events:
+            self.events_file.write(json.dumps(self.events.popleft(), default=float) + "\n")
+            written += 1
+        self.events_recorded += written
+        return written
+
+    def writer_loop(self):
+        """Write encoded frames in capture order and flush events"""
+        while self.running or not self.frame_queue.empty():
+            try:
+                timestamp, frame_no, future = self.frame_queue.get(timeout=0.2)
+                data = future.result()
+                if data:
+                    self.write_frame(timestamp, frame_no, data)
+            except queue.Empty:
+                pass
+            except Exception as e:
+                print(f"⚠️ Recorder write error: {e}")
+
+            if self.flush_events() or self.frame_queue.empty():
+                for handle in (self.chunk_file, self.index_file, self.events_file):
+                    if handle is not None:
+                        handle.flush()
+
+    def stop(self):
+        """Finish writing everything and close the session"""
+        if not self.running:
+            return
+        self.running = False
+        self.executor.shutdown(wait=True)
+        if self.writer_thread is not None:
+            self.writer_thread.join(timeout=10)
+        self.flush_events()
+        for handle in (self.chunk_file, self.index_file, self.events_file):
+            if handle is not None:
+                handle.close()
+        print(f"🎥 Recording saved: {self.frames_recorded} frames, {self.events_recorded} events "
+              f"({self.frames_dropped} dropped) → {self.session_dir}")
+
+    def stats_summary(self):
+        """One-line recorder report for the stats output"""
+        avg_us = self.hot_path_time / self.hot_path_calls * 1e6 if self.hot_path_calls else 0.0
+        return (f"🎥 Recorder: {self.frames_recorded} frames | {self.frames_dropped} dropped | "
+                f"backlog {self.frame_queue.qsize()} | hot path {avg_us:.0f}µs/frame")
+
+
+class SessionReplay:
+    """Memory-mapped reader for a recorded session"""
+
+    def __init__(self, session_dir):
+        self.session_dir = Path(session_dir)
+        with open(self.session_dir / "meta.json") as f:
+            self.meta = json.load(f)
+
+        # Memory-map every chunk (index and frame data)
+        self.chunks = []
+        for index_path in sorted(self.session_dir.glob("chunk_*.idx")):
+            data_path = index_path.with_suffix('.bin')
+            if index_path.stat().st_size < INDEX_DTYPE.itemsize or not data_path.exists():
+                continue
+            index = np.memmap(index_path, dtype=INDEX_DTYPE, mode='r',
+                              shape=(index_path.stat().st_size // INDEX_DTYPE.itemsize,))
+            self.chunks.append((index, np.memmap(data_path, dtype=np.uint8, mode='r')))
+
+        self.events = []
+        events_path = self.session_dir / "events.jsonl"
+        if events_path.exists():
+            with open(events_path) as f:
+                self.events = [json.loads(line) for line in f if line.strip()]
+
+    def frame_count(self):
+        """Number of recorded frames"""
+        return sum(len(index) for index, _ in self.chunks)
+
+    def iter_frames(self):
+        """Yield (timestamp, frame_no, BGR image) in recording order"""
+        for index, data in self.chunks:
+            for record in index:
+                offset, length = int(record['offset']), int(record['length'])
+                image = cv2.imdecode(data[offset:offset + length], cv2.IMREAD_COLOR)
+                yield float(record['timestamp']), int(record['frame']), image
+
+    def iter_timeline(self):
+        """Yield ('frame', t, (frame_no, image)) and ('event', t, event) merged by time"""
+        events = iter(sorted(self.events, key=lambda e: e['t']))
+        next_event = next(events, None)
+        for timestamp, frame_no, image in self.iter_frames():
+            while next_event is not None and next_event['t'] <= timestamp:
+                yield 'event', next_event['t'], next_event
+                next_event = next(events, None)
+            yield 'frame', timestamp, (frame_no, image)
+        while next_event is not None:
+            yield 'event', next_event['t'], next_event
+            next_event = next(events, None)
+
+    def play(self, speed=4.0, show=False, quiet_kinds=()):
+        """Replay the session at `speed`x real time (0 = as fast as possible)"""
+        previous_time = None
+        frames_shown = 0
+        start = time.time()
+
+        for item_type, timestamp, payload in self.iter_timeline():
+            if speed > 0 and previous_time is not None and timestamp > previous_time:
+                time.sleep((timestamp - previous_time) / speed)
+            previous_time = timestamp
+
+            if item_type == 'event':
+                if payload['kind'] not in quiet_kinds:
+                    details = {k: v for k, v in payload.items() if k not in ('t', 'kind')}
+                    print(f"   [{timestamp:.3f}] {payload['kind']}: {details}")
+                continue
+
+            frames_shown += 1
+            if show:
+                cv2.imshow("I-HNT Replay", payload[1])
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    break
+
+        if show:
+            cv2.destroyAllWindows()
+        print(f"✅ Replayed {frames_shown} frames and {len(self.events)} events in {time.time() - start:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded I-HNT session")
+    parser.add_argument('session', help="Session folder (recordings/session_...)")
+    parser.add_argument('--speed', type=float, default=4.0, help="Replay speed multiplier (0 = no waiting)")
+    parser.add_argument('--show', action='store_true', help="Show frames in a window (q to quit)")
+    parser.add_argument('--quiet', nargs='*', default=['detections'], help="Event kinds not to print")
+    args = parser.parse_args()
+
+    replay = SessionReplay(args.session)
+    print(f"🎬 Replaying {args.session}: {replay.frame_count()} frames, {len(replay.events)} events at {args.speed}x")
+    replay.play(speed=args.speed, show=args.show, quiet_kinds=set(args.quiet))
+
+
+if __name__ == "__main__":
+    main()
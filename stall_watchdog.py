@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+I-HNT Stall Watchdog
+Notices when the hunting loop is stuck and triggers recovery without a human
+pressing F4.
+
+The detection loop sends a heartbeat every iteration; a background thread
+checks once a second how long each stall condition has lasted:
+
+    heartbeat       No loop iteration for a while (loop blocked or hung)
+    fight_lock      detection_paused (red health lock) held without a kill
+    death_stuck     player_dead set and the death window never went away
+    no_detections   Hunting, but YOLO has not found a single mob
+
+When a condition outlasts its limit the watchdog logs a diagnostic snapshot
+(loop state, dwell times, the loop thread's stack for heartbeat stalls) and
+queues a recovery. Recoveries run on the detection thread - the watchdog
+never clicks itself - and escalate with every repeated trigger of the same
+condition until it clears.
+"""
+
+import json
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+DEFAULT_LIMITS = {
+    'heartbeat': 20.0,      # Seconds without a loop iteration
+    'fight_lock': 45.0,     # Seconds in the red-health lock without a kill
+    'death_stuck': 90.0,    # Seconds with the death window still showing
+    'no_detections': 60.0,  # Seconds of hunting without any detection
+}
+IDLE_STATES = ('paused',)   # User pause - nothing counts as stuck
+
+
+class StallWatchdog:
+    """Heartbeat + state dwell tracking with escalating recovery requests"""
+
+    def __init__(self, probe, limits=None, check_interval=1.0, clock=time.time, log_path="watchdog_log.jsonl"):
+        self.probe = probe                  # Callable returning the loop's flags (detection_paused, player_dead, ...)
+        self.limits = dict(DEFAULT_LIMITS, **(limits or {}))
+        self.check_interval = check_interval
+        self.clock = clock                  # Same clock as the detection loop
+        self.log_path = log_path
+
+        self.last_heartbeat = None
+        self.state = None
+        self.loop_thread_id = None
+        self.last_detection_at = None
+        self.since = {}                     # Condition → time it became true
+        self.attempts = {}                  # Condition → recoveries requested in the current episode
+        self.last_trigger = {}              # Condition → time of its latest trigger
+        self.cleared_at = {}                # Condition → time it last stopped holding
+        self.pending = deque()              # (condition, attempt, snapshot) for the detection thread
+        self.stop_event = threading.Event()
+        self.thread = None
+
+        # Statistics
+        self.triggers = {name: 0 for name in self.limits}
+        self.recovered = 0
+
+    # ------------------------------------------------------------ detection thread side
+
+    def heartbeat(self, state, detections=None):
+        """Called once per loop iteration (detections = count from a full pass, if one ran)"""
+        now = self.clock()
+        if self.last_heartbeat is None:
+            self.last_detection_at = now
+        self.last_heartbeat = now
+        self.state = state
+        self.loop_thread_id = threading.get_ident()
+        if detections or state != 'explore':
+            self.last_detection_at = now  # Only exploring frames without any mob count as "no detections"
+
+    def next_recovery(self):
+        """Pop the next queued (condition, attempt, snapshot) or None"""
+        try:
+            return self.pending.popleft()
+        except IndexError:
+            return None
+
+    # ------------------------------------------------------------ watchdog thread side
+
+    def start(self):
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name="stall-watchdog", daemon=True)
+        self.thread.start()
+        print(f"🐕‍🦺 Stall watchdog active (limits: " +
+              ", ".join(f"{name} {limit:.0f}s" for name, limit in self.limits.items()) + ")")
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=2)
+
+    def run(self):
+        while not self.stop_event.wait(self.check_interval):
+            try:
+                self.check()
+            except Exception as e:
+                print(f"⚠️ Watchdog check failed: {e}")
+
+    def conditions(self, now, flags):
+        """Which stall conditions hold right now"""
+        if self.last_heartbeat is None:
+            return {}
+        return {
+            'heartbeat': now - self.last_heartbeat > self.limits['heartbeat'],
+            'fight_lock': bool(flags.get('detection_paused')) and self.state not in IDLE_STATES,
+            'death_stuck': bool(flags.get('player_dead')) and self.state not in IDLE_STATES,
+            'no_detections': (self.state == 'explore' and not flags.get('player_dead')
+                              and now - self.last_detection_at > 2 * self.check_interval),
+        }
+
+    def check(self, now=None):
+        """Update dwell times and queue recoveries for conditions past their limit"""
+        now = self.clock() if now is None else now
+        flags = self.probe() if self.last_heartbeat is not None else {}
+        for name, active in self.conditions(now, flags).items():
+            if not active:
+                if self.since.pop(name, None) is not None:
+                    self.cleared_at[name] = now
+                # An episode only ends once the condition stays clear - a lock that comes straight back escalates
+                if self.attempts.get(name) and now - self.cleared_at.get(name, now) >= self.limits[name]:
+                    del self.attempts[name]
+                    self.recovered += 1
+                    print(f"🐕‍🦺 Watchdog: {name} recovered")
+                continue
+
+            self.since.setdefault(name, now)
+            if name == 'no_detections':
+                started = self.last_detection_at
+            elif name == 'heartbeat':
+                started = self.last_heartbeat
+            elif name == 'fight_lock' and flags.get('lock_started'):
+                started = flags['lock_started']  # Back-to-back fights must not add up
+            else:
+                started = self.since[name]
+            dwell = now - started
+            waited = now - max(started, self.last_trigger.get(name, started))  # Each attempt gets a full limit
+            if waited >= self.limits[name] and not any(item[0] == name for item in self.pending):
+                self.trigger(name, dwell, now)
+
+    def trigger(self, name, dwell, now):
+        """Log a snapshot and queue the next recovery step for a stalled condition"""
+        attempt = self.attempts.get(name, 0) + 1
+        self.attempts[name] = attempt
+        self.last_trigger[name] = now
+        self.triggers[name] += 1
+        snapshot = self.snapshot(name, dwell, attempt, now)
+        print(f"🚨 WATCHDOG: {name} for {dwell:.0f}s (attempt {attempt}) - state={self.state}")
+        self.write_log(snapshot)
+        if name != 'heartbeat':
+            self.pending.append((name, attempt, snapshot))
+
+    def snapshot(self, name, dwell, attempt, now):
+        """Diagnostic state for the log"""
+        snapshot = {
+            'time': now,
+            'condition': name,
+            'dwell': round(dwell, 1),
+            'attempt': attempt,
+            'state': self.state,
+            'seconds_since_heartbeat': round(now - self.last_heartbeat, 1),
+            'seconds_since_detection': round(now - self.last_detection_at, 1),
+            'dwell_times': {key: round(now - value, 1) for key, value in self.since.items()},
+            'loop': self.probe(),
+        }
+        if name == 'heartbeat' and self.loop_thread_id is not None:
+            frame = sys._current_frames().get(self.loop_thread_id)
+            if frame is not None:
+                snapshot['loop_stack'] = traceback.format_stack(frame)[-8:]
+        return snapshot
+
+    def write_log(self, snapshot):
+        if not self.log_path:
+            return
+        try:
+            with open(self.log_path, 'a', encoding='utf-8') as log:
+                log.write(json.dumps(snapshot, default=str) + "\n")
+        except OSError as e:
+            print(f"⚠️ Watchdog log write failed: {e}")
+
+    def stats_summary(self):
+        """One-line watchdog report for the stats output"""
+        fired = ", ".join(f"{name} {count}" for name, count in self.triggers.items() if count) or "none"
+        return f"🐕‍🦺 Watchdog: triggers {fired} | {self.recovered} episodes recovered"
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+I-HNT Target Ranker
+Orders hunting-zone candidates so the best mob is clicked first instead of
+whichever box YOLO happened to emit first.
+
+Each candidate is scored by distance from the character (less walking per
+kill), detection confidence, a per-class value and how close it is to where
+pets were recently clicked. A uniform grid answers the "same target within
+N px" lookups in constant time, which keeps crowded scenes cheap.
+"""
+
+import math
+from collections import deque
+
+
+class SpatialGrid:
+    """Uniform grid of points for fixed-radius neighbour lookups"""
+
+    def __init__(self, cell_size=50):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def cell_of(self, position):
+        return int(position[0] // self.cell_size), int(position[1] // self.cell_size)
+
+    def insert(self, position, item=None):
+        """Add a point (with an optional payload)"""
+        self.cells.setdefault(self.cell_of(position), []).append((position, item))
+
+    def nearest(self, position, radius):
+        """Closest (position, item, distance) closer than radius, or None"""
+        reach = max(1, math.ceil(radius / self.cell_size))
+        cell_x, cell_y = self.cell_of(position)
+        best = None
+        for dx in range(-reach, reach + 1):
+            for dy in range(-reach, reach + 1):
+                for point, item in self.cells.get((cell_x + dx, cell_y + dy), ()):
+                    distance = math.hypot(point[0] - position[0], point[1] - position[1])
+                    if distance < radius and (best is None or distance < best[2]):
+                        best = (point, item, distance)
+        return best
+
+    def has_neighbor(self, position, radius):
+        """True if any stored point is closer than radius"""
+        return self.nearest(position, radius) is not None
+
+
+class TargetRanker:
+    """Scores hunting-zone candidates by distance, confidence, class value and pet history"""
+
+    def __init__(self, zone_radius=300, distance_weight=1.0, confidence_weight=0.5, pet_penalty=2.0,
+                 pet_radius=60, pet_memory=15.0, class_values=None):
+        self.zone_radius = zone_radius              # Distances are normalised to the hunting zone
+        self.distance_weight = distance_weight
+        self.confidence_weight = confidence_weight
+        self.pet_penalty = pet_penalty              # Score removed for a fresh pet click at the same spot
+        self.pet_radius = pet_radius                # Candidates this close to a pet click count as likely pets
+        self.pet_memory = pet_memory                # Seconds until a pet click is forgotten
+        self.class_values = class_values or {}      # class_id → bonus (e.g. boss/elite classes)
+        self.pet_clicks = deque(maxlen=20)          # (screen position, time) of recent pet clicks
+
+        # Statistics
+        self.rankings = 0
+        self.reordered = 0  # Times the best candidate was not YOLO's first box
+
+    def record_pet(self, position, now):
+        """Remember where a pet was clicked - the pet keeps following at a similar screen spot"""
+        self.pet_clicks.append((position, now))
+
+    def pet_index(self, now):
+        """Grid of pet clicks still within memory, weighted by age"""
+        while self.pet_clicks and now - self.pet_clicks[0][1] > self.pet_memory:
+            self.pet_clicks.popleft()
+        index = SpatialGrid(self.pet_radius)
+        for position, clicked_at in self.pet_clicks:
+            index.insert(position, 1.0 - (now - clicked_at) / self.pet_memory)
+        return index
+
+    def score(self, candidate, center, pets):
+        """Higher is better"""
+        x, y = candidate['screen_position']
+        distance = math.hypot(x - center[0], y - center[1])
+        score = (self.confidence_weight * candidate['confidence']
+                 - self.distance_weight * distance / self.zone_radius
+                 + self.class_values.get(candidate['class_id'], 0.0))
+        pet = pets.nearest((x, y), self.pet_radius)
+        if pet is not None:
+            score -= self.pet_penalty * pet[1]
+        return score, distance
+
+    def rank(self, candidates, center, now):
+        """Candidates sorted best first, each annotated with 'rank_score' and 'distance'"""
+        pets = self.pet_index(now)
+        for candidate in candidates:
+            candidate['rank_score'], candidate['distance'] = self.score(candidate, center, pets)
+        ranked = sorted(candidates, key=lambda c: c['rank_score'], reverse=True)
+        self.rankings += 1
+        if ranked and candidates and ranked[0] is not candidates[0]:
+            self.reordered += 1
+        return ranked
+
+    def stats_summary(self):
+        """One-line ranking report for the stats output"""
+        share = self.reordered / self.rankings if self.rankings else 0.0
+        return (f"🏆 Ranking: {self.rankings} selections | {share:.0%} picked a different mob than YOLO order | "
+                f"{len(self.pet_clicks)} pet spots remembered")
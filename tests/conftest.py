@@ -0,0 +1,31 @@
+"""Shared fixtures - I-HNT wired to the headless game simulator"""
+
+import contextlib
+import importlib
+import io
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def simulated_finder():
+    """(simulator, finder): a fresh IHNTMobFinder whose screen, mouse and keyboard are the simulator's"""
+    pytest.importorskip('torch')
+    pytest.importorskip('ultralytics')
+    import game_simulator
+
+    simulator = game_simulator.GameSimulator(seed=0)
+    game_simulator.install_simulated_backends(simulator)
+    import i_hnt
+    if getattr(i_hnt, 'pyautogui', None) is not sys.modules['pyautogui']:
+        i_hnt = importlib.reload(i_hnt)  # Rebind the simulated backends (and the real time module)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        finder = i_hnt.IHNTMobFinder()
+        finder.record_analytics = False
+        finder.use_watchdog = False
+        finder.begin_hunting()
+    yield simulator, finder
+    with contextlib.redirect_stdout(io.StringIO()):
+        finder.end_hunting()
@@ -0,0 +1,78 @@
+"""Tests for CPU thread/pinning planning and the per-host cache"""
+
+import cv2
+import numpy as np
+
+import cpu_tuner
+from cpu_tuner import (candidate_plans, core_layout, cores_to_mask, describe_plan, get_cpu_plan,
+                       load_benchmark_frames, load_cached_plan, save_plan)
+
+
+def test_cores_to_mask():
+    assert cores_to_mask([0, 2, 5]) == 0b100101
+
+
+def test_core_layout_keeps_capture_and_actuator_cores_free():
+    layout = core_layout(4, cpu_count=8)
+    assert layout == {'actuator_cores': [0], 'capture_cores': [1], 'inference_cores': [2, 3, 4, 5]}
+    assert core_layout(7, cpu_count=8) is None
+
+
+def test_candidate_plans_fit_the_machine():
+    plans = candidate_plans(cpu_count=8)
+    assert max(plan['intra_op_threads'] for plan in plans) == 6
+    assert {plan['inter_op_threads'] for plan in plans} == {1, 2}
+    for plan in plans:
+        if plan['pin_threads']:
+            assert max(plan['inference_cores']) < 8
+            assert not set(plan['inference_cores']) & {0, 1}
+
+    quick = candidate_plans(cpu_count=8, quick=True)
+    assert sorted({plan['intra_op_threads'] for plan in quick}) == [1, 4, 6]
+    assert all(plan['inter_op_threads'] == 1 for plan in quick)
+
+
+def test_single_core_machine_still_gets_a_plan():
+    plans = candidate_plans(cpu_count=1)
+    assert plans and all(plan['intra_op_threads'] == 1 and not plan['pin_threads'] for plan in plans)
+
+
+def test_describe_plan():
+    plan = {'intra_op_threads': 2, 'inter_op_threads': 1, 'pin_threads': True, 'inference_cores': [2, 3]}
+    assert describe_plan(plan) == "intra=2 inter=1 pinned→[2, 3]"
+
+
+def test_benchmark_frames_are_deterministic_and_skip_unreadable_files(tmp_path):
+    for index in range(3):
+        cv2.imwrite(str(tmp_path / f"mob{index}.png"), np.full((30, 40, 3), 50 * index, dtype=np.uint8))
+    (tmp_path / "broken.png").write_bytes(b"not an image")
+
+    frames = load_benchmark_frames(tmp_path, frame_shape=(200, 300), count=3)
+    assert len(frames) == 3
+    assert all(frame.shape == (200, 300, 3) for frame in frames)
+    for first, second in zip(frames, load_benchmark_frames(tmp_path, frame_shape=(200, 300), count=3)):
+        np.testing.assert_array_equal(first, second)
+    assert frames[0][40, 60].tolist() == [0, 0, 0]  # First sprite pasted at the first slot
+
+
+def test_cached_plan_is_reused_until_forced(tmp_path, monkeypatch):
+    cache = tmp_path / "cpu_tuning.json"
+    plan = {'intra_op_threads': 4, 'inter_op_threads': 1, 'pin_threads': False, 'p95_ms': 12.0}
+    save_plan("models/best.pt", plan, cache)
+    assert load_cached_plan("other/best.pt", cache) == plan  # Keyed by model file name
+    assert load_cached_plan("yolov8n.pt", cache) is None
+
+    tuned = []
+    monkeypatch.setattr(cpu_tuner, 'run_tuning', lambda *args, **kwargs: tuned.append(1) or {'p95_ms': 9.0})
+    assert get_cpu_plan("best.pt", cache_path=cache) == plan
+    assert not tuned
+    assert get_cpu_plan("best.pt", cache_path=cache, force=True) == {'p95_ms': 9.0}
+    assert load_cached_plan("best.pt", cache) == {'p95_ms': 9.0}
+
+
+def test_unreadable_cache_counts_as_empty(tmp_path):
+    cache = tmp_path / "cpu_tuning.json"
+    cache.write_text("{broken")
+    assert load_cached_plan("best.pt", cache) is None
+    save_plan("best.pt", {'p95_ms': 1.0}, cache)
+    assert load_cached_plan("best.pt", cache) == {'p95_ms': 1.0}
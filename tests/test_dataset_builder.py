@@ -0,0 +1,56 @@
+"""Augmentation keeps the YOLO boxes on the mob"""
+
+import numpy as np
+
+from dataset_builder import augment
+
+
+class FixedRandom:
+    """rng stand-in: forced flip decision, neutral jitter"""
+
+    def __init__(self, flip, scale=1.0):
+        self.flip = flip
+        self.scale = scale
+
+    def random(self):
+        return 0.0 if self.flip else 1.0
+
+    def uniform(self, low, high):
+        if (low, high) == (0.8, 1.2):
+            return self.scale
+        return 1.0 if low > 0 else 0.0
+
+
+def scene():
+    image = np.zeros((100, 200, 3), dtype=np.uint8)
+    image[20:40, 10:50] = 255  # The "mob"
+    return image, [[3, 10, 20, 50, 40]]
+
+
+def test_flip_mirrors_box_x():
+    image, boxes = scene()
+    flipped, flipped_boxes = augment(image, boxes, FixedRandom(flip=True))
+    assert flipped_boxes == [[3, 150, 20, 190, 40]]
+    assert flipped[20:40, 150:190].min() == 255
+    assert flipped[:, :150].max() == 0
+    assert boxes == [[3, 10, 20, 50, 40]]  # Input untouched
+
+
+def test_no_flip_and_scale_follow_the_image():
+    image, boxes = scene()
+    same, same_boxes = augment(image, boxes, FixedRandom(flip=False))
+    assert same_boxes == boxes
+    scaled, scaled_boxes = augment(image, boxes, FixedRandom(flip=True, scale=0.5))
+    assert scaled.shape[:2] == (50, 100)
+    assert scaled_boxes == [[3, 75, 10, 95, 20]]
+
+
+def test_random_augment_boxes_stay_in_image():
+    rng = np.random.default_rng(0)
+    image, boxes = scene()
+    for _ in range(20):
+        result, result_boxes = augment(image, boxes, rng)
+        height, width = result.shape[:2]
+        _, x1, y1, x2, y2 = result_boxes[0]
+        assert 0 <= x1 < x2 <= width + 1e-6
+        assert 0 <= y1 < y2 <= height + 1e-6
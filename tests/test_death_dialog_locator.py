@@ -0,0 +1,79 @@
+"""Tests for template-based death dialog button location"""
+
+import cv2
+import numpy as np
+import pytest
+
+from death_dialog_locator import DeathDialogLocator
+
+
+def button_face(seed):
+    """Blocky 200x40 button texture that survives the 4x pyramid downscale"""
+    blocks = np.random.default_rng(seed).integers(60, 255, (4, 20, 3), dtype=np.uint8)
+    return cv2.resize(blocks, (200, 40), interpolation=cv2.INTER_NEAREST)
+
+
+def dialog_screen(shift=(0, 0), swap=False, show=True):
+    """Full-screen BGRA capture with the two death dialog buttons, offset by `shift`"""
+    screen = np.full((1080, 1920, 4), 40, dtype=np.uint8)
+    if show:
+        faces = [button_face(1), button_face(2)]
+        if swap:
+            faces.reverse()
+        for face, center_x in zip(faces, (810, 1110)):
+            x, y = center_x + shift[0] - 100, 740 + shift[1] - 20
+            screen[y:y + 40, x:x + 200, :3] = face
+    return screen
+
+
+def roi(locator, screen):
+    area = locator.search_area
+    return np.ascontiguousarray(screen[area['top']:area['top'] + area['height'],
+                                       area['left']:area['left'] + area['width']])
+
+
+@pytest.fixture
+def locator(tmp_path):
+    locator = DeathDialogLocator(tmp_path)
+    assert not locator.ready
+    assert locator.capture_templates(dialog_screen())
+    return locator
+
+
+def test_captured_templates_sit_at_the_fixed_layout(locator):
+    assert locator.default_position('resurrect') == (810, 740)
+    assert locator.default_position('wait_help') == (1110, 740)
+    assert locator.templates['resurrect'][1].shape == (50, 220)
+    assert locator.templates['resurrect'][4].shape == (12, 55)
+
+
+def test_buttons_are_found_where_the_dialog_actually_is(locator):
+    result = locator.locate(roi(locator, dialog_screen(shift=(23, -11))))
+    assert result['found']
+    for name, expected in (('resurrect', (833, 729)), ('wait_help', (1133, 729))):
+        x, y = locator.button_position(name)
+        assert abs(x - expected[0]) <= 1 and abs(y - expected[1]) <= 1
+        assert result['buttons'][name][2] > 0.9
+
+
+def test_no_dialog_means_no_button_positions(locator):
+    result = locator.locate(roi(locator, dialog_screen(show=False)))
+    assert not result['found']
+    assert locator.button_position('resurrect') is None
+    assert (locator.found, locator.missed) == (0, 1)
+
+
+def test_swapped_buttons_are_not_accepted(locator):
+    assert not locator.locate(roi(locator, dialog_screen(swap=True)))['found']
+
+
+def test_bgr_regions_work_too(locator):
+    bgr = cv2.cvtColor(roi(locator, dialog_screen()), cv2.COLOR_BGRA2BGR)
+    assert locator.locate(bgr)['found']
+    assert "1 found, 0 clear" in locator.stats_summary()
+
+
+def test_templates_reload_from_disk(locator):
+    fresh = DeathDialogLocator(locator.template_dir)
+    assert fresh.ready
+    np.testing.assert_array_equal(fresh.templates['wait_help'][2], locator.templates['wait_help'][2])
@@ -0,0 +1,62 @@
+"""Detection cache keys, LRU eviction and the live-use guard"""
+
+import contextlib
+import io
+
+import numpy as np
+
+from detection_cache import DetectionCache, dhash
+
+
+def frame(seed):
+    return np.random.default_rng(seed).integers(0, 256, size=(360, 640, 4), dtype=np.uint8)
+
+
+def test_same_frame_and_settings_hit():
+    cache = DetectionCache(capacity=4)
+    boxes = np.ones((2, 6), dtype=np.float32)
+    key = cache.key(frame(0), ('model.pt', 0.5))
+    assert cache.get(key) is None
+    cache.put(key, boxes)
+    assert cache.get(cache.key(frame(0), ('model.pt', 0.5))) is boxes
+    assert cache.get(cache.key(frame(0), ('model.pt', 0.6))) is None  # Other settings
+    assert cache.get(cache.key(frame(1), ('model.pt', 0.5))) is None  # Other frame
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_lru_eviction_keeps_recently_used():
+    cache = DetectionCache(capacity=2)
+    keys = [cache.key(frame(seed), ()) for seed in range(3)]
+    cache.put(keys[0], 'a')
+    cache.put(keys[1], 'b')
+    assert cache.get(keys[0]) == 'a'  # Now most recent
+    cache.put(keys[2], 'c')
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == 'a'
+    assert cache.evictions == 1
+    cache.clear()
+    assert cache.get(keys[0]) is None
+
+
+def test_dhash_size_and_stability():
+    fingerprint = dhash(frame(0))
+    assert len(fingerprint) == 32 * 18 // 8
+    assert dhash(frame(0)) == fingerprint
+    assert dhash(np.ascontiguousarray(frame(0)[:, :, :3])) == fingerprint  # Raw BGRA and BGR capture agree
+
+
+def test_cache_refused_outside_offline_sessions(simulated_finder):
+    _, finder = simulated_finder
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert not finder.enable_detection_cache()
+        assert finder.detection_cache is None
+        finder.offline_session = True
+        assert finder.enable_detection_cache()
+    assert isinstance(finder.detection_cache, DetectionCache)
+
+
+def test_settings_key_includes_inference_path(simulated_finder):
+    _, finder = simulated_finder
+    assert finder.detection_settings()[-1] == 'model'
+    finder.preprocessor = object()
+    assert finder.detection_settings()[-1] == 'fused'
@@ -0,0 +1,95 @@
+"""Tests for heatmap-guided exploration"""
+
+import math
+
+import pytest
+
+from exploration_planner import ExplorationPlanner
+
+
+def test_without_information_the_planner_sweeps_in_45_degree_steps():
+    planner = ExplorationPlanner()
+    headings = []
+    for step in range(4):
+        _, heading, _, guided = planner.choose_move(now=float(step))
+        headings.append(round(heading))
+        assert not guided
+    assert headings == [0, 45, 90, 135]
+
+
+def test_moves_head_toward_recent_detections():
+    planner = ExplorationPlanner()
+    planner.record_detections([(300, 200), (320, 180), (280, 230)], [], now=0.0)
+    (x, y), heading, distance, guided = planner.choose_move(now=1.0)
+
+    assert guided
+    assert 180 < heading < 270  # Up and to the left of the character
+    assert x < planner.center[0] and y < planner.center[1]
+    assert distance >= 400
+
+
+def test_move_target_stays_inside_the_screen_margins():
+    planner = ExplorationPlanner(edge_margin=150)
+    for heading in range(0, 360, 15):
+        x, y = planner.edge_point(math.radians(heading))
+        assert 150 <= x <= 1920 - 150 and 150 <= y <= 1080 - 150
+
+
+def test_fruitless_moves_mark_their_sector_empty():
+    planner = ExplorationPlanner()
+    planner.choose_move(now=0.0)
+    sector = planner.pending_sector
+    planner.choose_move(now=1.0)
+    assert planner.emptied[sector] == pytest.approx(1.0, rel=0.05)
+
+    planner.record_zone_status(True, now=2.0)
+    assert planner.pending_sector is None  # A move that found mobs is not penalised
+
+
+def test_cleared_zone_sector_is_emptied_when_the_zone_goes_idle():
+    planner = ExplorationPlanner()
+    planner.record_detections([(1200, 540)], [(1200, 540)], now=0.0)
+    planner.record_zone_status(True, now=0.0)
+    planner.record_zone_status(False, now=1.0)
+    assert planner.emptied[planner.zone_sector] > 0.9
+    planner.record_zone_status(True, now=4.0)
+    assert planner.idle_periods == 1 and planner.idle_total == pytest.approx(3.0)
+
+
+def test_world_bearings_survive_camera_turns():
+    planner = ExplorationPlanner(sectors=12, camera_degrees_per_drag=30.0)
+    east = planner.world_sector(0.0)
+    planner.record_camera_turn(+1)
+    assert planner.world_sector(math.radians(30)) == east
+
+
+def test_walking_shifts_the_screen_heatmap():
+    planner = ExplorationPlanner()
+    planner.record_detections([(1260, 540)], [], now=0.0)  # Cell column 10, row 4
+    assert planner.screen_heat[4, 10] == 1.0
+    planner.record_move((1080, 540))  # One cell to the right
+    assert planner.screen_heat[4, 9] == pytest.approx(1.0)
+    assert planner.screen_heat[4, 10] == pytest.approx(0.0)
+
+
+def test_heatmaps_decay_by_half_life():
+    planner = ExplorationPlanner(screen_half_life=10.0, world_half_life=40.0)
+    planner.record_detections([(1260, 540)], [], now=0.0)
+    planner.decay(now=10.0)
+    assert planner.screen_heat.sum() == pytest.approx(0.5)
+    assert planner.world_heat.sum() == pytest.approx(0.5 ** 0.25)
+
+
+def test_camera_turns_toward_the_side_with_more_mobs():
+    planner = ExplorationPlanner(sectors=12, camera_degrees_per_drag=30.0)
+    planner.world_heat[9] = 5.0  # Straight up (270°) - a 30° turn brings it nearer the wide axis either way
+    planner.world_heat[8] = 3.0  # 240° - turning right brings it to 270°, turning left to 210°
+    assert planner.choose_camera_direction(1) == -1
+    assert planner.choose_camera_direction(-1) == -1
+
+
+def test_stats_summary_reports_guided_moves():
+    planner = ExplorationPlanner()
+    planner.record_detections([(300, 200)], [], now=0.0)
+    planner.choose_move(now=0.5)
+    assert "1/1 heat-guided moves" in planner.stats_summary()
@@ -0,0 +1,31 @@
+"""Per-state frame pacing and the CPU-time budget"""
+
+import pytest
+
+from frame_governor import FrameGovernor
+
+
+def test_delay_fills_up_the_state_frame_time():
+    governor = FrameGovernor({'explore': 10, 'engage': 5})
+    assert governor.frame_delay('explore', 0.03) == pytest.approx(0.07)
+    assert governor.frame_delay('engage', 0.05) == pytest.approx(0.15)
+    assert governor.frame_delay('explore', 0.2) <= 0.0  # Already late - no wait
+
+
+def test_budget_caps_cpu_time_not_sleeps():
+    governor = FrameGovernor({'acquire': 30}, cpu_budget=0.5)
+    # 1.5s wall per iteration, but nearly all of it sleeping (clicks, camera drag)
+    for _ in range(5):
+        governor.frame_delay('acquire', 1.5, cpu_time=0.01)
+    assert governor.target_rate('acquire') == 30
+    # 50ms of CPU per iteration → at most 10 FPS for a 50% budget
+    for _ in range(50):
+        delay = governor.frame_delay('acquire', 0.05, cpu_time=0.05)
+    assert governor.target_rate('acquire') == pytest.approx(10, rel=0.01)
+    assert delay == pytest.approx(0.05, rel=0.02)
+
+
+def test_no_budget_without_cpu_time():
+    governor = FrameGovernor({'acquire': 30}, cpu_budget=0.5)
+    governor.frame_delay('acquire', 0.5)
+    assert governor.target_rate('acquire') == 30
@@ -0,0 +1,61 @@
+"""Fused tensor vs numpy paths - the model must see the same channel order"""
+
+import contextlib
+import io
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip('torch')
+
+from frame_preprocess import FramePreprocessor
+
+
+def bgra_frame():
+    frame = np.zeros((90, 160, 4), dtype=np.uint8)
+    frame[..., 0], frame[..., 1], frame[..., 2], frame[..., 3] = 10, 120, 250, 255  # B, G, R, A
+    return frame
+
+
+def test_tensor_holds_rgb_planes_inside_the_letterbox():
+    preprocessor = FramePreprocessor((90, 160), imgsz=64)
+    tensor = preprocessor(bgra_frame()).numpy()
+    rows = slice(preprocessor.pad_top, preprocessor.pad_top + preprocessor.resized_height)
+    cols = slice(preprocessor.pad_left, preprocessor.pad_left + preprocessor.resized_width)
+    assert np.allclose(tensor[0, :, rows, cols].mean(axis=(1, 2)), np.array([250, 120, 10]) / 255.0)
+    assert np.isclose(tensor[0, 0, 0, 0], 114 / 255.0)  # Padding
+
+
+def test_scale_boxes_maps_back_to_frame_pixels():
+    preprocessor = FramePreprocessor((90, 160), imgsz=64)
+    box = np.array([[40, 10, 80, 30, 0.9, 0]], dtype=np.float32)
+    tensor_box = box.copy()
+    tensor_box[:, [0, 2]] = box[:, [0, 2]] * preprocessor.scale + preprocessor.pad_left
+    tensor_box[:, [1, 3]] = box[:, [1, 3]] * preprocessor.scale + preprocessor.pad_top
+    assert np.allclose(preprocessor.scale_boxes(tensor_box)[:, :4], box[:, :4], atol=1e-3)
+
+
+class RecordingModel:
+    """Stands in for a YOLO model - remembers the numpy image it was given"""
+
+    def __init__(self):
+        self.images = []
+
+    def __call__(self, images, **kwargs):
+        self.images.extend(images if isinstance(images, list) else [images])
+        return []
+
+
+def test_numpy_paths_hand_ultralytics_bgr(simulated_finder):
+    simulator, finder = simulated_finder
+    model = RecordingModel()
+    with contextlib.redirect_stdout(io.StringIO()):
+        captured, _ = finder.capture_game_area()
+    finder.model_boxes(model, captured)                         # Default capture path
+    finder.model_boxes(model, bgra_frame())                     # Raw BGRA (fused mode fallbacks, swap validation)
+    finder.model_batch_boxes([captured[:64, :64]], 64, model)   # Tiles
+    expected = simulator.grab({'top': finder.margin_top, 'left': finder.margin_left,
+                               'width': captured.shape[1], 'height': captured.shape[0]})[..., :3]
+    assert np.array_equal(model.images[0], expected)
+    assert tuple(model.images[1][0, 0]) == (10, 120, 250)
+    assert np.array_equal(model.images[2], expected[:64, :64])
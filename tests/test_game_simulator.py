@@ -0,0 +1,34 @@
+"""End-to-end kills/h regression on the simulated game, counted by I-HNT itself"""
+
+import sqlite3
+
+import pytest
+
+pytest.importorskip('torch')
+pytest.importorskip('ultralytics')
+
+from game_simulator import run_simulation
+
+# Default settings: ~840 kills/h counted by the bot for this run - a change that costs more than ~5% fails
+KILLS_PER_HOUR_FLOOR = 800
+
+
+def test_default_settings_kills_per_hour(tmp_path):
+    database = tmp_path / "analytics.db"
+
+    def record_to_temp_database(finder):
+        finder.record_analytics = True
+        finder.analytics_db = str(database)
+
+    summary = run_simulation(minutes=10, seed=1, configure=record_to_temp_database)
+    bot_kills_per_hour = summary['bot_kills'] / summary['simulated_seconds'] * 3600
+    assert bot_kills_per_hour >= KILLS_PER_HOUR_FLOOR
+    assert summary['bot_kills'] >= 0.95 * summary['kills']  # Kill accounting matches the game
+    assert summary['bot_lost_targets'] <= 0.05 * summary['kills']
+    assert summary['deaths'] <= 1
+
+    with sqlite3.connect(database) as connection:
+        kill_events, with_time_to_kill = connection.execute(
+            "SELECT COUNT(*), COUNT(value) FROM events WHERE kind = 'kill'").fetchone()
+    assert kill_events == summary['bot_kills']
+    assert with_time_to_kill == kill_events
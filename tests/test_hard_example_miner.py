@@ -0,0 +1,89 @@
+"""Tests for hard example mining"""
+
+import json
+
+import numpy as np
+
+from hard_example_miner import HardExampleMiner
+
+
+def noise(seed, channels=3):
+    return np.random.default_rng(seed).integers(0, 256, (64, 96, channels), dtype=np.uint8)
+
+
+def test_offers_respect_the_per_reason_cooldown(tmp_path):
+    miner = HardExampleMiner(tmp_path, cooldown=2.0)
+    assert miner.offer(noise(0), 'low_confidence', now=10.0)
+    assert not miner.offer(noise(1), 'low_confidence', now=11.0)
+    assert miner.offer(noise(2), 'pet_click', now=11.0)
+    assert miner.offer(noise(3), 'low_confidence', now=12.5)
+    assert miner.flagged == {'low_confidence': 2, 'pet_click': 1, 'missed_mob': 0}
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    miner = HardExampleMiner(tmp_path, queue_size=1, cooldown=0.0)
+    assert miner.offer(noise(0), 'low_confidence', now=1.0)
+    assert not miner.offer(noise(1), 'low_confidence', now=2.0)
+    assert miner.dropped == 1
+
+
+def test_missed_mob_is_the_frame_before_a_quick_find(tmp_path):
+    miner = HardExampleMiner(tmp_path, miss_window=3.0)
+    before_move = noise(0)
+    miner.record_move(before_move, now=5.0)
+    miner.record_zone_mobs(now=7.0)
+    frame, reason, _, _, meta = miner.queue.get_nowait()
+    assert frame is before_move and reason == 'missed_mob'
+    assert meta == {'seconds_after_move': 2.0}
+
+    miner.record_move(noise(1), now=20.0)
+    miner.record_zone_mobs(now=30.0)  # Too long after the move to blame the model
+    assert miner.queue.empty()
+
+
+def test_pooled_frames_are_copied_when_kept(tmp_path):
+    miner = HardExampleMiner(tmp_path)
+    miner.copy_frames = True
+    frame = noise(0)
+    miner.offer(frame, 'pet_click', now=10.0)
+    frame[...] = 0
+    assert miner.queue.get_nowait()[0].any()
+
+
+def test_store_writes_image_and_sidecar_and_skips_duplicates(tmp_path):
+    miner = HardExampleMiner(tmp_path)
+    miner.output_dir.mkdir(exist_ok=True)
+    boxes = np.array([[1, 2, 30, 40, 0.31, 0]], dtype=np.float32)
+    bgra = np.dstack([noise(0), np.full((64, 96), 255, np.uint8)])
+    miner.store(bgra, 'low_confidence', boxes, 12.3456, {})
+    miner.store(noise(0), 'low_confidence', None, 13.0, {})  # Same picture, already converted
+
+    images = sorted(tmp_path.glob("*.jpg"))
+    assert [path.name for path in images] == ["12345_low_confidence.jpg"]
+    sidecar = json.loads(images[0].with_suffix('.json').read_text())
+    assert sidecar['reason'] == 'low_confidence'
+    assert sidecar['boxes'] == [[1.0, 2.0, 30.0, 40.0, 0.31, 0.0]]
+    assert miner.written == 1 and miner.duplicates == 1
+
+
+def test_store_cap_deletes_the_oldest_examples(tmp_path):
+    miner = HardExampleMiner(tmp_path, max_megabytes=0)
+    miner.output_dir.mkdir(exist_ok=True)
+    for index in range(3):
+        miner.store(noise(index), 'pet_click', None, float(index), {})
+    assert [path.stem for path in tmp_path.glob("*.jpg")] == ["2000_pet_click"]
+    assert len(list(tmp_path.glob("*.json"))) == 1
+    assert miner.stored_bytes == tmp_path.joinpath("2000_pet_click.jpg").stat().st_size
+
+
+def test_writer_thread_indexes_existing_examples_and_drains_on_stop(tmp_path):
+    (tmp_path / "1_old.jpg").write_bytes(b"x" * 100)
+    miner = HardExampleMiner(tmp_path)
+    miner.start()
+    miner.offer(noise(0), 'low_confidence', now=10.0)
+    miner.offer(noise(1), 'pet_click', now=10.0)
+    miner.stop()
+
+    assert miner.written == 2
+    assert len(miner.stored) == 3
+    assert "2 written" in miner.stats_summary()
@@ -0,0 +1,137 @@
+"""Tests for the asyncio hunt orchestrator"""
+
+import asyncio
+import threading
+import types
+
+from hunt_orchestrator import SKILL_SEQUENCE, HuntOrchestrator
+
+
+class RecordingFinder:
+    """The slice of IHNTMobFinder the orchestrator drives, logging the thread of every call"""
+
+    def __init__(self, steps_before_stop=None):
+        self.stop_requested = False
+        self.monitoring_active = False
+        self.keyboard_active = False
+        self.paused = False
+        self.loop_cpu_time = 0.0
+        self.frame_governor = types.SimpleNamespace(frame_delay=lambda state, elapsed, cpu: 0.01)
+        self.steps_before_stop = steps_before_stop
+        self.calls = []
+        self.keys = []
+        self.pinned = []
+
+    def log(self, name):
+        self.calls.append((name, threading.current_thread().name))
+
+    def pin_thread(self, role):
+        self.pinned.append(role)
+
+    def reset_session_stats(self):
+        pass
+
+    def begin_hunting(self):
+        self.log('begin_hunting')
+        self.monitoring_active = True
+
+    def end_hunting(self):
+        self.log('end_hunting')
+        self.monitoring_active = False
+
+    def detection_step(self, loop_start):
+        self.log('detection_step')
+        steps = sum(1 for name, _ in self.calls if name == 'detection_step')
+        if self.steps_before_stop is not None and steps >= self.steps_before_stop:
+            self.monitoring_active = False
+        return 'acquire'
+
+    def finish_frame(self, state, loop_start):
+        self.log('finish_frame')
+
+    def handle_capslock_toggle(self):
+        self.log('toggle')
+        self.paused = not self.paused
+
+    def press_key(self, key, kind):
+        self.keys.append((key, threading.current_thread().name))
+
+
+async def run_session(orchestrator, finder, script):
+    """Run the orchestrator while `script` posts hotkeys, then request stop"""
+    runner = asyncio.create_task(orchestrator.run())
+    await asyncio.sleep(0)
+    await script(orchestrator)
+    finder.stop_requested = True
+    await asyncio.wait_for(runner, 5)
+
+
+def test_session_runs_every_finder_call_on_the_detector_thread():
+    finder = RecordingFinder(steps_before_stop=5)
+    orchestrator = HuntOrchestrator(finder, death_detection_delay=0.0)
+
+    async def script(orchestrator):
+        orchestrator.post_hotkey('caps_lock')
+        for _ in range(200):
+            await asyncio.sleep(0.01)
+            if orchestrator.detection_task is not None and orchestrator.detection_task.done():
+                break
+
+    asyncio.run(run_session(orchestrator, finder, script))
+
+    names = [name for name, _ in finder.calls]
+    assert names[0] == 'begin_hunting' and names[-1] == 'end_hunting'
+    assert names.count('detection_step') == 5 and names.count('finish_frame') == 5
+    assert {thread for _, thread in finder.calls} == {thread for _, thread in finder.calls[:1]}
+    assert finder.calls[0][1].startswith('ihnt-detect')
+    assert orchestrator.steps == 5 and orchestrator.hotkey_count == 1
+
+
+def test_skill_keys_follow_the_rotation_on_the_input_thread():
+    finder = RecordingFinder()
+    orchestrator = HuntOrchestrator(finder, death_detection_delay=10.0)
+
+    async def script(orchestrator):
+        orchestrator.post_hotkey('caps_lock')
+        await asyncio.sleep(1.2)
+
+    asyncio.run(run_session(orchestrator, finder, script))
+
+    keys = "".join(key for key, _ in finder.keys)
+    assert keys.startswith(SKILL_SEQUENCE) and len(keys) >= len(SKILL_SEQUENCE)
+    assert all(thread.startswith('ihnt-input') for _, thread in finder.keys)
+    assert finder.pinned == ['actuator']
+    assert [name for name, _ in finder.calls] == ['begin_hunting', 'end_hunting']  # Stop cancels the delay
+
+
+def test_second_caps_lock_toggles_pause_on_the_detector_thread():
+    finder = RecordingFinder()
+    orchestrator = HuntOrchestrator(finder, death_detection_delay=10.0)
+
+    async def script(orchestrator):
+        orchestrator.post_hotkey('caps_lock')
+        await asyncio.sleep(0.05)
+        orchestrator.post_hotkey('caps_lock')
+        await asyncio.sleep(0.05)
+
+    asyncio.run(run_session(orchestrator, finder, script))
+    assert finder.paused
+    toggle_threads = [thread for name, thread in finder.calls if name == 'toggle']
+    assert len(toggle_threads) == 1 and toggle_threads[0].startswith('ihnt-detect')
+
+
+def test_late_presses_are_dropped_instead_of_fired():
+    finder = RecordingFinder()
+    orchestrator = HuntOrchestrator(finder, action_deadline=0.25)
+
+    async def presses():
+        orchestrator.loop = asyncio.get_running_loop()
+        now = orchestrator.loop.time()
+        late = await orchestrator.press_at(now - 1.0, '1')
+        on_time = await orchestrator.press_at(now, '2')
+        return late, on_time
+
+    assert asyncio.run(presses()) == (False, True)
+    assert [key for key, _ in finder.keys] == ['2']
+    assert orchestrator.dropped_presses == 1 and orchestrator.presses == 1
+    assert "1 pressed, 1 dropped" in orchestrator.stats_summary()
@@ -0,0 +1,36 @@
+"""Per-state check throttling and transitions"""
+
+from hunt_state_machine import HuntStateMachine
+
+
+def test_should_run_follows_state_intervals():
+    machine = HuntStateMachine()
+    machine.enter('acquire', 0.0)
+    assert machine.should_run('death', 0.0)
+    assert not machine.should_run('death', 0.5)
+    assert machine.should_run('death', 1.0)
+    assert machine.should_run('health', 1.0)  # Not listed - every frame
+    assert machine.should_run('health', 1.0)
+
+    machine.enter('paused', 1.2)
+    assert not machine.should_run('death', 5.0)
+    assert not machine.should_run('health', 5.0)
+
+    machine.enter('dead', 6.0)
+    assert machine.should_run('death', 6.0)
+    assert machine.should_run('death', 6.0)
+
+
+def test_overrides_and_transition_events():
+    events = []
+    machine = HuntStateMachine({'engage': {'kill': 0.2}})
+    machine.on_transition(lambda previous, state, dwell, now: events.append((previous, state, dwell)))
+    machine.enter('acquire', 0.0)
+    machine.enter('engage', 2.0)
+    assert not machine.enter('engage', 2.5)
+    assert machine.should_run('kill', 2.0)
+    assert not machine.should_run('kill', 2.1)
+    assert machine.should_run('death', 4.0)
+    assert not machine.should_run('death', 5.0)  # Engage keeps the death check at 2s
+    assert events == [(None, 'acquire', 0.0), ('acquire', 'engage', 2.0)]
+    assert machine.dwell['acquire'] == 2.0
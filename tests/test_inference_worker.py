@@ -0,0 +1,138 @@
+"""Tests for the shared-memory ring protocol between I-HNT and its inference worker"""
+
+import struct
+import sys
+import threading
+import types
+import multiprocessing as mp
+
+import numpy as np
+import pytest
+
+from inference_worker import InferenceWorker, REQUEST_FORMAT, REPLY_FORMAT
+
+
+class Tensor:
+    def __init__(self, array):
+        self.array = array
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self.array
+
+
+class RecordingYOLO:
+    """Stands in for ultralytics.YOLO: one box per frame that echoes the frame's first pixel"""
+    calls = []
+
+    def __init__(self, path):
+        self.path = path
+
+    def __call__(self, frame, **kwargs):
+        if frame.shape == (100, 100, 3):
+            return []  # Warm-up
+        RecordingYOLO.calls.append((frame.copy(), kwargs))
+        if frame[0, 0, 0] == 13:
+            raise RuntimeError("bad frame")
+        height, width = frame.shape[:2]
+        row = [0, 0, width, height, 0.5, float(frame[0, 0, 0])]
+        return [types.SimpleNamespace(boxes=types.SimpleNamespace(data=Tensor(np.array([row], np.float32))))]
+
+
+class ChildEnd:
+    """Child pipe end whose close() in the parent is a no-op, as with a real process's own copy"""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self.conn, name)
+
+    def close(self):
+        pass
+
+
+def thread_pipe():
+    parent_conn, child_conn = mp.Pipe()
+    return parent_conn, ChildEnd(child_conn)
+
+
+class ThreadProcess(threading.Thread):
+    """Runs the worker entry point on a thread so the test needs no real model process"""
+    pid = 0
+
+    def terminate(self):
+        pass
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    RecordingYOLO.calls = []
+    monkeypatch.setitem(sys.modules, 'ultralytics', types.SimpleNamespace(YOLO=RecordingYOLO))
+    handle = InferenceWorker('echo.pt', (8, 10), slot_count=2, max_det=4)
+    handle.context = types.SimpleNamespace(Pipe=thread_pipe, Process=ThreadProcess)
+    assert handle.start()
+    yield handle
+    handle.stop()
+
+
+def frame(value, height=8, width=10, channels=3):
+    return np.full((height, width, channels), value, dtype=np.uint8)
+
+
+def test_messages_round_trip():
+    message = struct.pack(REQUEST_FORMAT, 1, 2**32 - 1, 0.25, 0.45, 300, 640, 720, 1280)
+    slot, seq, conf, iou, max_det, imgsz, height, width = struct.unpack(REQUEST_FORMAT, message)
+    assert (slot, seq, max_det, imgsz, height, width) == (1, 2**32 - 1, 300, 640, 720, 1280)
+    assert conf == pytest.approx(0.25) and iou == pytest.approx(0.45)
+    assert struct.unpack(REPLY_FORMAT, struct.pack(REPLY_FORMAT, 0, 7, -1)) == (0, 7, -1)
+
+
+def test_infer_returns_worker_detections(worker):
+    boxes = worker.infer(frame(42, 6, 9), 0.3, 0.5, 300)
+    np.testing.assert_array_equal(boxes, [[0, 0, 9, 6, 0.5, 42]])
+    _, kwargs = RecordingYOLO.calls[0]
+    assert kwargs['max_det'] == 4  # Clamped to the result buffer size
+    assert 'imgsz' not in kwargs
+    assert worker.frames_processed == 1
+
+
+def test_imgsz_is_forwarded_when_set(worker):
+    worker.infer(frame(1), 0.3, 0.5, 2, imgsz=320)
+    _, kwargs = RecordingYOLO.calls[0]
+    assert kwargs['imgsz'] == 320 and kwargs['max_det'] == 2
+
+
+def test_bgra_frames_are_copied_without_alpha(worker):
+    bgra = frame(9, channels=4)
+    bgra[..., 3] = 255
+    worker.infer(bgra, 0.3, 0.5, 300)
+    seen, _ = RecordingYOLO.calls[0]
+    assert seen.shape == (8, 10, 3)
+    assert (seen == 9).all()
+
+
+def test_slots_rotate_and_are_never_overwritten_while_pending(worker):
+    tickets = [worker.submit(frame(value), 0.3, 0.5, 300) for value in (1, 2, 3)]
+    assert [slot for slot, _ in tickets] == [0, 1, 0]
+    assert [seq for _, seq in tickets] == [0, 1, 2]
+    assert len(worker.pending) <= worker.slot_count
+    assert tickets[0] not in worker.pending  # Collected before slot 0 was reused
+
+    assert worker.collect(tickets[2])[0, 5] == 3
+    assert not worker.pending  # Ticket 1's reply was consumed on the way
+    assert [int(seen[0, 0, 0]) for seen, _ in RecordingYOLO.calls] == [1, 2, 3]
+
+
+def test_inference_error_returns_none_and_keeps_worker(worker):
+    assert worker.infer(frame(13), 0.3, 0.5, 300) is None
+    assert worker.infer(frame(5), 0.3, 0.5, 300)[0, 5] == 5
+    assert worker.respawn_count == 0
+
+
+def test_oversized_frame_is_rejected(worker):
+    with pytest.raises(ValueError):
+        worker.submit(frame(1, height=9), 0.3, 0.5, 300)
+    assert worker.collect(None) is None
@@ -0,0 +1,43 @@
+"""Kills vs lost targets when the red-health lock ends"""
+
+import contextlib
+import io
+import time
+
+import numpy as np
+
+
+def end_fight(simulator, finder, corpse_bar):
+    """Locked on a target whose red run just vanished - with or without the emptied health bar on screen"""
+    kills, lost = [], []
+    finder.record_kill = lambda: kills.append(True)
+    finder.record_lost_target = lambda: lost.append(True)
+    finder.run_inference = lambda frame: np.empty((0, 6), dtype=np.float32)  # Nothing else in view
+    finder.current_target = {'screen_position': (1000, 600), 'target_position': (1000, 600)}
+    finder.target_selected_time = time.time()
+    finder.detection_paused = True
+    finder.detection_pause_start = time.time()
+    simulator.selected = None
+    simulator.corpse_until = simulator.now + 1.0 if corpse_bar else 0.0
+    simulator.frame_cache_key = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        finder.detection_step(time.time())
+    return kills, lost
+
+
+def test_empty_health_bar_counts_a_kill(simulated_finder):
+    simulator, finder = simulated_finder
+    kills, lost = end_fight(simulator, finder, corpse_bar=True)
+    assert finder.last_health_status['bar_visible']
+    assert not finder.last_health_status['has_health_bar']
+    assert kills == [True]
+    assert lost == []
+    assert not finder.detection_paused
+
+
+def test_missing_health_bar_counts_a_lost_target(simulated_finder):
+    simulator, finder = simulated_finder
+    kills, lost = end_fight(simulator, finder, corpse_bar=False)
+    assert not finder.last_health_status['bar_visible']
+    assert kills == []
+    assert lost == [True]
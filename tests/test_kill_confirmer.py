@@ -0,0 +1,86 @@
+"""Tests for early kill confirmation on the locked target"""
+
+import numpy as np
+
+from kill_confirmer import ALIVE, DEAD, DYING, KillConfirmer
+
+SPRITE = np.random.default_rng(0).integers(0, 256, (20, 20, 3), dtype=np.uint8)
+
+
+def window_with_sprite(x, y, size=40):
+    """Flat BGR search window with the sprite pasted at (x, y)"""
+    window = np.full((size, size, 3), 90, dtype=np.uint8)
+    window[y:y + 20, x:x + 20] = SPRITE
+    return window
+
+
+def locked_confirmer(red=100):
+    confirmer = KillConfirmer()
+    confirmer.lock(('mob', 1), SPRITE, red, now=0.0)
+    return confirmer
+
+
+def test_search_box_pads_the_bbox():
+    assert KillConfirmer(search_margin=0.5).search_box((100, 50, 140, 70)) == (80, 40, 160, 80)
+
+
+def test_locate_follows_a_moved_sprite():
+    confirmer = locked_confirmer()
+    crop = confirmer.locate(window_with_sprite(13, 7))
+    assert confirmer.last_offset == (13, 7)
+    assert confirmer.changed_share(crop) == 0.0
+
+    assert confirmer.locate(np.zeros((10, 10, 3), dtype=np.uint8)) is None  # Smaller than the sprite
+
+
+def test_full_health_is_alive_and_low_health_is_dying():
+    confirmer = locked_confirmer()
+    assert confirmer.update(window_with_sprite(5, 5), 100, now=0.5) == ALIVE
+    assert confirmer.update(window_with_sprite(8, 4), 20, now=1.0) == DYING
+    assert confirmer.is_locked_on(('mob', 1))
+
+
+def test_vanished_sprite_at_low_health_confirms_by_pixel_diff():
+    confirmer = locked_confirmer()
+    corpse = np.full((40, 40, 3), 90, dtype=np.uint8)
+    assert confirmer.update(corpse, 20, now=1.5) == DEAD
+    assert confirmer.confirmations['pixel_diff'] == 1
+    assert not confirmer.is_locked_on(('mob', 1))
+
+
+def test_changed_sprite_at_high_health_is_not_a_kill():
+    confirmer = locked_confirmer()
+    corpse = np.full((40, 40, 3), 90, dtype=np.uint8)
+    assert confirmer.update(corpse, 90, now=0.5) == ALIVE
+
+
+def test_empty_red_run_confirms_by_health():
+    confirmer = locked_confirmer()
+    assert confirmer.update(window_with_sprite(5, 5), 0, now=2.0) == DEAD
+    assert confirmer.confirmations['health'] == 1
+    assert confirmer.fight_time_total == 2.0
+
+
+def test_hp_trend_past_zero_confirms_early():
+    confirmer = locked_confirmer()
+    window = window_with_sprite(5, 5)
+    assert confirmer.update(window, 60, now=1.0) == ALIVE
+    assert confirmer.update(window, 20, now=2.0) == DYING
+    assert confirmer.seconds_to_zero() > 0
+    assert confirmer.update(window, 1, now=3.0) == DEAD  # Fitted line already crossed zero
+    assert confirmer.confirmations['hp_trend'] == 1
+
+
+def test_seconds_to_zero_needs_a_falling_trend():
+    confirmer = locked_confirmer()
+    confirmer.history.extend([(1.0, 100), (2.0, 100)])
+    assert confirmer.seconds_to_zero() is None
+
+
+def test_stats_summary_counts_early_kills():
+    confirmer = locked_confirmer()
+    confirmer.update(np.full((40, 40, 3), 90, dtype=np.uint8), 10, now=1.0)
+    confirmer.lock(('mob', 2), SPRITE, 100, now=2.0)
+    confirmer.update(window_with_sprite(5, 5), 0, now=5.0)
+    assert "2 kills (1 before the red run vanished" in confirmer.stats_summary()
+    assert "avg fight 2.0s" in confirmer.stats_summary()
@@ -0,0 +1,96 @@
+"""Tests for the long-session buffer pool and memory sampler"""
+
+import csv
+
+import numpy as np
+import pytest
+
+import memory_monitor
+from memory_monitor import PROJECT_DIR, BufferPool, MemorySampler, subsystem_of
+
+
+def test_pool_reuses_a_fixed_ring_per_shape():
+    pool = BufferPool(slots=3)
+    first = [pool.take((4, 5, 3)) for _ in range(3)]
+    again = [pool.take((4, 5, 3)) for _ in range(3)]
+    assert all(a is b for a, b in zip(first, again))
+    assert len({id(buffer) for buffer in first}) == 3
+
+    other = pool.take((4, 5, 3), dtype=np.float32)
+    assert other.dtype == np.float32 and all(other is not buffer for buffer in first)
+    assert pool.allocations == 4 and pool.takes == 7
+    assert pool.nbytes() == 3 * 60 + 60 * 4
+    assert "2 rings x 3 slots" in pool.stats_summary()
+
+
+def test_subsystem_of():
+    assert subsystem_of("/usr/lib/python3/site-packages/torch/nn/modules/conv.py") == 'torch'
+    assert subsystem_of("/venv/lib/python3.11/dist-packages/cv2/__init__.py") == 'cv2'
+    assert subsystem_of(str(PROJECT_DIR / "i_hnt.py")) == 'i_hnt'
+    assert subsystem_of("/usr/lib/python3.11/json/decoder.py") == 'python'
+
+
+@pytest.fixture
+def scripted_rss(monkeypatch):
+    """Make current_rss_mb() return the values appended to the list, in order"""
+    values = []
+    monkeypatch.setattr(memory_monitor, 'current_rss_mb', lambda: values.pop(0))
+    return values
+
+
+def test_baseline_waits_for_the_warmup(scripted_rss):
+    sampler = MemorySampler(interval=60.0, warmup=300.0)
+    sampler.start(now=0.0)
+    assert not sampler.maybe_sample(now=30.0)
+
+    scripted_rss.extend([400.0, 500.0])
+    assert sampler.maybe_sample(now=60.0)
+    assert sampler.baseline is None
+    sampler.sample(now=300.0)
+    assert sampler.baseline['rss'] == 500.0
+    assert "warming up" not in sampler.stats_summary()
+
+
+def test_growth_warns_once_per_threshold_step(scripted_rss, capsys):
+    sampler = MemorySampler(interval=60.0, warmup=0.0, growth_warn_mb=64.0)
+    sampler.start(now=0.0)
+    scripted_rss.extend([500.0, 530.0, 570.0, 580.0, 640.0])
+    for minute in range(5):
+        sampler.sample(now=minute * 60.0)
+
+    assert sampler.warnings == 2  # Past +64MB at minute 2, past +128MB at minute 4
+    assert sampler.growth() == 140.0
+    assert sampler.growth_rate() == pytest.approx(2000.0, rel=0.1)
+    assert "MEMORY GROWTH: +140MB in 4 min" in capsys.readouterr().out
+
+
+def test_samples_are_appended_to_the_csv_log(scripted_rss, tmp_path):
+    log_path = tmp_path / "memory_log.csv"
+    sampler = MemorySampler(warmup=0.0, log_path=log_path)
+    sampler.start(now=0.0)
+    scripted_rss.extend([412.34, 413.0])
+    sampler.sample(now=60.0)
+    sampler.sample(now=120.0)
+
+    with open(log_path, newline='') as log:
+        rows = list(csv.reader(log))
+    assert rows[0] == ['time', 'rss_mb', 'subsystem', 'traced_mb']
+    assert rows[1:] == [['60', '412.3', 'total', ''], ['120', '413.0', 'total', '']]
+
+
+def test_traced_growth_is_attributed_to_the_allocating_module(scripted_rss, capsys):
+    sampler = MemorySampler(warmup=0.0, growth_warn_mb=2.0, trace=True)
+    sampler.start(now=0.0)
+    try:
+        scripted_rss.extend([None, None])
+        sampler.sample(now=0.0)
+        leak = [bytes(1024) for _ in range(4096)]  # ~4MB of Python objects
+        sampler.sample(now=60.0)
+    finally:
+        sampler.stop()
+
+    assert len(leak) == 4096
+    assert sampler.warnings == 1
+    name, delta = sampler.subsystem_growth(sampler.samples[-1][2])[0]
+    assert name == 'test_memory_monitor' and delta > 3.5
+    assert "📦 test_memory_monitor" in capsys.readouterr().out
@@ -0,0 +1,64 @@
+"""Tests for the Prometheus metrics endpoint"""
+
+import urllib.error
+import urllib.request
+
+import pytest
+
+from metrics_server import Histogram, HuntingMetrics, MetricsServer
+
+
+def test_histogram_buckets_are_cumulative_and_inclusive():
+    histogram = Histogram((0.01, 0.1))
+    for value in (0.005, 0.01, 0.05, 3.0):
+        histogram.observe(value)
+    cumulative, total, count = histogram.snapshot()
+    assert cumulative == [2, 3, 4]  # le="0.01" includes 0.01 itself
+    assert total == pytest.approx(3.065) and count == 4
+
+
+def test_loop_fps_is_smoothed():
+    metrics = HuntingMetrics(fps_smoothing=0.5)
+    metrics.record_loop('acquire', 0.01, now=0.0)
+    metrics.record_loop('acquire', 0.01, now=0.1)
+    assert metrics.fps == pytest.approx(10.0)
+    metrics.record_loop('engage', 0.01, now=0.15)
+    assert metrics.fps == pytest.approx(15.0)
+    assert metrics.frames == 3
+
+
+def test_render_exposes_counters_state_and_histograms():
+    metrics = HuntingMetrics()
+    metrics.kills = 4
+    metrics.record_detections(3, zone_mobs=1)
+    metrics.observe_stage('detect', 0.02)
+    metrics.record_loop('engage', 0.03, now=1.0)
+    text = metrics.render()
+
+    assert "ihnt_kills_total 4" in text
+    assert "ihnt_detections_total 3" in text
+    assert 'ihnt_state{state="engage"} 1' in text
+    assert 'ihnt_state{state="acquire"} 0' in text
+    assert 'ihnt_stage_seconds_bucket{stage="detect",le="0.025"} 1' in text
+    assert 'ihnt_stage_seconds_count{stage="detect"} 1' in text
+    assert 'ihnt_detections_per_frame_bucket{le="3"} 1' in text
+    assert "ihnt_detections_per_frame_count 1" in text
+    assert text.endswith("\n")
+
+
+def test_server_serves_metrics_and_rejects_other_paths():
+    metrics = HuntingMetrics()
+    metrics.deaths = 2
+    server = MetricsServer(metrics, port=0)
+    server.start()
+    try:
+        base = f"http://127.0.0.1:{server.server.server_address[1]}"
+        with urllib.request.urlopen(f"{base}/metrics", timeout=5) as response:
+            assert response.headers['Content-Type'].startswith("text/plain; version=0.0.4")
+            assert "ihnt_deaths_total 2" in response.read().decode()
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(f"{base}/other", timeout=5)
+        assert error.value.code == 404
+    finally:
+        server.stop()
+    assert server.scrapes == 1
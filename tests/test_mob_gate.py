@@ -0,0 +1,96 @@
+"""Tests for the cascade mob gate"""
+
+import numpy as np
+import pytest
+
+from mob_gate import CELL_PIXELS, FEATURE_COUNT, MobGate, window_features
+
+
+def synthetic_world(seed=0):
+    """Red blob sprites on white, and grassy green backgrounds"""
+    rng = np.random.default_rng(seed)
+    sprites = []
+    for _ in range(4):
+        sprite = np.full((48, 48, 3), 255, dtype=np.uint8)
+        sprite[8:40, 12:36] = (200 + rng.integers(0, 40), 30, 40)
+        sprite[14:18, 16:32] = 20
+        sprites.append(sprite)
+    backgrounds = []
+    for _ in range(3):
+        background = np.zeros((240, 320, 3), dtype=np.uint8)
+        background[..., 1] = 120 + rng.integers(0, 30, (240, 320))
+        background[..., 0] = 40
+        background[..., 2] = 30
+        backgrounds.append(background)
+    return sprites, backgrounds
+
+
+@pytest.fixture(scope='module')
+def trained_gate():
+    sprites, backgrounds = synthetic_world()
+    gate, recall, background_pass = MobGate.train(sprites, backgrounds, samples=300, cell_size=48, epochs=200)
+    return gate, recall, background_pass
+
+
+def test_window_features_match_per_window_crops():
+    images = np.random.default_rng(1).integers(0, 256, (2, 32, 48, 3), dtype=np.uint8)
+    features = window_features(images).reshape(2, 3, 5, FEATURE_COUNT)
+
+    step = CELL_PIXELS // 2
+    for b, y, x in [(0, 0, 0), (0, 1, 3), (1, 2, 4), (1, 0, 2)]:
+        crop = images[b:b + 1, y * step:y * step + CELL_PIXELS, x * step:x * step + CELL_PIXELS]
+        np.testing.assert_allclose(features[b, y, x], window_features(crop)[0], rtol=1e-4, atol=1e-5)
+
+
+def test_trained_gate_separates_mobs_from_background(trained_gate):
+    gate, recall, background_pass = trained_gate
+    assert recall >= 0.95
+    assert background_pass < 0.2
+
+    sprites, backgrounds = synthetic_world(seed=5)
+    empty = backgrounds[0][..., ::-1].copy()  # Screen captures are BGR
+    busy = empty.copy()
+    busy[100:148, 150:198] = sprites[0][..., ::-1]
+
+    zone = (0, 0, 320, 240)
+    assert gate.check(busy, zone)[0]
+    assert not gate.check(empty, zone)[0]
+    assert gate.checks == 2 and gate.skipped == 1
+
+
+def test_zone_image_accepts_bgra_and_bgr():
+    gate = MobGate(cell_size=32)
+    frame = np.random.default_rng(2).integers(0, 256, (100, 130, 3), dtype=np.uint8)
+    bgra = np.dstack([frame, np.full(frame.shape[:2], 255, np.uint8)])
+
+    small = gate.zone_image(frame, (10, 20, 110, 84))
+    assert small.shape == (2 * CELL_PIXELS, 4 * CELL_PIXELS, 3)
+    np.testing.assert_array_equal(small, gate.zone_image(bgra, (10, 20, 110, 84)))
+
+
+def test_empty_zone_counts_as_no_candidates():
+    gate = MobGate()
+    frame = np.zeros((50, 50, 3), dtype=np.uint8)
+    assert gate.zone_image(frame, (40, 40, 40, 40)) is None
+    assert gate.check(frame, (40, 40, 40, 40)) == (False, 0.0)
+
+
+def test_save_and_load_round_trip(trained_gate, tmp_path):
+    gate = trained_gate[0]
+    path = tmp_path / "gate.npz"
+    gate.save(path)
+    loaded = MobGate.load(path)
+
+    assert loaded.threshold == pytest.approx(gate.threshold)
+    assert loaded.cell_size == gate.cell_size
+    cells = np.random.default_rng(3).integers(0, 256, (4, 16, 16, 3), dtype=np.uint8)
+    np.testing.assert_allclose(loaded.score_windows(cells), gate.score_windows(cells), rtol=1e-5)
+
+
+def test_full_pass_statistics():
+    gate = MobGate()
+    gate.record_full_pass(True)
+    gate.record_full_pass(False)
+    gate.record_full_pass(True, audit=True)
+    assert (gate.full_passes, gate.full_pass_hits, gate.audits, gate.audit_misses) == (2, 1, 1, 1)
+    assert "audit misses 1/1" in gate.stats_summary()
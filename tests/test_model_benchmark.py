@@ -0,0 +1,43 @@
+"""Detection matching and configuration selection"""
+
+import numpy as np
+import pytest
+
+from model_benchmark import match_counts, select_config
+
+
+def test_match_counts_greedy_by_confidence():
+    truth = np.array([[0, 10, 10, 50, 50], [1, 100, 100, 140, 140]], dtype=np.float32)
+    predictions = np.array([
+        [11, 11, 50, 50, 0.9, 0],
+        [12, 10, 51, 50, 0.8, 0],       # Duplicate of the first mob
+        [100, 100, 140, 140, 0.7, 0],   # Right place, wrong class
+        [300, 300, 320, 320, 0.6, 0],
+    ], dtype=np.float32)
+    assert match_counts(predictions, truth) == (2, 2, 0)
+    assert match_counts(predictions, truth, class_aware=True) == (1, 3, 1)
+
+
+def test_match_counts_empty_sides():
+    truth = np.array([[0, 10, 10, 50, 50]], dtype=np.float32)
+    none = np.empty((0, 6), dtype=np.float32)
+    assert match_counts(none, truth) == (0, 0, 1)
+    assert match_counts(np.array([[0, 0, 5, 5, 0.5, 0]], dtype=np.float32), truth[:0]) == (0, 1, 0)
+
+
+def test_select_config_prefers_fast_near_ties_within_budget():
+    configs = [
+        {'name': 'big', 'f1': 0.90, 'p95_ms': 80.0},
+        {'name': 'mid', 'f1': 0.895, 'p95_ms': 40.0},
+        {'name': 'small', 'f1': 0.80, 'p95_ms': 10.0},
+    ]
+    assert select_config(configs)['name'] == 'mid'
+    assert select_config(configs, max_p95_ms=20.0)['name'] == 'small'
+    assert select_config(configs, max_p95_ms=5.0)['name'] == 'mid'  # Nothing fits - best overall
+    assert select_config([]) is None
+
+
+@pytest.mark.parametrize('tolerance, expected', [(0.0, 'big'), (0.2, 'small')])
+def test_select_config_tolerance(tolerance, expected):
+    configs = [{'name': 'big', 'f1': 0.9, 'p95_ms': 80.0}, {'name': 'small', 'f1': 0.8, 'p95_ms': 10.0}]
+    assert select_config(configs, f1_tolerance=tolerance)['name'] == expected
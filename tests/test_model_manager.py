@@ -0,0 +1,141 @@
+"""Tests for hot model reload validation"""
+
+import time
+
+import numpy as np
+import pytest
+
+from model_manager import ModelManager, box_iou, matched_boxes
+
+REFERENCE_BOXES = np.array([[10, 10, 50, 50, 0.9, 0], [100, 100, 140, 150, 0.8, 0]], dtype=np.float32)
+
+
+def shifted_model(shift, keep=2):
+    """Candidate model that finds the reference boxes moved by `shift` pixels"""
+    def model(frame):
+        boxes = REFERENCE_BOXES[:keep].copy()
+        boxes[:, :4] += shift
+        return boxes
+    return model
+
+
+def manager_for(candidate, tmp_path, **kwargs):
+    manager = ModelManager(tmp_path / "best.pt", loader=lambda path: candidate,
+                           predictor=lambda model, frame: model(frame), warmup_runs=1, **kwargs)
+    manager.offer_reference(np.zeros((200, 200, 3), dtype=np.uint8), REFERENCE_BOXES, now=100.0)
+    return manager
+
+
+def test_box_iou_and_matching():
+    boxes = np.array([[0, 0, 10, 10], [5, 0, 15, 10], [20, 20, 30, 30]], dtype=np.float32)
+    np.testing.assert_allclose(box_iou(np.array([0, 0, 10, 10]), boxes), [1.0, 1 / 3, 0.0])
+    assert matched_boxes(REFERENCE_BOXES, REFERENCE_BOXES) == 2
+    assert matched_boxes(REFERENCE_BOXES, REFERENCE_BOXES[:1]) == 1
+    assert matched_boxes(REFERENCE_BOXES, np.empty((0, 6))) == 0
+
+
+def test_references_are_spaced_and_capped(tmp_path):
+    manager = ModelManager(tmp_path / "best.pt", loader=None, predictor=None,
+                           reference_count=2, reference_interval=10.0)
+    frame = np.zeros((4, 4, 3), dtype=np.uint8)
+    for now in (10.0, 15.0, 20.0, 30.0):
+        manager.offer_reference(frame, REFERENCE_BOXES, now)
+    manager.offer_reference(frame, np.empty((0, 6)), 50.0)  # Nothing to compare against
+    assert len(manager.references) == 2
+    assert manager.last_reference_at == 30.0
+
+
+def test_matching_candidate_is_queued_for_the_swap(tmp_path):
+    model = shifted_model(2)
+    manager = manager_for(model, tmp_path, prestart=lambda path, candidate: {'worker': path})
+    assert manager.prepare("next.pt")
+
+    ready_model, path, report, services = manager.take_ready()
+    assert ready_model is model and path == "next.pt"
+    assert report['recall'] == 1.0 and report['frames'] == 1
+    assert services == {'worker': "next.pt"}
+    assert manager.take_ready() is None
+
+
+def test_candidate_missing_mobs_is_rejected(tmp_path):
+    manager = manager_for(shifted_model(0, keep=1), tmp_path, min_recall=0.75)
+    assert not manager.prepare("next.pt")
+    assert manager.take_ready() is None
+    assert manager.rejected == 1
+    assert "finds only 50%" in manager.last_report['reason']
+
+
+def test_misplaced_boxes_do_not_count_as_found(tmp_path):
+    manager = manager_for(shifted_model(30), tmp_path)
+    assert not manager.prepare("next.pt")
+    assert manager.last_report['recall'] == 0.0
+
+
+def test_broken_candidates_are_rejected(tmp_path):
+    flat = manager_for(lambda frame: np.zeros(6), tmp_path)
+    assert not flat.prepare("next.pt")
+    assert "unexpected output shape" in flat.last_report['reason']
+
+    def failing_loader(path):
+        raise RuntimeError("corrupt weights")
+    crashing = ModelManager(tmp_path / "best.pt", loader=failing_loader, predictor=None)
+    assert not crashing.prepare("next.pt")
+    assert crashing.rejected == 1
+
+
+def test_superseded_candidate_releases_its_services(tmp_path):
+    released = []
+    manager = manager_for(shifted_model(0), tmp_path, prestart=lambda path, model: {'path': path},
+                          release=released.append)
+    manager.prepare("first.pt")
+    manager.prepare("second.pt")
+    assert released == [{'path': "first.pt"}]
+    assert manager.take_ready()[1] == "second.pt"
+
+
+def test_without_references_a_clean_run_is_enough(tmp_path):
+    manager = ModelManager(tmp_path / "best.pt", loader=lambda path: shifted_model(0),
+                           predictor=lambda model, frame: model(frame), warmup_runs=1)
+    assert manager.prepare("next.pt")
+    assert manager.take_ready()[2]['frames'] == 0
+
+
+def test_watcher_reloads_once_the_file_settles(tmp_path):
+    weights = tmp_path / "best.pt"
+    weights.write_bytes(b"old")
+    loaded = []
+
+    def loader(path):
+        loaded.append(weights.read_bytes())
+        return shifted_model(0)
+
+    manager = ModelManager(weights, loader=loader, predictor=lambda model, frame: model(frame),
+                           poll_interval=0.01, settle_time=0.05, warmup_runs=1)
+    manager.start_watching()
+    try:
+        weights.write_bytes(b"new weights")
+        deadline = time.time() + 5
+        while manager.ready is None and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        manager.stop_watching()
+
+    assert loaded == [b"new weights"]
+    assert manager.take_ready() is not None
+    assert manager.file_signature == manager.signature()
+
+
+def test_concurrent_reloads_are_refused(tmp_path):
+    manager = manager_for(shifted_model(0), tmp_path)
+    manager.loading.acquire()
+    try:
+        assert not manager.prepare("next.pt")
+    finally:
+        manager.loading.release()
+    assert manager.prepare("next.pt")
+
+
+@pytest.mark.parametrize("boxes", [np.empty((0, 6)), REFERENCE_BOXES[:1]])
+def test_empty_or_partial_output_shapes_are_valid(tmp_path, boxes):
+    manager = manager_for(lambda frame: boxes, tmp_path, min_recall=0.0)
+    assert manager.prepare("next.pt")
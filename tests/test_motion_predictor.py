@@ -0,0 +1,85 @@
+"""Tests for latency-compensated click targeting"""
+
+import pytest
+
+from motion_predictor import MotionPredictor
+
+
+def detection(x, y):
+    return {'screen_position': (x, y)}
+
+
+def tracked(predictor, positions, step=0.1):
+    """Feed one mob through consecutive frames, returns the last annotated detection"""
+    for frame, (x, y) in enumerate(positions):
+        target = detection(x, y)
+        predictor.update([target], frame * step)
+    return target
+
+
+def test_tracks_link_nearby_detections_and_measure_velocity():
+    predictor = MotionPredictor(smoothing=0.5)
+    target = tracked(predictor, [(100, 100), (110, 100), (120, 100)])
+    assert target['track_id'] == 0
+    assert target['velocity'] == pytest.approx((100.0, 0.0))
+    assert target['captured_at'] == pytest.approx(0.2)
+
+
+def test_far_detections_start_new_tracks():
+    predictor = MotionPredictor(match_distance=50)
+    first, second = detection(100, 100), detection(400, 100)
+    predictor.update([first, second], 0.0)
+    moved = detection(370, 100)
+    predictor.update([moved], 0.1)
+    assert moved['track_id'] != first['track_id']
+    assert moved['track_id'] == second['track_id']
+    assert moved['velocity'] == pytest.approx((-300.0, 0.0))
+
+
+def test_stale_tracks_are_dropped():
+    predictor = MotionPredictor(max_track_age=0.6)
+    predictor.update([detection(100, 100)], 0.0)
+    predictor.update([], 0.5)
+    assert len(predictor.tracks) == 1
+    predictor.update([], 0.7)
+    assert not predictor.tracks
+
+
+def test_moving_target_is_led_by_the_latency():
+    predictor = MotionPredictor()
+    target = tracked(predictor, [(100, 100), (110, 100), (120, 100)])
+    position, latency, compensated = predictor.predict(target, now=0.35)
+    assert compensated
+    assert latency == pytest.approx(0.15)
+    assert position == (135, 100)
+
+
+def test_lead_is_capped_in_time_and_distance():
+    predictor = MotionPredictor(max_lead=0.5, max_shift=30)
+    target = tracked(predictor, [(100, 100), (110, 100)])
+    position, _, compensated = predictor.predict(target, now=5.0)
+    assert compensated and position == (140, 100)
+
+
+def test_slow_or_untracked_targets_are_clicked_where_seen():
+    predictor = MotionPredictor(min_speed=25.0)
+    target = tracked(predictor, [(100, 100), (101, 100)])  # 10 px/s
+    assert predictor.predict(target, now=0.3) == ((101, 100), pytest.approx(0.2), False)
+    assert predictor.predict(detection(5, 5), now=1.0) == ((5, 5), 0.0, False)
+
+
+def test_click_outcomes_are_scored_per_kind():
+    predictor = MotionPredictor()
+    predictor.record_click(0.1, True)
+    predictor.record_outcome(health_bar_visible=True)
+    predictor.record_click(0.2, False)
+    predictor.record_outcome(health_bar_visible=False)
+    predictor.record_click(0.1, True)
+    predictor.record_outcome(pet=True)
+    predictor.record_outcome(health_bar_visible=True)  # No pending click - ignored
+
+    assert predictor.hit_rate('compensated') == 1.0
+    assert predictor.hit_rate('static') == 0.0
+    assert predictor.pet_clicks == 1
+    summary = predictor.stats_summary()
+    assert "capture→click 133ms" in summary and "compensated 1/1 (100%)" in summary
@@ -0,0 +1,38 @@
+"""RoiStats counts must match the per-threshold cvtColor/inRange masks they replaced"""
+
+import cv2
+import numpy as np
+
+from roi_stats import RoiStats
+
+
+def reference_counts(bgra):
+    """The original health bar check: RGB → HSV/gray, one mask per threshold"""
+    rgb = cv2.cvtColor(bgra, cv2.COLOR_BGRA2RGB)
+    hsv = cv2.cvtColor(rgb, cv2.COLOR_RGB2HSV)
+    red_mask = (cv2.inRange(hsv, np.array([0, 80, 80]), np.array([10, 255, 255])) +
+                cv2.inRange(hsv, np.array([170, 80, 80]), np.array([180, 255, 255])))
+    gray = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
+    return cv2.countNonZero(red_mask), int(np.sum(gray < 60)), int(np.sum(gray > 180))
+
+
+def test_counts_match_masks():
+    rng = np.random.default_rng(0)
+    stats = RoiStats(red=True)
+    for _ in range(5):
+        bgra = rng.integers(0, 256, size=(40, 200, 4), dtype=np.uint8)
+        bgra[10:20, 20:120] = (20, 20, 220, 255)  # A health bar run
+        stats.measure(bgra)
+        red, dark, bright = reference_counts(bgra)
+        assert stats.red_pixels == red
+        assert stats.below(60) == dark
+        assert stats.above(180) == bright
+
+
+def test_bgr_input_and_thresholds():
+    gray_levels = np.arange(256, dtype=np.uint8).repeat(2).reshape(16, 32)
+    stats = RoiStats().measure(cv2.cvtColor(gray_levels, cv2.COLOR_GRAY2BGR))
+    assert stats.below(0) == 0
+    assert stats.below(60) == 120
+    assert stats.above(180) == 150
+    assert stats.ratio_below(256) == 1.0
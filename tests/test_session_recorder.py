@@ -0,0 +1,67 @@
+"""Tests for session recording and replay"""
+
+import numpy as np
+
+from session_recorder import SessionRecorder, SessionReplay
+
+
+def solid(value, channels=3):
+    return np.full((40, 60, channels), value, dtype=np.uint8)
+
+
+def test_recording_round_trips_through_replay(tmp_path):
+    recorder = SessionRecorder(root_dir=tmp_path, chunk_frames=3)
+    recorder.start()
+    for index in range(7):
+        frame = solid(20 * index, channels=4 if index % 2 else 3)  # Raw BGRA captures and BGR frames
+        recorder.record_frame(frame, timestamp=100.0 + index)
+    recorder.record_event('state', {'to': 'engage'}, timestamp=102.5)
+    recorder.record_event('click', {'x': 5, 'y': 7}, timestamp=99.0)
+    recorder.stop()
+
+    replay = SessionReplay(recorder.session_dir)
+    assert replay.frame_count() == 7
+    assert len(replay.chunks) == 3
+    assert replay.meta['downscale'] == 0.5
+
+    frames = list(replay.iter_frames())
+    assert [timestamp for timestamp, _, _ in frames] == [100.0 + index for index in range(7)]
+    assert [frame_no for _, frame_no, _ in frames] == list(range(7))
+    for index, (_, _, image) in enumerate(frames):
+        assert image.shape == (20, 30, 3)
+        assert abs(int(image.mean()) - 20 * index) <= 2
+
+    timeline = [(kind, timestamp) for kind, timestamp, _ in replay.iter_timeline()]
+    assert timeline[0] == ('event', 99.0)
+    assert timeline.index(('event', 102.5)) == timeline.index(('frame', 102.0)) + 1
+
+
+def test_frames_are_dropped_instead_of_blocking(tmp_path):
+    recorder = SessionRecorder(root_dir=tmp_path, max_pending=0)
+    recorder.start()
+    for _ in range(3):
+        recorder.record_frame(solid(10))
+    recorder.stop()
+    assert recorder.frames_recorded == 0 and recorder.frames_dropped == 3
+    assert "3 dropped" in recorder.stats_summary()
+
+
+def test_pooled_frames_are_copied_before_encoding(tmp_path):
+    recorder = SessionRecorder(root_dir=tmp_path, downscale=1.0)
+    recorder.copy_frames = True
+    recorder.start()
+    frame = solid(200)
+    recorder.record_frame(frame, timestamp=1.0)
+    frame[...] = 0  # The buffer pool reuses the array for the next capture
+    recorder.stop()
+
+    _, _, image = next(SessionReplay(recorder.session_dir).iter_frames())
+    assert abs(int(image.mean()) - 200) <= 2
+
+
+def test_nothing_is_recorded_before_start(tmp_path):
+    recorder = SessionRecorder(root_dir=tmp_path)
+    recorder.record_frame(solid(10))
+    recorder.record_event('click')
+    assert recorder.frames_recorded == 0 and not recorder.events
+    recorder.stop()
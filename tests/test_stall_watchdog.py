@@ -0,0 +1,89 @@
+"""Stall detection and escalation against a fake clock"""
+
+from stall_watchdog import StallWatchdog
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_watchdog(flags):
+    clock = FakeClock()
+    watchdog = StallWatchdog(lambda: dict(flags), limits={'fight_lock': 10.0, 'heartbeat': 5.0},
+                             clock=clock, log_path=None)
+    return watchdog, clock
+
+
+def test_nothing_before_first_heartbeat():
+    watchdog, clock = make_watchdog({})
+    clock.now += 100
+    watchdog.check()
+    assert watchdog.next_recovery() is None
+
+
+def test_fight_lock_triggers_and_escalates():
+    flags = {'detection_paused': True, 'lock_started': 1000.0}
+    watchdog, clock = make_watchdog(flags)
+    watchdog.heartbeat('engage')
+    for _ in range(9):
+        clock.now += 1
+        watchdog.heartbeat('engage')
+        watchdog.check()
+    assert watchdog.next_recovery() is None
+
+    clock.now += 1
+    watchdog.heartbeat('engage')
+    watchdog.check()
+    name, attempt, snapshot = watchdog.next_recovery()
+    assert (name, attempt) == ('fight_lock', 1)
+    assert snapshot['state'] == 'engage'
+
+    clock.now += 10  # Still locked - the next attempt escalates
+    watchdog.heartbeat('engage')
+    watchdog.check()
+    assert watchdog.next_recovery()[:2] == ('fight_lock', 2)
+
+    flags['detection_paused'] = False
+    clock.now += 1
+    watchdog.check()
+    clock.now += 10
+    watchdog.heartbeat('acquire')
+    watchdog.check()
+    assert watchdog.recovered == 1
+    assert 'fight_lock' not in watchdog.attempts
+
+
+def test_heartbeat_stall_is_logged_not_queued():
+    watchdog, clock = make_watchdog({})
+    watchdog.heartbeat('acquire')
+    clock.now += 6
+    watchdog.check()
+    assert watchdog.triggers['heartbeat'] == 1
+    assert watchdog.next_recovery() is None
+
+
+def test_pause_never_counts_as_stuck():
+    watchdog, clock = make_watchdog({'detection_paused': True})
+    watchdog.heartbeat('paused')
+    for _ in range(30):
+        clock.now += 1
+        watchdog.heartbeat('paused')
+        watchdog.check()
+    assert watchdog.triggers['fight_lock'] == 0
+
+
+def test_raised_fight_limit_lets_long_fights_finish():
+    clock = FakeClock()
+    watchdog = StallWatchdog(lambda: {'detection_paused': True, 'lock_started': 1000.0},
+                             limits={'fight_lock': 120.0}, clock=clock, log_path=None)
+    watchdog.heartbeat('engage')
+    for _ in range(90):  # A 90s boss fight
+        clock.now += 1
+        watchdog.heartbeat('engage')
+        watchdog.check()
+    assert watchdog.triggers['fight_lock'] == 0
+    assert watchdog.limits['death_stuck'] == 90.0  # Other defaults kept
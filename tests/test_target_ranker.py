@@ -0,0 +1,72 @@
+"""Tests for hunting-zone target ranking"""
+
+import random
+
+import pytest
+
+from target_ranker import SpatialGrid, TargetRanker
+
+CENTER = (960, 540)
+
+
+def candidate(x, y, confidence=0.8, class_id=0):
+    return {'screen_position': (x, y), 'confidence': confidence, 'class_id': class_id}
+
+
+def test_grid_nearest_matches_brute_force():
+    rng = random.Random(0)
+    points = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(300)]
+    grid = SpatialGrid(cell_size=50)
+    for index, point in enumerate(points):
+        grid.insert(point, index)
+
+    for _ in range(100):
+        query = (rng.uniform(0, 1000), rng.uniform(0, 1000))
+        radius = rng.choice([20, 60, 130])
+        distances = [((p[0] - query[0]) ** 2 + (p[1] - query[1]) ** 2) ** 0.5 for p in points]
+        inside = [d for d in distances if d < radius]
+        found = grid.nearest(query, radius)
+        if inside:
+            assert found[2] == pytest.approx(min(inside))
+            assert found[1] == distances.index(min(inside))
+        else:
+            assert found is None
+            assert not grid.has_neighbor(query, radius)
+
+
+def test_closer_mob_is_ranked_first():
+    ranker = TargetRanker()
+    far, near = candidate(1200, 540), candidate(1000, 540)
+    ranked = ranker.rank([far, near], CENTER, now=0.0)
+    assert ranked[0] is near
+    assert near['distance'] == pytest.approx(40)
+    assert ranker.reordered == 1
+
+
+def test_confidence_breaks_near_ties():
+    ranker = TargetRanker()
+    shaky, sure = candidate(1000, 540, confidence=0.3), candidate(920, 540, confidence=0.9)
+    assert ranker.rank([shaky, sure], CENTER, now=0.0)[0] is sure
+
+
+def test_class_value_can_outweigh_distance():
+    ranker = TargetRanker(class_values={3: 1.0})
+    boss, minion = candidate(1200, 540, class_id=3), candidate(1000, 540)
+    assert ranker.rank([minion, boss], CENTER, now=0.0)[0] is boss
+
+
+def test_recent_pet_spots_are_avoided_until_forgotten():
+    ranker = TargetRanker(pet_radius=60, pet_memory=15.0)
+    ranker.record_pet((1000, 540), now=0.0)
+
+    pet, mob = candidate(1005, 545), candidate(1150, 540)
+    assert ranker.rank([pet, mob], CENTER, now=1.0)[0] is mob
+    assert ranker.rank([pet, mob], CENTER, now=20.0)[0] is pet
+    assert not ranker.pet_clicks
+
+
+def test_stats_summary_reports_reordering():
+    ranker = TargetRanker()
+    ranker.rank([candidate(1000, 540), candidate(1200, 540)], CENTER, now=0.0)
+    ranker.rank([candidate(1200, 540), candidate(1000, 540)], CENTER, now=0.0)
+    assert "2 selections | 50% picked a different mob" in ranker.stats_summary()
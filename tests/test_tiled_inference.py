@@ -0,0 +1,47 @@
+"""Cross-tile box merging and tile planning"""
+
+import numpy as np
+
+from tiled_inference import TiledDetector, merge_boxes
+
+
+def test_merge_keeps_best_of_overlapping_same_class():
+    boxes = np.array([
+        [100, 100, 150, 150, 0.6, 0],
+        [102, 101, 151, 152, 0.9, 0],   # Same mob from the neighbouring tile
+        [100, 100, 150, 150, 0.5, 1],   # Same place, other class
+        [300, 300, 340, 340, 0.7, 0],
+    ], dtype=np.float32)
+    merged = merge_boxes(boxes)
+    assert len(merged) == 3
+    assert merged[0, 4] == np.float32(0.9)
+    assert sorted(merged[:, 5].tolist()) == [0, 0, 1]
+
+
+def test_merge_drops_half_mob_cut_by_tile_edge():
+    boxes = np.array([
+        [100, 100, 160, 160, 0.9, 0],
+        [130, 100, 160, 160, 0.4, 0],   # Right half only - low IoU, but inside the full box
+    ], dtype=np.float32)
+    assert len(merge_boxes(boxes)) == 1
+    assert len(merge_boxes(boxes[:1])) == 1
+
+
+def test_plan_small_zone_is_single_tile():
+    detector = TiledDetector((1280, 720), (640, 360), imgsz=640)
+    plan = detector.plan(150)
+    assert plan['grid'] == (1, 1)
+    assert plan['sufficient']
+    assert detector.plan(150) is plan  # Cached per radius
+
+
+def test_plan_large_zone_tiles_cover_zone_within_budget():
+    detector = TiledDetector((1280, 720), (640, 360), imgsz=640, min_mob_pixels=12, budget_ms=200.0)
+    plan = detector.plan(500)
+    x1, y1, x2, y2 = detector.zone_box(500)
+    assert plan['estimated_ms'] <= 200.0
+    assert plan['scale'] >= detector.min_input_pixels / detector.min_mob_pixels
+    assert min(x for x, _, _, _ in plan['tiles']) == x1
+    assert max(x + w for x, _, w, _ in plan['tiles']) == x2
+    assert min(y for _, y, _, _ in plan['tiles']) == y1
+    assert max(y + h for _, y, _, h in plan['tiles']) == y2
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+I-HNT Tiled Inference
+Finds small, distant mobs in large hunting zones (bow preset) by running YOLO
+on overlapping native-resolution tiles of the zone instead of one downscaled
+full frame.
+
+A 1820x880 capture squeezed into a 640 model input shrinks everything about
+3x - a mob 15px tall at the zone edge ends up 5px tall and is missed. Tiling
+the zone box (2 x radius around the character) keeps it near 1:1:
+
+    full frame   1820x880 → 640x309               scale 0.35
+    bow zone     3x3 tiles of 376x336 → 384x384   scale 1.00  (+ the overview pass)
+
+All tiles (and an overview of the whole frame, downscaled into the same tile
+shape, so mobs outside the zone still reach the exploration heatmap) go to
+the model as ONE batch. Boxes are shifted back to frame pixels and merged
+with a class-aware cross-tile NMS that also drops the truncated half of a
+mob cut by a tile edge (intersection over the smaller box).
+
+The grid comes from a small cost model: the latency of a batch is measured
+once per model (base + per image at the model input size, scaling with
+pixel area), and the cheapest grid whose scale keeps the smallest mob above
+min_input_pixels wins. If none of those fits the latency budget, the
+sharpest grid that does is used.
+
+    python tiled_inference.py                       # plans for every preset radius
+    python tiled_inference.py --model best.pt --image shot.png --radius 500
+"""
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+PRESET_RADII = {'sword': 150, 'spear': 300, 'bow': 500}
+
+
+def box_overlaps(box, others):
+    """Intersection area of one x1, y1, x2, y2 box with an (n, 4) array of boxes, plus both areas"""
+    width = np.clip(np.minimum(box[2], others[:, 2]) - np.maximum(box[0], others[:, 0]), 0, None)
+    height = np.clip(np.minimum(box[3], others[:, 3]) - np.maximum(box[1], others[:, 1]), 0, None)
+    area = (box[2] - box[0]) * (box[3] - box[1])
+    areas = (others[:, 2] - others[:, 0]) * (others[:, 3] - others[:, 1])
+    return width * height, area, areas
+
+
+def merge_boxes(boxes, iou_threshold=0.45, ios_threshold=0.8):
+    """Class-aware greedy NMS over (n, 6) rows from several tiles
+
+    A box is suppressed by a higher-confidence box of the same class when their IoU
+    exceeds iou_threshold, or when most of the smaller one lies inside the other
+    (a mob cut in half by a tile edge).
+    """
+    if len(boxes) < 2:
+        return boxes
+    order = np.argsort(-boxes[:, 4])
+    boxes = boxes[order]
+    keep = np.ones(len(boxes), dtype=bool)
+    for i in range(len(boxes)):
+        if not keep[i]:
+            continue
+        rest = np.nonzero(keep[i + 1:] & (boxes[i + 1:, 5] == boxes[i, 5]))[0] + i + 1
+        if not len(rest):
+            continue
+        intersection, area, areas = box_overlaps(boxes[i, :4], boxes[rest, :4])
+        iou = intersection / np.maximum(area + areas - intersection, 1e-6)
+        ios = intersection / np.maximum(np.minimum(area, areas), 1e-6)
+        keep[rest[(iou > iou_threshold) | (ios > ios_threshold)]] = False
+    return boxes[keep]
+
+
+def tile_starts(start, length, tile, count):
+    """Evenly spaced tile origins covering start..start + length"""
+    if count == 1:
+        return [start]
+    step = (length - tile) / (count - 1)
+    return [int(round(start + i * step)) for i in range(count)]
+
+
+class TiledDetector:
+    """Cost-model tile planning + one batched model call + cross-tile NMS for a hunting zone"""
+
+    def __init__(self, frame_size, zone_center, imgsz=640, overlap=64, min_mob_pixels=12, min_input_pixels=10,
+                 budget_ms=200.0, max_grid=4, overview=True):
+        self.frame_width, self.frame_height = frame_size
+        self.zone_center = zone_center          # Character position in frame pixels
+        self.imgsz = imgsz                      # Largest model input side
+        self.min_input_size = imgsz // 2        # Smallest one - keeps the overview pass useful
+        self.overlap = overlap                  # Pixels shared by neighbouring tiles (>= a mob's size)
+        self.min_mob_pixels = min_mob_pixels    # Smallest mob height at native resolution
+        self.min_input_pixels = min_input_pixels  # ...and how tall it has to stay at the model input
+        self.budget_ms = budget_ms
+        self.max_grid = max_grid
+        self.overview = overview                # Add the whole frame (downscaled) to every batch
+
+        # Cost model: batch ms ≈ base_ms + per_image_ms * images * (input side / imgsz)²
+        self.base_ms = 10.0
+        self.per_image_ms = 30.0
+        self.calibrated = False
+        self.plans = {}                         # Zone radius → plan
+        self.overview_buffer = None
+
+        # Statistics
+        self.calls = 0
+        self.images = 0
+        self.raw_boxes = 0
+        self.merged_boxes = 0
+        self.seconds = 0.0
+
+    # ------------------------------------------------------------ cost model
+
+    def calibrate(self, run_batch, repeats=3):
+        """Measure base and per-image batch latency at the full model input size"""
+        blank = np.zeros((self.imgsz, self.imgsz, 3), dtype=np.uint8)
+        run_batch([blank], self.imgsz)  # Warm-up
+        timings = {}
+        for count in (1, 3):
+            start = time.perf_counter()
+            for _ in range(repeats):
+                run_batch([blank] * count, self.imgsz)
+            timings[count] = (time.perf_counter() - start) / repeats * 1000
+        self.per_image_ms = max(0.1, (timings[3] - timings[1]) / 2)
+        self.base_ms = max(0.0, timings[1] - self.per_image_ms)
+        self.calibrated = True
+        self.plans = {}
+        return self.base_ms, self.per_image_ms
+
+    def estimate_ms(self, images, input_size):
+        return self.base_ms + self.per_image_ms * images * (input_size / self.imgsz) ** 2
+
+    def zone_box(self, radius):
+        """Frame-pixel box of the hunting zone (clipped to the frame)"""
+        center_x, center_y = self.zone_center
+        x1, y1 = max(0, int(center_x - radius)), max(0, int(center_y - radius))
+        x2, y2 = min(self.frame_width, int(center_x + radius)), min(self.frame_height, int(center_y + radius))
+        return x1, y1, x2, y2
+
+    def candidate(self, box, columns, rows):
+        """Tiles, input size, scale and estimated cost of one grid over the zone box"""
+        x1, y1, x2, y2 = box
+        width, height = x2 - x1, y2 - y1
+        tile_width = min(width, int(np.ceil((width + (columns - 1) * self.overlap) / columns)))
+        tile_height = min(height, int(np.ceil((height + (rows - 1) * self.overlap) / rows)))
+        longest = max(tile_width, tile_height)
+        input_size = min(self.imgsz, max(self.min_input_size, int(np.ceil(longest / 32)) * 32))
+        tiles = [(x, y, tile_width, tile_height)
+                 for y in tile_starts(y1, height, tile_height, rows)
+                 for x in tile_starts(x1, width, tile_width, columns)]
+        images = len(tiles) + (1 if self.overview else 0)
+        return {
+            'grid': (columns, rows),
+            'tiles': tiles,
+            'tile_size': (tile_width, tile_height),
+            'input_size': input_size,
+            'scale': min(1.0, input_size / longest),
+            'estimated_ms': self.estimate_ms(images, input_size),
+        }
+
+    def plan(self, radius):
+        """Cheapest grid that keeps the smallest mob detectable within the latency budget"""
+        if radius in self.plans:
+            return self.plans[radius]
+        box = self.zone_box(radius)
+        required_scale = min(1.0, self.min_input_pixels / self.min_mob_pixels)
+        candidates = [self.candidate(box, columns, rows)
+                      for columns in range(1, self.max_grid + 1)
+                      for rows in range(1, self.max_grid + 1)]
+        affordable = [plan for plan in candidates
+                      if self.budget_ms is None or plan['estimated_ms'] <= self.budget_ms] or \
+            [min(candidates, key=lambda plan: plan['estimated_ms'])]
+        sufficient = [plan for plan in affordable if plan['scale'] >= required_scale]
+        if sufficient:
+            best = min(sufficient, key=lambda plan: (plan['estimated_ms'], -plan['scale']))
+        else:
+            best = max(affordable, key=lambda plan: (plan['scale'], -plan['estimated_ms']))
+        best['sufficient'] = bool(sufficient)
+        self.plans[radius] = best
+        return best
+
+    def signature(self, radius):
+        """Hashable description of the tiling (part of the detection cache key)"""
+        plan = self.plan(radius)
+        return plan['grid'], plan['input_size'], self.overview
+
+    # ------------------------------------------------------------ inference
+
+    def overview_image(self, frame, tile_size):
+        """Whole frame downscaled into a reused tile-shaped buffer → (image, scale)"""
+        tile_width, tile_height = tile_size
+        scale = min(tile_width / frame.shape[1], tile_height / frame.shape[0])
+        width, height = int(frame.shape[1] * scale), int(frame.shape[0] * scale)
+        if self.overview_buffer is None or self.overview_buffer.shape != (tile_height, tile_width, frame.shape[2]):
+            self.overview_buffer = np.zeros((tile_height, tile_width, frame.shape[2]), dtype=np.uint8)
+        cv2.resize(frame, (width, height), dst=self.overview_buffer[:height, :width], interpolation=cv2.INTER_AREA)
+        return self.overview_buffer, scale
+
+    def infer(self, frame, radius, run_batch, iou_threshold=0.45):
+        """Detect on the zone tiles (+ overview) in one batch → merged (n, 6) rows in frame pixels
+
+        run_batch(images, imgsz) must return one (n, 6) array per image.
+        """
+        start = time.perf_counter()
+        plan = self.plan(radius)
+        images = [np.ascontiguousarray(frame[y:y + height, x:x + width]) for x, y, width, height in plan['tiles']]
+        offsets = [(x, y, 1.0) for x, y, _, _ in plan['tiles']]
+        if self.overview:
+            image, scale = self.overview_image(frame, plan['tile_size'])
+            images.append(image)
+            offsets.append((0, 0, scale))
+
+        shifted = []
+        for boxes, (x, y, scale) in zip(run_batch(images, plan['input_size']), offsets):
+            if not len(boxes):
+                continue
+            boxes = np.array(boxes[:, :6], dtype=np.float32)
+            boxes[:, :4] /= scale
+            boxes[:, [0, 2]] += x
+            boxes[:, [1, 3]] += y
+            shifted.append(boxes)
+        merged = merge_boxes(np.concatenate(shifted), iou_threshold) if shifted \
+            else np.empty((0, 6), dtype=np.float32)
+
+        self.calls += 1
+        self.images += len(images)
+        self.raw_boxes += sum(len(boxes) for boxes in shifted)
+        self.merged_boxes += len(merged)
+        self.seconds += time.perf_counter() - start
+        return merged
+
+    def describe(self, radius):
+        plan = self.plan(radius)
+        columns, rows = plan['grid']
+        tile_width, tile_height = plan['tile_size']
+        note = "" if plan['sufficient'] else " (over budget - best affordable)"
+        return (f"{columns}x{rows} tiles of {tile_width}x{tile_height} @ {plan['input_size']} "
+                f"(scale {plan['scale']:.2f}, ~{plan['estimated_ms']:.0f}ms){note}")
+
+    def stats_summary(self):
+        """One-line tiling report for the stats output"""
+        average = self.seconds / self.calls * 1000 if self.calls else 0.0
+        images = self.images / self.calls if self.calls else 0.0
+        return (f"🧩 Tiled inference: {self.calls} frames, {images:.1f} images/batch | "
+                f"{self.raw_boxes} boxes → {self.merged_boxes} after NMS | {average:.1f}ms/frame")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plan (and test) tiled inference for the hunting zone presets")
+    parser.add_argument('--frame', nargs=2, type=int, default=[1820, 880], help="Capture width and height")
+    parser.add_argument('--radius', type=int, help="Zone radius (default: every preset)")
+    parser.add_argument('--imgsz', type=int, default=640)
+    parser.add_argument('--budget', type=float, default=200.0, help="Latency budget per frame (ms)")
+    parser.add_argument('--min-mob', type=int, default=12, help="Smallest mob height at native resolution")
+    parser.add_argument('--model', help="Calibrate the cost model with this YOLO model")
+    parser.add_argument('--image', help="Screenshot of the capture area to run tiled detection on (needs --model)")
+    parser.add_argument('--conf', type=float, default=0.25)
+    args = parser.parse_args()
+
+    width, height = args.frame
+    detector = TiledDetector((width, height), (width // 2, height // 2 + 50), args.imgsz,
+                             min_mob_pixels=args.min_mob, budget_ms=args.budget)
+
+    run_batch = None
+    if args.model:
+        from ultralytics import YOLO
+        model = YOLO(args.model)
+
+        def run_batch(images, imgsz):
+            results = model(images, conf=args.conf, imgsz=imgsz, verbose=False)
+            return [result.boxes.data.cpu().numpy() for result in results]
+
+        base_ms, per_image_ms = detector.calibrate(run_batch)
+        print(f"⏱️ Cost model: {base_ms:.1f}ms + {per_image_ms:.1f}ms per {args.imgsz}px image")
+
+    radii = {'custom': args.radius} if args.radius else PRESET_RADII
+    for name, radius in radii.items():
+        print(f"   {name} ({radius}px): {detector.describe(radius)}")
+
+    if args.image:
+        if run_batch is None:
+            print("❌ --image needs --model")
+            return
+        frame = cv2.imread(args.image)
+        if frame is None:
+            print(f"❌ Cannot read {args.image}")
+            return
+        detector.frame_width, detector.frame_height = frame.shape[1], frame.shape[0]
+        detector.zone_center = (frame.shape[1] // 2, frame.shape[0] // 2 + 50)
+        detector.plans = {}
+        radius = args.radius or PRESET_RADII['bow']
+        boxes = detector.infer(frame, radius, run_batch)
+        print(f"🎯 {len(boxes)} mobs | {detector.stats_summary()}")
+
+
+if __name__ == "__main__":
+    main()